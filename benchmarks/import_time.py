@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de tempo de import do modo headless usando ``python -X importtime``.
+Falha (código 1) quando a inicialização cresce além do baseline registrado
+ou quando módulos pesados (Tk, requests, cryptography) passam a ser importados.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "baselines" / "import_time.json"
+
+# Módulos importados por uma execução headless do gerador
+HEADLESS_MODULES = ["main", "config.config_manager", "core.package_generator"]
+
+# Módulos que uma execução headless nunca deve importar
+FORBIDDEN_MODULES = ["tkinter", "customtkinter", "requests", "cryptography"]
+
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MODULE_SLACK = 10
+
+_PROBE = """
+import sys, time, json
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed_us": int(elapsed * 1e6), "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def safe_print(message):
+    """Print seguro que funciona em qualquer terminal"""
+    try:
+        print(message)
+    except UnicodeEncodeError:
+        print(message.encode('ascii', 'ignore').decode('ascii'))
+
+
+def parse_importtime(stderr):
+    """Converte a saída de -X importtime em {módulo: (self_us, cumulative_us)}"""
+    result = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # Cabeçalho
+        result[parts[2].strip()] = (self_us, cumulative_us)
+    return result
+
+
+def run_probe(modules=None):
+    """Executa um processo novo e mede os imports de ``modules``"""
+    modules = modules or HEADLESS_MODULES
+    env = os.environ.copy()
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(modules=modules)],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, env=env, timeout=120
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Falha ao medir imports:\n{completed.stderr[-2000:]}")
+
+    data = json.loads(completed.stdout.strip().splitlines()[-1])
+    breakdown = parse_importtime(completed.stderr)
+    data["breakdown"] = {name: breakdown[name] for name in data["modules"] if name in breakdown}
+    return data
+
+
+def measure(runs=5, modules=None):
+    """Mede ``runs`` vezes e fica com a melhor execução (menos ruído)"""
+    samples = [run_probe(modules) for _ in range(max(1, runs))]
+    best = min(samples, key=lambda sample: sample["elapsed_us"])
+    best["runs"] = [sample["elapsed_us"] for sample in samples]
+    return best
+
+
+def load_baseline(path=BASELINE_FILE):
+    if not Path(path).exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(result, path=BASELINE_FILE):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "elapsed_us": result["elapsed_us"],
+        "module_count": len(result["modules"]),
+        "time_tolerance": DEFAULT_TIME_TOLERANCE,
+        "module_slack": DEFAULT_MODULE_SLACK,
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    return baseline
+
+
+def check(result, baseline):
+    """Retorna a lista de problemas encontrados (vazia se dentro do orçamento)"""
+    problems = []
+
+    leaked = sorted(
+        name for name in result["modules"]
+        if name.split(".")[0] in FORBIDDEN_MODULES
+    )
+    if leaked:
+        roots = sorted({name.split(".")[0] for name in leaked})
+        problems.append(f"Módulos proibidos importados no modo headless: {', '.join(roots)}")
+
+    if baseline:
+        tolerance = baseline.get("time_tolerance", DEFAULT_TIME_TOLERANCE)
+        limit_us = baseline["elapsed_us"] * (1 + tolerance)
+        if result["elapsed_us"] > limit_us:
+            problems.append(
+                f"Tempo de import {result['elapsed_us'] / 1000:.1f} ms excede o limite "
+                f"{limit_us / 1000:.1f} ms (baseline {baseline['elapsed_us'] / 1000:.1f} ms)"
+            )
+
+        module_limit = baseline["module_count"] + baseline.get("module_slack", DEFAULT_MODULE_SLACK)
+        if len(result["modules"]) > module_limit:
+            problems.append(
+                f"{len(result['modules'])} módulos importados, limite {module_limit} "
+                f"(baseline {baseline['module_count']})"
+            )
+
+    return problems
+
+
+def print_report(result, top=10):
+    safe_print(f"Tempo de import (melhor de {len(result['runs'])}): {result['elapsed_us'] / 1000:.1f} ms")
+    safe_print(f"Módulos importados: {len(result['modules'])}")
+    slowest = sorted(result["breakdown"].items(), key=lambda item: item[1][0], reverse=True)[:top]
+    if slowest:
+        safe_print("Módulos mais lentos (self):")
+        for name, (self_us, cumulative_us) in slowest:
+            safe_print(f"  {name:<40} {self_us / 1000:7.2f} ms  (cumulativo {cumulative_us / 1000:7.2f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de import do modo headless")
+    parser.add_argument('--runs', type=int, default=5, help="Número de processos medidos")
+    parser.add_argument('--update-baseline', action='store_true', help="Grava o resultado atual como baseline")
+    parser.add_argument('--json', action='store_true', help="Imprime o resultado em JSON")
+    args = parser.parse_args(argv)
+
+    result = measure(runs=args.runs)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+    if args.update_baseline:
+        save_baseline(result)
+        safe_print(f"✅ Baseline atualizado em {BASELINE_FILE}")
+        return 0
+
+    problems = check(result, load_baseline())
+    if problems:
+        for problem in problems:
+            safe_print(f"❌ {problem}")
+        return 1
+
+    safe_print("✅ Inicialização dentro do orçamento")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suíte de benchmarks dos caminhos críticos do Unity Package Forge.
+Grava os resultados em JSON (um registro por execução) e compara com a
+execução anterior para evidenciar regressões entre versões.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import contextlib
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.version_utils import (
+    get_current_version, sanitize_name_for_repo, get_namespace_from_display_name,
+    get_package_names, derive_package_names, PACKAGE_NAMES_CACHE_SIZE
+)
+from utils.lazy_import import is_module_available
+
+HISTORY_FILE = Path(__file__).resolve().parent / "results" / "history.jsonl"
+WORK_DIR = Path(__file__).resolve().parent / ".work"
+TMPFS_DIR = Path("/dev/shm")
+
+PACKAGE_COUNTS = [1, 10, 100, 1000]
+QUICK_PACKAGE_COUNTS = [1, 10, 100]
+NAME_CORPUS_SIZES = [10000, 100000]
+DEFAULT_REGRESSION_THRESHOLD = 0.15
+
+_WORDS = [
+    "Inventory", "System", "Dialogue", "Ação", "Câmera", "Pathfinding", "AI", "Save", "Load",
+    "UI", "Toolkit", "Áudio", "Mixer", "2D", "3D", "Physics", "Netcode", "Quest", "Editor",
+    "Extensions", "Pro", "Lite", "v2", "Ultimate", "Grid", "Terrain", "Shader", "VFX",
+]
+_PUNCTUATION = ["", "", "", "-", "_", "!", "&", ".", "(", ")", ":", "+"]
+
+
+def safe_print(message):
+    """Print seguro que funciona em qualquer terminal"""
+    try:
+        print(message)
+    except UnicodeEncodeError:
+        print(message.encode('ascii', 'ignore').decode('ascii'))
+
+
+def time_call(func, repeat=5, number=1, setup=None):
+    """Mede ``func`` e retorna estatísticas em milissegundos por chamada"""
+    samples = []
+    for _ in range(max(1, repeat)):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            func(state) if setup else func()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.mean(samples), 4),
+        "repeat": len(samples),
+        "number": number,
+    }
+
+
+def build_name_corpus(size, seed=1234):
+    """Gera nomes de exibição determinísticos com acentos, pontuação e números"""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(size):
+        words = [rng.choice(_WORDS) + rng.choice(_PUNCTUATION) for _ in range(rng.randint(1, 14))]
+        names.append(" ".join(words))
+    return names
+
+
+def _make_config(directory):
+    from config.config_manager import ConfigManager
+    # ConfigManager anuncia a criação do config.ini via print; silencia no benchmark
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ConfigManager(os.path.join(directory, "config.ini"))
+
+
+def _make_generator(directory):
+    from core.package_generator import PackageGenerator
+    generator = PackageGenerator(_make_config(directory))
+    generator.set_log_callback(None)
+    return generator
+
+
+def bench_cold_start(work_dir, repeat):
+    """Processo novo executando ``main.py generate`` (modo headless)"""
+    def run():
+        target = tempfile.mkdtemp(dir=work_dir)
+        try:
+            subprocess.run(
+                [sys.executable, str(PROJECT_ROOT / "main.py"), "generate", "Cold Start Bench",
+                 "-o", target, "--config", os.path.join(target, "config.ini")],
+                cwd=target, check=True, capture_output=True, timeout=120
+            )
+        finally:
+            shutil.rmtree(target, ignore_errors=True)
+
+    return {"cold_start.headless_generate": time_call(run, repeat=repeat)}
+
+
+def bench_config_manager(work_dir, repeat):
+    """Inicialização do ConfigManager, com e sem a derivação PBKDF2"""
+    from utils.crypto_utils import reset_crypto_instance
+
+    results = {"config_manager.init": time_call(lambda: _make_config(work_dir), repeat=repeat)}
+
+    if is_module_available("cryptography"):
+        def init_with_crypto():
+            reset_crypto_instance()
+            _make_config(work_dir).crypto
+
+        results["config_manager.init_with_pbkdf2"] = time_call(init_with_crypto, repeat=repeat)
+    else:
+        safe_print("[!] cryptography não instalado, PBKDF2 ignorado")
+
+    return results
+
+
+def bench_package_json(work_dir, repeat):
+    generator = _make_generator(work_dir)
+    return {
+        "package_json.get": time_call(
+            lambda: generator.get_package_json("Inventory System", "Inventory System", "Descrição",
+                                               "1.2.3", {"com.unity.ui": "1.0.0"}),
+            repeat=repeat, number=1000
+        )
+    }
+
+
+def bench_package_structure(label, base_dir, counts, repeat):
+    """Gera ``count`` pacotes por execução em ``base_dir``"""
+    results = {}
+    for count in counts:
+        names = [f"Bench Package {i}" for i in range(count)]
+
+        def setup():
+            target = tempfile.mkdtemp(dir=str(base_dir))
+            return target, _make_generator(target)
+
+        def run(state):
+            target, generator = state
+            for name in names:
+                generator.create_package_structure(target, name, name, "Pacote de benchmark")
+
+        samples_repeat = repeat if count <= 100 else 1
+        stats = _time_and_cleanup(run, setup, samples_repeat)
+        stats["per_package_ms"] = round(stats["median_ms"] / count, 4)
+        results[f"create_package_structure.{label}.{count}"] = stats
+    return results
+
+
+def _time_and_cleanup(func, setup, repeat):
+    created = []
+
+    def tracked_setup():
+        state = setup()
+        created.append(state[0])
+        return state
+
+    try:
+        return time_call(func, repeat=repeat, setup=tracked_setup)
+    finally:
+        for path in created:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def bench_name_derivation(sizes, repeat):
+    """Derivação de nomes sem cache (limpo a cada repetição), em lote e com acerto no cache"""
+    def clear_cache():
+        get_package_names.cache_clear()
+
+    results = {}
+    for size in sizes:
+        corpus = build_name_corpus(size)
+        results[f"names.sanitize_name_for_repo.{size}"] = time_call(
+            lambda _: [sanitize_name_for_repo(name) for name in corpus], repeat=repeat, setup=clear_cache
+        )
+        results[f"names.get_namespace_from_display_name.{size}"] = time_call(
+            lambda _: [get_namespace_from_display_name(name) for name in corpus], repeat=repeat, setup=clear_cache
+        )
+        results[f"names.derive_package_names.{size}"] = time_call(
+            lambda _: derive_package_names(corpus), repeat=repeat, setup=clear_cache
+        )
+
+        # Só o que cabe no LRU: acima disso o corpus expulsaria as próprias entradas
+        hot = corpus[:PACKAGE_NAMES_CACHE_SIZE]
+
+        def warm_cache(hot=hot):
+            clear_cache()
+            for name in hot:
+                get_package_names(name)
+
+        results[f"names.get_package_names.cached.{len(hot)}"] = time_call(
+            lambda _, hot=hot: [get_package_names(name) for name in hot], repeat=repeat, setup=warm_cache
+        )
+    clear_cache()
+    return results
+
+
+def git_revision():
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(PROJECT_ROOT),
+                                   capture_output=True, text=True, timeout=10)
+        return completed.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_suite(quick=False, repeat=5, only=None):
+    WORK_DIR.mkdir(parents=True, exist_ok=True)
+    work_dir = tempfile.mkdtemp(dir=str(WORK_DIR))
+    counts = QUICK_PACKAGE_COUNTS if quick else PACKAGE_COUNTS
+    sizes = NAME_CORPUS_SIZES[:1] if quick else NAME_CORPUS_SIZES
+
+    groups = [
+        ("cold_start", lambda: bench_cold_start(work_dir, repeat)),
+        ("config", lambda: bench_config_manager(work_dir, repeat)),
+        ("package_json", lambda: bench_package_json(work_dir, repeat)),
+        ("disk", lambda: bench_package_structure("disk", work_dir, counts, repeat)),
+        ("names", lambda: bench_name_derivation(sizes, repeat)),
+    ]
+    if TMPFS_DIR.is_dir() and os.access(str(TMPFS_DIR), os.W_OK):
+        groups.insert(4, ("tmpfs", lambda: bench_package_structure("tmpfs", TMPFS_DIR, counts, repeat)))
+    else:
+        safe_print("[!] tmpfs (/dev/shm) indisponível, benchmarks em memória ignorados")
+
+    results = {}
+    try:
+        for name, group in groups:
+            if only and name not in only:
+                continue
+            safe_print(f"Executando: {name}...")
+            results.update(group())
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "version": get_current_version(),
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def load_history(path=HISTORY_FILE):
+    history = []
+    if Path(path).exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    history.append(json.loads(line))
+    return history
+
+
+def append_history(run, path=HISTORY_FILE):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def find_reference(history, version=None):
+    """Última execução registrada (opcionalmente de uma versão específica)"""
+    for run in reversed(history):
+        if version is None or run.get("version") == version:
+            return run
+    return None
+
+
+def compare(current, reference, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """Compara medianas; retorna linhas de relatório e a lista de regressões"""
+    lines = []
+    regressions = []
+    reference_results = reference.get("results", {}) if reference else {}
+
+    for name in sorted(current["results"]):
+        median = current["results"][name]["median_ms"]
+        previous = reference_results.get(name)
+        if not previous or not previous.get("median_ms"):
+            lines.append(f"  {name:<55} {median:10.3f} ms")
+            continue
+        delta = (median - previous["median_ms"]) / previous["median_ms"]
+        marker = ""
+        if delta > threshold:
+            marker = "  ❌ regressão"
+            regressions.append(name)
+        elif delta < -threshold:
+            marker = "  ✅ melhoria"
+        lines.append(f"  {name:<55} {median:10.3f} ms  ({delta:+.1%}){marker}")
+
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do Unity Package Forge")
+    parser.add_argument('--quick', action='store_true', help="Omite 1000 pacotes e o corpus de 100k nomes")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetições por benchmark")
+    parser.add_argument('--only', nargs='+', help="Executa só os grupos informados")
+    parser.add_argument('--history', default=str(HISTORY_FILE), help="Arquivo de histórico (JSON lines)")
+    parser.add_argument('--compare-to', metavar="VERSION", help="Versão de referência (padrão: última execução)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Variação relativa considerada regressão")
+    parser.add_argument('--no-save', action='store_true', help="Não grava a execução no histórico")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Retorna código 1 em caso de regressão")
+    args = parser.parse_args(argv)
+
+    current = run_suite(quick=args.quick, repeat=args.repeat, only=args.only)
+    reference = find_reference(load_history(args.history), args.compare_to)
+
+    if reference:
+        safe_print(f"\nComparando com {reference.get('version')} ({reference.get('revision')}, {reference.get('timestamp')})")
+    else:
+        safe_print("\nSem execução de referência no histórico")
+
+    lines, regressions = compare(current, reference, args.threshold)
+    for line in lines:
+        safe_print(line)
+
+    if not args.no_save:
+        append_history(current, args.history)
+        safe_print(f"\n✅ Resultados gravados em {args.history}")
+
+    if regressions:
+        safe_print(f"\n❌ {len(regressions)} regressões acima de {args.threshold:.0%}")
+        if args.fail_on_regression:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,9 @@ import sys
 import subprocess
 import platform
 import shutil
+import json
+import hashlib
+import argparse
 from pathlib import Path
 
 # Configuração de encoding para Windows
@@ -57,6 +60,30 @@ def run_command(cmd, cwd=None, timeout=300):
         return False, "", str(e)
 
 
+BUILD_MODES = ('onefile', 'onedir')
+# Pasta do modo onedir; nome diferente do executável onefile para os dois modos coexistirem em dist/
+ONEDIR_NAME = 'unity-package-forge-onedir'
+
+# Partes do cryptography que o app não usa (só Fernet e PBKDF2). hazmat.decrepit fica:
+# ciphers/algorithms.py importa os aliases de lá ao carregar, e o Fernet passa por ele
+ONEDIR_EXCLUDES = [
+    'cryptography.hazmat.primitives.twofactor',
+]
+# Dados do Tcl/Tk desnecessários: fusos horários, traduções, demos e imagens de exemplo
+ONEDIR_EXCLUDED_DATA = (
+    '_tcl_data/tzdata', '_tcl_data/msgs', '_tk_data/msgs', '_tk_data/demos', '_tk_data/images',
+    'tcl/tzdata', 'tcl/msgs', 'tk/msgs', 'tk/demos', 'tk/images',
+)
+
+
+def get_executable_path(mode='onefile'):
+    """Caminho esperado do executável em dist/"""
+    exec_name = 'unity-package-forge.exe' if platform.system() == 'Windows' else 'unity-package-forge'
+    if mode == 'onedir':
+        return Path('dist') / ONEDIR_NAME / exec_name
+    return Path('dist') / exec_name
+
+
 def validate_environment():
     """Valida o ambiente antes de iniciar o build"""
     safe_print("[OK] Validando ambiente de build...")
@@ -112,32 +139,106 @@ def check_dependencies():
     return True
 
 
-def clean_build():
+# Removidas inteiras na limpeza
+CLEAN_DIRS = ['build', 'dist']
+# Nunca percorridas na busca por caches do Python
+PRUNED_DIRS = {'.git', '.hg', '.svn', 'build', 'dist', 'node_modules', '.venv', 'venv', 'env',
+               '.tox', '.nox', '.mypy_cache', '.pytest_cache', '.ruff_cache'}
+
+
+def find_clean_targets(root='.'):
+    """Lista o que a limpeza remove, sem descer em pastas pesadas ou de terceiros"""
+    targets = [os.path.join(root, name) for name in CLEAN_DIRS if os.path.isdir(os.path.join(root, name))]
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == '__pycache__':
+                        targets.append(entry.path)
+                    elif entry.name not in PRUNED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(('.pyc', '.pyo')):
+                    targets.append(entry.path)
+    return targets
+
+
+def path_size(path):
+    """Tamanho em bytes de um arquivo ou pasta (sem seguir links)"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            if not os.path.isdir(current) or os.path.islink(current):
+                total += os.lstat(current).st_size
+                continue
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
+
+def remove_path(path):
+    """Remove arquivo ou pasta; retorna a mensagem de erro ou None"""
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def clean_build(dry_run=False, workers=8):
     """Limpa builds anteriores com melhor tratamento"""
-    safe_print("[OK] Limpando builds anteriores...")
+    from concurrent.futures import ThreadPoolExecutor
 
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    files_cleaned = 0
+    safe_print("[OK] Simulando limpeza..." if dry_run else "[OK] Limpando builds anteriores...")
 
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            try:
-                shutil.rmtree(dir_name)
-                safe_print(f"[OK] Removido: {dir_name}")
-                files_cleaned += 1
-            except Exception as e:
-                safe_print(f"[!] Erro ao remover {dir_name}: {e}")
-
-    # Limpa arquivos .pyc recursivamente
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.pyc'):
-                try:
-                    file_path = os.path.join(root, file)
-                    os.remove(file_path)
-                    files_cleaned += 1
-                except Exception:
-                    pass
+    targets = find_clean_targets('.')
+    if not targets:
+        safe_print("[OK] Nada para limpar")
+        return True
+
+    if dry_run:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sizes = list(pool.map(path_size, targets))
+        for target, size in sorted(zip(targets, sizes), key=lambda item: -item[1]):
+            safe_print(f"  {format_size(size):>10}  {target}")
+        safe_print(f"[OK] {len(targets)} itens, {format_size(sum(sizes))} seriam liberados")
+        return True
+
+    # rmtree passa a maior parte do tempo em chamadas ao SO, que liberam o GIL
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        errors = list(pool.map(remove_path, targets))
+
+    files_cleaned = 0
+    for target, error in zip(targets, errors):
+        if error:
+            safe_print(f"[!] Erro ao remover {target}: {error}")
+        else:
+            files_cleaned += 1
+            if os.path.basename(target) in CLEAN_DIRS:
+                safe_print(f"[OK] Removido: {target}")
 
     safe_print(f"[OK] {files_cleaned} itens limpos")
     return True
@@ -231,15 +332,15 @@ def create_version_info():
     return True
 
 
-def create_optimized_spec_file():
+def create_optimized_spec_file(mode='onefile'):
     """Cria arquivo .spec otimizado e corrigido"""
-    safe_print("⚙️ Criando arquivo .spec otimizado...")
+    safe_print(f"⚙️ Criando arquivo .spec otimizado ({mode})...")
 
     # Verifica quais pastas e arquivos existem
     datas = []
 
     # Verifica pastas do projeto
-    folders_to_check = ['ui', 'utils', 'core', 'config']
+    folders_to_check = ['ui', 'utils', 'core', 'config', 'templates']
     for folder in folders_to_check:
         if os.path.exists(folder):
             datas.append(f"('{folder}', '{folder}')")
@@ -260,6 +361,70 @@ def create_optimized_spec_file():
     version_line = "version='version_info.txt'" if platform.system() == 'Windows' else "version=None"
 
     datas_str = ",\n        ".join(datas) if datas else ""
+    extra_excludes = "".join(f"\n        '{module}'," for module in ONEDIR_EXCLUDES) if mode == 'onedir' else ""
+
+    if mode == 'onedir':
+        output_section = f'''a.datas = [entry for entry in a.datas if not entry[0].replace('\\\\', '/').startswith({ONEDIR_EXCLUDED_DATA!r})]
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+# Onedir: o executável é só o bootloader; nada é extraído para uma pasta temporária a cada execução
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='unity-package-forge',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    {version_line},
+    {icon_line},
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='{ONEDIR_NAME}',
+)'''
+    else:
+        output_section = f'''pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='unity-package-forge',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    {version_line},
+    {icon_line},
+)'''
 
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
@@ -334,7 +499,7 @@ a = Analysis(
         'tests',
         'unittest',
         'doctest',
-        'pydoc',
+        'pydoc',{extra_excludes}
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -342,31 +507,7 @@ a = Analysis(
     noarchive=False,
 )
 
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='unity-package-forge',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=False,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    {version_line},
-    {icon_line},
-)'''
+{output_section}'''
 
     with open('unity_package_forge.spec', 'w', encoding='utf-8') as f:
         f.write(spec_content)
@@ -418,7 +559,7 @@ def test_imports():
         return False
 
 
-def build_executable():
+def build_executable(clean=True, mode='onefile'):
     """Constrói o executável com melhor tratamento"""
     safe_print("[OK] Construindo executavel...")
 
@@ -433,13 +574,11 @@ def build_executable():
         env['PYTHONLEGACYWINDOWSSTDIO'] = '1'
 
     # Comando de build com opções otimizadas
-    cmd = [
-        "pyinstaller",
-        "unity_package_forge.spec",
-        "--clean",
-        "--noconfirm",
-        "--log-level", "WARN"
-    ]
+    cmd = ["pyinstaller", "unity_package_forge.spec"]
+    # --clean descarta o cache do PyInstaller; só vale a pena quando as dependências mudam
+    if clean:
+        cmd.append("--clean")
+    cmd += ["--noconfirm", "--log-level", "WARN"]
 
     cmd_str = " ".join(cmd)
     safe_print(f"Executando: {cmd_str}")
@@ -456,11 +595,10 @@ def build_executable():
 
     # Verifica se executável foi criado
     system = platform.system()
-    exec_name = 'unity-package-forge.exe' if system == 'Windows' else 'unity-package-forge'
-    exec_path = Path('dist') / exec_name
+    exec_path = get_executable_path(mode)
 
     if exec_path.exists():
-        size = exec_path.stat().st_size / (1024 * 1024)
+        size = (path_size(str(exec_path.parent)) if mode == 'onedir' else exec_path.stat().st_size) / (1024 * 1024)
         safe_print(f"[OK] Executavel criado: {exec_path}")
         safe_print(f"[OK] Tamanho: {size:.1f} MB")
 
@@ -482,7 +620,7 @@ def build_executable():
         return False
 
 
-def create_portable_package():
+def create_portable_package(mode='onefile'):
     """Cria pacote portável com todos os arquivos necessários"""
     safe_print("📦 Criando pacote portável...")
 
@@ -495,12 +633,13 @@ def create_portable_package():
     package_dir.mkdir(exist_ok=True)
 
     # Copia executável
-    system = platform.system()
-    exec_name = 'unity-package-forge.exe' if system == 'Windows' else 'unity-package-forge'
-    exec_src = Path('dist') / exec_name
+    exec_src = get_executable_path(mode)
 
-    if exec_src.exists():
-        shutil.copy2(exec_src, package_dir / exec_name)
+    if mode == 'onedir' and exec_src.exists():
+        shutil.copytree(exec_src.parent, package_dir / ONEDIR_NAME, symlinks=True, dirs_exist_ok=True)
+        safe_print(f"✅ Pasta {ONEDIR_NAME} copiada")
+    elif exec_src.exists():
+        shutil.copy2(exec_src, package_dir / exec_src.name)
         safe_print(f"✅ Executável copiado")
 
     # Copia arquivos essenciais
@@ -520,13 +659,85 @@ def create_portable_package():
     return True
 
 
-def post_build_validation():
+# Orçamentos do executável; estourar qualquer um deles falha o build
+DEFAULT_BUDGETS = {'cold_start': 15.0, 'warm_start': 5.0, 'size_mb': 80.0}
+STARTUP_RUNS = 5
+ANALYSIS_TOC = os.path.join('build', 'unity_package_forge', 'Analysis-00.toc')
+TOC_TYPECODES = {'PYMODULE', 'PYSOURCE', 'EXTENSION', 'BINARY', 'DATA', 'ZIPFILE', 'SYMLINK'}
+
+
+def measure_startup(exec_path, runs=STARTUP_RUNS, timeout=120):
+    """Mede a inicialização sem interface (--version): a 1a execução é a fria, a mediana das demais a quente"""
+    import time
+    import statistics
+
+    kwargs = {'capture_output': True, 'timeout': timeout}
+    if platform.system() == 'Windows':
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+    times = []
+    for _ in range(runs + 1):
+        start = time.perf_counter()
+        result = subprocess.run([str(Path(exec_path).resolve()), '--version'], **kwargs)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"executavel retornou {result.returncode}: {stderr}")
+    return times[0], statistics.median(times[1:])
+
+
+def run_selftest(exec_path, timeout=120):
+    """Roda o comando selftest do executável (criptografia da configuração e imports sob demanda)"""
+    kwargs = {'capture_output': True, 'timeout': timeout}
+    if platform.system() == 'Windows':
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+    result = subprocess.run([str(Path(exec_path).resolve()), 'selftest'], **kwargs)
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).decode('utf-8', 'replace').strip()
+        raise RuntimeError(f"selftest retornou {result.returncode}: {output}")
+
+
+def _toc_entries(value):
+    # Os .toc do PyInstaller são literais Python com listas de (nome, caminho, tipo)
+    if isinstance(value, (list, tuple)):
+        if (len(value) == 3 and all(isinstance(item, str) for item in value)
+                and value[2] in TOC_TYPECODES):
+            yield value
+        else:
+            for item in value:
+                yield from _toc_entries(item)
+
+
+def toc_size_breakdown(toc_path=ANALYSIS_TOC):
+    """Soma o tamanho dos arquivos do TOC do PyInstaller por módulo de topo"""
+    import ast
+
+    with open(toc_path, 'r', encoding='utf-8') as f:
+        toc = ast.literal_eval(f.read())
+
+    sizes = {}
+    seen = set()
+    for name, path, typecode in _toc_entries(toc):
+        if (name, typecode) in seen or not path or not os.path.isfile(path):
+            continue
+        seen.add((name, typecode))
+        if typecode in ('PYMODULE', 'PYSOURCE', 'EXTENSION'):
+            group = name.split('.')[0]
+        else:
+            parts = name.replace('\\', '/').split('/')
+            group = parts[0] if len(parts) > 1 else '(binarios)'
+        sizes[group] = sizes.get(group, 0) + os.path.getsize(path)
+    return sorted(sizes.items(), key=lambda item: -item[1])
+
+
+def post_build_validation(budgets=None, mode='onefile'):
     """Valida o build após conclusão"""
     safe_print("🔍 Validando build...")
 
+    budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
     system = platform.system()
-    exec_name = 'unity-package-forge.exe' if system == 'Windows' else 'unity-package-forge'
-    exec_path = Path('dist') / exec_name
+    exec_path = get_executable_path(mode)
 
     if not exec_path.exists():
         safe_print("❌ Executável não encontrado")
@@ -538,15 +749,244 @@ def post_build_validation():
             safe_print("❌ Executável sem permissões de execução")
             return False
 
+    problems = []
+
+    # No modo onedir o orçamento vale para a pasta inteira
+    size = path_size(str(exec_path.parent)) if mode == 'onedir' else exec_path.stat().st_size
+    size_mb = size / (1024 * 1024)
+    safe_print(f"[OK] Tamanho: {size_mb:.1f} MB (limite {budgets['size_mb']:.1f} MB)")
+    if size_mb > budgets['size_mb']:
+        problems.append(f"tamanho {size_mb:.1f} MB acima do limite de {budgets['size_mb']:.1f} MB")
+
+    if os.path.exists(ANALYSIS_TOC):
+        try:
+            breakdown = toc_size_breakdown(ANALYSIS_TOC)
+            safe_print("[OK] Maiores modulos (tamanho antes da compressao):")
+            for group, size in breakdown[:15]:
+                safe_print(f"  {format_size(size):>10}  {group}")
+        except Exception as e:
+            safe_print(f"[!] Nao foi possivel ler {ANALYSIS_TOC}: {e}")
+    else:
+        safe_print(f"[!] {ANALYSIS_TOC} nao encontrado, sem detalhamento por modulo")
+
+    try:
+        cold, warm = measure_startup(exec_path)
+        safe_print(f"[OK] Inicializacao fria: {cold:.2f}s (limite {budgets['cold_start']:.2f}s)")
+        safe_print(f"[OK] Inicializacao quente: {warm:.2f}s (limite {budgets['warm_start']:.2f}s, "
+                   f"mediana de {STARTUP_RUNS})")
+        if cold > budgets['cold_start']:
+            problems.append(f"inicializacao fria {cold:.2f}s acima de {budgets['cold_start']:.2f}s")
+        if warm > budgets['warm_start']:
+            problems.append(f"inicializacao quente {warm:.2f}s acima de {budgets['warm_start']:.2f}s")
+    except Exception as e:
+        problems.append(f"executavel nao inicializou: {e}")
+
+    # Pega excludes agressivos demais (principalmente no onedir) antes de chegar ao usuário
+    try:
+        run_selftest(exec_path)
+        safe_print("[OK] Selftest do executavel (criptografia e imports sob demanda)")
+    except Exception as e:
+        problems.append(f"selftest falhou: {e}")
+
+    if problems:
+        for problem in problems:
+            safe_print(f"❌ {problem}")
+        return False
+
     safe_print("✅ Build validado com sucesso")
     return True
 
 
-def main():
+BUILD_CACHE_FILE = '.build_cache.json'
+BUILD_CACHE_VERSION = 1
+
+# Arquivos e pastas que entram no executável
+SOURCE_PATHS = ['main.py', 'ui', 'utils', 'core', 'config', 'templates']
+TOOLCHAIN_PACKAGES = ['pyinstaller', 'customtkinter', 'requests', 'cryptography']
+
+
+def hash_paths(paths):
+    """Hash do conteúdo de arquivos e pastas (ignora caches do Python)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        if os.path.isdir(path):
+            files = []
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d != '__pycache__' and not d.startswith('.'))
+                files.extend(os.path.join(root, name) for name in names if not name.endswith(('.pyc', '.pyo')))
+        else:
+            files = [path]
+        for file_path in sorted(files):
+            digest.update(file_path.replace(os.sep, '/').encode('utf-8'))
+            try:
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+            except OSError:
+                digest.update(b'<ausente>')
+    return digest.hexdigest()
+
+
+def get_package_version(package):
+    """Versão instalada de um pacote sem importá-lo"""
+    try:
+        from importlib import metadata
+        return metadata.version(package)
+    except ImportError:
+        success, stdout, stderr = run_command(f"python -m pip show {package}")
+        for line in stdout.splitlines() if success else []:
+            if line.startswith('Version:'):
+                return line.split(':', 1)[1].strip()
+    except Exception:
+        pass
+    return 'ausente'
+
+
+def toolchain_fingerprint():
+    """Identifica o conjunto de dependências: Python, pacotes instalados e requirements.txt"""
+    parts = [platform.python_version(), platform.system(), platform.machine(), hash_paths(['requirements.txt'])]
+    parts += [f"{package}={get_package_version(package)}" for package in TOOLCHAIN_PACKAGES]
+    return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+
+
+class BuildStep:
+    """Etapa do build: só executa quando suas entradas ou dependências mudaram"""
+
+    def __init__(self, name, function, depends=(), inputs=None, outputs=None, critical=False, always=False):
+        self.name = name
+        self.function = function
+        self.depends = list(depends)
+        self.inputs = inputs or (lambda: [])
+        self.outputs = outputs or (lambda: [])
+        self.critical = critical
+        self.always = always
+
+    def fingerprint(self, dependency_fingerprints):
+        digest = hashlib.sha256(self.name.encode('utf-8'))
+        for value in list(self.inputs()) + dependency_fingerprints:
+            digest.update(b'\0' + str(value).encode('utf-8'))
+        return digest.hexdigest()
+
+    def outputs_exist(self):
+        return all(os.path.exists(path) for path in self.outputs())
+
+
+def order_steps(steps):
+    """Ordem topológica (Kahn) preservando a ordem declarada entre etapas independentes"""
+    by_name = {step.name: step for step in steps}
+    pending = {step.name: len(step.depends) for step in steps}
+    for step in steps:
+        for dependency in step.depends:
+            if dependency not in by_name:
+                raise ValueError(f"Etapa '{step.name}' depende de etapa desconhecida '{dependency}'")
+
+    ordered = []
+    done = set()
+    while len(ordered) < len(steps):
+        ready = [step for step in steps if step.name not in done and pending[step.name] == 0]
+        if not ready:
+            raise ValueError("Dependencias circulares entre etapas do build")
+        step = ready[0]
+        ordered.append(step)
+        done.add(step.name)
+        for other in steps:
+            if step.name in other.depends:
+                pending[other.name] -= 1
+    return ordered
+
+
+def load_build_cache():
+    try:
+        with open(BUILD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == BUILD_CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {'version': BUILD_CACHE_VERSION, 'steps': {}, 'toolchain': None}
+
+
+def save_build_cache(cache):
+    temp_path = BUILD_CACHE_FILE + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temp_path, BUILD_CACHE_FILE)
+
+
+def create_build_steps(toolchain, clean_dependencies, budgets=None, mode='onefile'):
+    """Grafo de etapas do build com as entradas de cada uma"""
+    sources = lambda: [hash_paths(SOURCE_PATHS)]
+    spec_context = lambda: [
+        hash_paths([__file__]),
+        platform.system(),
+        mode,
+        [path for path in SOURCE_PATHS + ['config.ini.example', 'version.txt', os.path.join('ui', 'icon.ico')]
+         if os.path.exists(path)],
+    ]
+
+    return [
+        BuildStep("Validacao do ambiente", validate_environment,
+                  inputs=lambda: sources() + [hash_paths(['validate_build.py'])]),
+        BuildStep("Verificacao de dependencias", check_dependencies,
+                  inputs=lambda: [toolchain], critical=True),
+        # Limpeza só quando o conjunto de dependências muda (ou com --clean)
+        BuildStep("Limpeza de builds anteriores", clean_build,
+                  depends=["Verificacao de dependencias"], inputs=lambda: [toolchain], always=clean_dependencies),
+        BuildStep("Garantia de consistencia de versoes", ensure_version_consistency,
+                  inputs=lambda: [hash_paths(['version.txt', 'package.json'])], outputs=lambda: ['version.txt']),
+        BuildStep("Criacao de informacoes de versao", create_version_info,
+                  depends=["Garantia de consistencia de versoes"],
+                  inputs=lambda: [platform.system(), hash_paths(['version.txt'])],
+                  outputs=lambda: ['version_info.txt'] if platform.system() == 'Windows' else []),
+        BuildStep("Criacao de arquivo .spec otimizado", lambda: create_optimized_spec_file(mode),
+                  inputs=spec_context, outputs=lambda: ['unity_package_forge.spec']),
+        BuildStep("Teste de imports", test_imports,
+                  depends=["Verificacao de dependencias"], inputs=sources),
+        BuildStep("Build do executavel", lambda: build_executable(clean=clean_dependencies, mode=mode),
+                  depends=["Limpeza de builds anteriores", "Criacao de informacoes de versao",
+                           "Criacao de arquivo .spec otimizado", "Teste de imports"],
+                  inputs=lambda: sources() + [toolchain, hash_paths(['unity_package_forge.spec', 'version_info.txt'])],
+                  outputs=lambda: [str(get_executable_path(mode))], critical=True, always=clean_dependencies),
+        BuildStep("Validacao pos-build", lambda: post_build_validation(budgets, mode),
+                  depends=["Build do executavel"],
+                  inputs=lambda: [hash_paths([str(get_executable_path(mode))]), sorted((budgets or {}).items())],
+                  critical=True),
+        BuildStep("Criacao de pacote portavel", lambda: create_portable_package(mode),
+                  depends=["Build do executavel"],
+                  inputs=lambda: [hash_paths(['README.md', 'LICENSE.md', 'CHANGELOG.md', 'config.ini.example'])],
+                  outputs=lambda: [str(Path('dist') / 'unity-package-forge-portable' /
+                                       (ONEDIR_NAME if mode == 'onedir' else get_executable_path().name))]),
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build do Unity Package Forge")
+    parser.add_argument("--force", action="store_true", help="Executa todas as etapas, ignorando o cache")
+    parser.add_argument("--clean", action="store_true",
+                        help="Força a limpeza e o build do PyInstaller com --clean")
+    parser.add_argument("--mode", choices=BUILD_MODES, default='onefile',
+                        help="onefile: um unico executavel; onedir: pasta com bootloader, sem extracao a cada execucao")
+    parser.add_argument("--clean-dry-run", action="store_true",
+                        help="Apenas mostra o que a limpeza removeria e quanto espaço seria liberado")
+    parser.add_argument("--max-cold-start", type=float, default=DEFAULT_BUDGETS['cold_start'], metavar="SEG",
+                        help="Limite da primeira inicializacao do executavel")
+    parser.add_argument("--max-warm-start", type=float, default=DEFAULT_BUDGETS['warm_start'], metavar="SEG",
+                        help="Limite da inicializacao quente (mediana)")
+    parser.add_argument("--max-size", type=float, default=DEFAULT_BUDGETS['size_mb'], metavar="MB",
+                        help="Limite de tamanho do executavel")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Função principal do build"""
+    args = parse_args(argv)
+
     safe_print("Unity Package Forge - Build Script Melhorado")
     safe_print("=" * 60)
 
+    if args.clean_dry_run:
+        return 0 if clean_build(dry_run=True) else 1
+
     # Configura codificação no Windows
     if platform.system() == 'Windows':
         try:
@@ -554,41 +994,62 @@ def main():
         except:
             pass
 
-    # Sequência de build
-    build_steps = [
-        ("Validacao do ambiente", validate_environment),
-        ("Verificacao de dependencias", check_dependencies),
-        ("Limpeza de builds anteriores", clean_build),
-        ("Garantia de consistencia de versoes", ensure_version_consistency),
-        ("Criacao de informacoes de versao", create_version_info),
-        ("Criacao de arquivo .spec otimizado", create_optimized_spec_file),
-        ("Teste de imports", test_imports),
-        ("Build do executavel", build_executable),
-        ("Validacao pos-build", post_build_validation),
-        ("Criacao de pacote portavel", create_portable_package)
-    ]
+    cache = load_build_cache()
+    if args.force:
+        cache['steps'] = {}
+    toolchain = toolchain_fingerprint()
+    # O cache do PyInstaller só é descartado quando Python/dependências mudaram
+    clean_dependencies = args.clean or cache.get('toolchain') != toolchain
+    if clean_dependencies and cache.get('toolchain'):
+        safe_print("[!] Dependencias mudaram desde o ultimo build, usando build limpo")
+
+    budgets = {'cold_start': args.max_cold_start, 'warm_start': args.max_warm_start, 'size_mb': args.max_size}
+    build_steps = order_steps(create_build_steps(toolchain, clean_dependencies, budgets, args.mode))
 
     failed_steps = []
+    skipped_steps = []
+    fingerprints = {}
 
-    for step_name, step_function in build_steps:
+    for step in build_steps:
+        step_name = step.name
         safe_print(f"\n{'='*20} {step_name} {'='*20}")
+        fingerprint = step.fingerprint([fingerprints.get(name, '') for name in step.depends])
+        if not step.always and cache['steps'].get(step_name) == fingerprint and step.outputs_exist():
+            fingerprints[step_name] = fingerprint
+            skipped_steps.append(step_name)
+            safe_print(f"[OK] Sem alteracoes, etapa pulada: {step_name}")
+            continue
+
         try:
-            if not step_function():
+            if not step.function():
                 failed_steps.append(step_name)
+                cache['steps'].pop(step_name, None)
                 safe_print(f"[X] Falha em: {step_name}")
 
                 # Para em caso de erro crítico
-                if step_name in ["Verificacao de dependencias", "Build do executavel"]:
+                if step.critical:
+                    save_build_cache(cache)
                     safe_print(f"\n[X] Build interrompido devido a erro critico em: {step_name}")
                     return 1
             else:
+                # Recalcula após executar: etapas como a de versão alteram as próprias entradas
+                fingerprints[step_name] = step.fingerprint([fingerprints.get(name, '') for name in step.depends])
+                cache['steps'][step_name] = fingerprints[step_name]
+                if step_name == "Build do executavel":
+                    cache['toolchain'] = toolchain
+                save_build_cache(cache)
                 safe_print(f"[OK] Concluido: {step_name}")
         except Exception as e:
             safe_print(f"[X] Erro em {step_name}: {e}")
             failed_steps.append(step_name)
+            cache['steps'].pop(step_name, None)
+
+    save_build_cache(cache)
 
     # Resultado final
     safe_print(f"\n{'='*60}")
+    if skipped_steps:
+        safe_print(f"[OK] {len(skipped_steps)} etapas sem alteracoes foram puladas")
     if failed_steps:
         safe_print(f"[!] Build concluido com {len(failed_steps)} problemas:")
         for step in failed_steps:
@@ -4,21 +4,35 @@ import shutil
 from pathlib import Path
 from utils.crypto_utils import get_crypto_instance
 from utils.resource_utils import ensure_config_file_exists, get_config_directory
+from utils import startup_timer
+from utils import metrics
+
+_crypto_decrypts = metrics.counter("upf_crypto_decrypt_total", "Valores sensíveis descriptografados")
 
 class ConfigManager:
     def __init__(self, config_file='config.ini'):
         self.config_file_name = config_file
         self.config_file = self.ensure_config_file(config_file)
         self.config = configparser.ConfigParser()
-        self.crypto = get_crypto_instance()
+        self._crypto = None
         self.sensitive_keys = {'token'}
         self.auto_save_enabled = True
-        self.load_config()
+        with startup_timer.measure("config load"):
+            self.load_config()
+
+    @property
+    def crypto(self):
+        """Instância de criptografia, criada apenas quando um valor sensível é acessado"""
+        if self._crypto is None:
+            with startup_timer.measure("crypto init"):
+                self._crypto = get_crypto_instance()
+        return self._crypto
 
     def ensure_config_file(self, config_file):
         config_path = Path(config_file)
-        example_path = Path("config.ini.example")
-        safe_path = Path("config.ini.safe")
+        # Modelos ao lado do executável/projeto, não no diretório atual
+        example_path = Path(get_config_directory()) / "config.ini.example"
+        safe_path = Path(get_config_directory()) / "config.ini.safe"
 
         if not config_path.exists():
             if safe_path.exists():
@@ -58,6 +72,7 @@ class ConfigManager:
             value = self.config[section][key]
             # Decrypt sensitive values
             if key in self.sensitive_keys and value:
+                _crypto_decrypts.inc()
                 value = self.crypto.decrypt(value)
             return value
         except (KeyError, ValueError): 
@@ -164,6 +179,7 @@ class ConfigManager:
         try:
             value = self.config[section][key]
             if key in self.sensitive_keys and value:
+                _crypto_decrypts.inc()
                 return self.crypto.decrypt(value)
             return value
         except (KeyError, ValueError):
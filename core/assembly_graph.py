@@ -0,0 +1,280 @@
+import os
+import json
+
+# Pastas ignoradas pela Unity (ocultas ou terminadas em "~", como Samples~)
+_IGNORED_DIR_SUFFIX = "~"
+GUID_PREFIX = "GUID:"
+
+
+class AssemblyInfo:
+    """Dados de um .asmdef relevantes para o grafo de compilação"""
+
+    __slots__ = ("name", "path", "guid", "references", "auto_referenced", "editor_only", "test_only")
+
+    def __init__(self, name, path, references, auto_referenced, editor_only, test_only, guid=None):
+        self.name = name
+        self.path = path
+        self.guid = guid
+        self.references = references
+        self.auto_referenced = auto_referenced
+        self.editor_only = editor_only
+        self.test_only = test_only
+
+
+def _read_meta_guid(asmdef_path):
+    try:
+        with open(asmdef_path + ".meta", 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith("guid:"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+def scan_asmdefs(root):
+    """Percorre ``root`` com os.scandir e lê todos os .asmdef (exceto pastas ocultas e ``~``)"""
+    assemblies = []
+    errors = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            errors.append((directory, str(e)))
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith(".") and not name.endswith(_IGNORED_DIR_SUFFIX):
+                        stack.append(entry.path)
+                elif name.endswith(".asmdef"):
+                    try:
+                        assemblies.append(_load_asmdef(entry.path))
+                    except (OSError, ValueError) as e:
+                        errors.append((entry.path, str(e)))
+    return assemblies, errors
+
+
+def _load_asmdef(path):
+    # Unity grava asmdefs com BOM em algumas versões
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        data = json.load(f)
+
+    name = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+    return AssemblyInfo(
+        name=name,
+        path=path,
+        references=data.get("references") or [],
+        auto_referenced=data.get("autoReferenced", True),
+        editor_only=data.get("includePlatforms") == ["Editor"],
+        test_only="UNITY_INCLUDE_TESTS" in (data.get("defineConstraints") or []),
+    )
+
+
+class AssemblyGraph:
+    """Grafo de referências entre assemblies: A -> B quando A referencia B"""
+
+    def __init__(self, assemblies):
+        self.assemblies = {}
+        self.duplicates = []
+        for assembly in assemblies:
+            if assembly.name in self.assemblies:
+                self.duplicates.append(assembly.path)
+            else:
+                self.assemblies[assembly.name] = assembly
+
+        # .meta só é lido quando algum asmdef usa referências por GUID
+        by_guid = {}
+        if any(ref.startswith(GUID_PREFIX) for a in self.assemblies.values() for ref in a.references):
+            for assembly in self.assemblies.values():
+                assembly.guid = assembly.guid or _read_meta_guid(assembly.path)
+                if assembly.guid:
+                    by_guid[assembly.guid] = assembly.name
+        self.references = {}
+        self.external = {}
+        for name, assembly in self.assemblies.items():
+            resolved = []
+            for reference in assembly.references:
+                if reference.startswith(GUID_PREFIX):
+                    reference = by_guid.get(reference[len(GUID_PREFIX):], reference)
+                if reference in self.assemblies:
+                    if reference != name and reference not in resolved:
+                        resolved.append(reference)
+                else:
+                    # Assemblies da Unity ou de pacotes fora do diretório analisado
+                    self.external.setdefault(reference, set()).add(name)
+            self.references[name] = resolved
+
+        self.dependents = {name: [] for name in self.assemblies}
+        for name, references in self.references.items():
+            for reference in references:
+                self.dependents[reference].append(name)
+
+    def fan_in(self, name):
+        return len(self.dependents[name])
+
+    def strongly_connected_components(self):
+        """Tarjan iterativo; componentes com mais de um nó indicam referências circulares"""
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for start in self.assemblies:
+            if start in index:
+                continue
+            work = [(start, iter(self.references[start]))]
+            index[start] = lowlink[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.references[child])))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        # Tarjan emite componentes em ordem topológica reversa (dependências primeiro)
+        return components
+
+    def blast_radius(self):
+        """Quantos assemblies recompilam quando cada assembly muda (dependentes transitivos).
+
+        Usa inteiros como bitsets sobre a condensação em componentes, o que
+        mantém o custo próximo de O(V + E) mesmo com milhares de asmdefs.
+        """
+        components = self.strongly_connected_components()
+        component_of = {}
+        for position, component in enumerate(components):
+            for name in component:
+                component_of[name] = position
+
+        bit = {name: 1 << position for position, name in enumerate(self.assemblies)}
+        reach = [0] * len(components)
+        # Dependentes aparecem depois das dependências; percorre do fim para o começo
+        for position in range(len(components) - 1, -1, -1):
+            component = components[position]
+            mask = 0
+            for name in component:
+                mask |= bit[name]
+                for dependent in self.dependents[name]:
+                    other = component_of[dependent]
+                    if other != position:
+                        mask |= reach[other]
+            reach[position] = mask
+
+        result = {}
+        for name in self.assemblies:
+            # O próprio assembly não conta
+            result[name] = bin(reach[component_of[name]]).count("1") - 1
+        return result
+
+    def analyze(self):
+        """Monta o relatório: métricas por assembly, ciclos e avisos"""
+        radius = self.blast_radius()
+        cycles = [sorted(c) for c in self.strongly_connected_components() if len(c) > 1]
+
+        rows = []
+        for name, assembly in self.assemblies.items():
+            rows.append({
+                "name": name,
+                "path": assembly.path,
+                "references": len(self.references[name]),
+                "fan_in": self.fan_in(name),
+                "blast_radius": radius[name],
+                "auto_referenced": assembly.auto_referenced,
+                "editor_only": assembly.editor_only,
+                "test_only": assembly.test_only,
+            })
+        rows.sort(key=lambda row: (-row["blast_radius"], -row["fan_in"], row["name"]))
+
+        warnings = []
+        for row in rows:
+            if not row["auto_referenced"]:
+                continue
+            if row["test_only"]:
+                reason = "assembly de testes com autoReferenced: true"
+            elif row["editor_only"]:
+                reason = "assembly de Editor com autoReferenced: true"
+            else:
+                reason = "autoReferenced: true (Assembly-CSharp recompila a cada mudança)"
+            warnings.append({"name": row["name"], "path": row["path"], "reason": reason})
+
+        return {
+            "assemblies": rows,
+            "edges": sum(len(references) for references in self.references.values()),
+            "cycles": cycles,
+            "auto_referenced": warnings,
+            "external_references": sorted(self.external),
+            "duplicates": self.duplicates,
+        }
+
+
+def analyze_packages(root):
+    """Escaneia ``root`` (ex: Packages/) e retorna o relatório do grafo de assemblies"""
+    assemblies, errors = scan_asmdefs(root)
+    report = AssemblyGraph(assemblies).analyze()
+    report["errors"] = [{"path": path, "error": error} for path, error in errors]
+    return report
+
+
+def format_report(report, top=20):
+    lines = [
+        f"Assemblies: {len(report['assemblies'])}  Referências: {report['edges']}  "
+        f"Externas: {len(report['external_references'])}",
+        "",
+        f"{'Assembly':<48} {'Refs':>5} {'Fan-in':>7} {'Raio':>6} {'Auto':>5}",
+    ]
+    for row in report["assemblies"][:top]:
+        lines.append(
+            f"{row['name'][:48]:<48} {row['references']:>5} {row['fan_in']:>7} "
+            f"{row['blast_radius']:>6} {'sim' if row['auto_referenced'] else 'não':>5}"
+        )
+    if len(report["assemblies"]) > top:
+        lines.append(f"... mais {len(report['assemblies']) - top} assemblies")
+
+    if report["cycles"]:
+        lines.append("")
+        lines.append("❌ Referências circulares:")
+        for cycle in report["cycles"]:
+            lines.append(f"  {' -> '.join(cycle)}")
+
+    if report["auto_referenced"]:
+        lines.append("")
+        lines.append(f"⚠️ {len(report['auto_referenced'])} assemblies com autoReferenced: true:")
+        for warning in report["auto_referenced"][:top]:
+            lines.append(f"  {warning['name']}: {warning['reason']}")
+
+    for duplicate in report["duplicates"]:
+        lines.append(f"⚠️ Nome de assembly duplicado: {duplicate}")
+    for error in report["errors"]:
+        lines.append(f"❌ {error['path']}: {error['error']}")
+    return "\n".join(lines)
@@ -1,16 +1,60 @@
 import os
+import json
 import subprocess
 import threading
-import requests
-import webbrowser
 import sys
-from utils.version_utils import sanitize_name_for_repo
+import time
+from utils.lazy_import import lazy_import
+from utils.version_utils import get_package_names
+from utils.tracing import span
+from utils import metrics
+from core.job_journal import (
+    JobSteps, STEP_REPO_CREATE, STEP_REPO_REQUESTED, STEP_GIT_INIT, STEP_GIT_COMMIT, STEP_GIT_PUSH,
+    STEP_RELEASE, STEP_BRANCH_PROTECTION
+)
+
+# Importados apenas no primeiro uso do GitHub
+requests = lazy_import("requests")
+webbrowser = lazy_import("webbrowser")
+
+_github_requests = metrics.counter(
+    "upf_github_requests_total", "Chamadas à API do GitHub por endpoint e status", ("endpoint", "status")
+)
+_github_request_seconds = metrics.histogram(
+    "upf_github_request_seconds", "Latência das chamadas à API do GitHub", ("endpoint",)
+)
+_github_retries = metrics.counter(
+    "upf_github_retries_total", "Novas tentativas de chamadas à API do GitHub", ("endpoint",)
+)
+
+REPO_INVENTORY_FILE = "github_repos.json"
+REPO_INVENTORY_VERSION = 1
+
 
 class GitHubManager:
+    # Métodos idempotentes podem ser repetidos após falhas transitórias
+    RETRYABLE_METHODS = {"GET", "PUT"}
+    RETRYABLE_STATUS = {502, 503, 504}
+    MAX_RETRIES = 2
+    RETRY_BACKOFF = 0.5
+    # Segundos em que o inventário de repositórios é usado sem revalidar no GitHub
+    INVENTORY_MAX_AGE = 300
+    INVENTORY_PAGE_SIZE = 100
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.token = self.config.get_value(section='github', key='token', default='')
         self.username = self.config.get_value(section='github', key='username', default='')
+        config_file = getattr(config_manager, 'config_file', None)
+        self.inventory_path = os.path.join(
+            os.path.dirname(os.path.abspath(config_file)) if config_file else os.getcwd(), REPO_INVENTORY_FILE
+        )
+        self._inventory = None
+        # Nome em minúsculas -> repositório, reconstruído a cada mudança do inventário
+        self._repos = {}
+        # Nome em minúsculas -> nome de exibição do pacote, para repositórios criados por esta ferramenta
+        self._owners = {}
+        self._inventory_lock = threading.Lock()
     
     def _get_subprocess_kwargs(self):
         kwargs = {}
@@ -18,6 +62,33 @@ class GitHubManager:
             kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
         return kwargs
 
+    def _request(self, method, endpoint, url, **kwargs):
+        """Executa uma chamada HTTP registrando métricas de status, latência e novas tentativas"""
+        retries = self.MAX_RETRIES if method in self.RETRYABLE_METHODS else 0
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = requests.request(method, url, **kwargs)
+            except requests.exceptions.ConnectionError:
+                _github_request_seconds.observe(time.perf_counter() - start, endpoint=endpoint)
+                _github_requests.inc(endpoint=endpoint, status="connection_error")
+                if attempt >= retries:
+                    raise
+            except Exception as e:
+                _github_request_seconds.observe(time.perf_counter() - start, endpoint=endpoint)
+                _github_requests.inc(endpoint=endpoint, status=type(e).__name__)
+                raise
+            else:
+                _github_request_seconds.observe(time.perf_counter() - start, endpoint=endpoint)
+                _github_requests.inc(endpoint=endpoint, status=response.status_code)
+                if response.status_code not in self.RETRYABLE_STATUS or attempt >= retries:
+                    return response
+
+            attempt += 1
+            _github_retries.inc(endpoint=endpoint)
+            time.sleep(self.RETRY_BACKOFF * attempt)
+
     def is_configured(self):
         return bool(self.token and self.username)
 
@@ -25,23 +96,19 @@ class GitHubManager:
         if not self.is_configured():
             return False, "Credenciais não configuradas"
 
-        print(f"Debug - Token length: {len(self.token)}")
-        print(f"Debug - Username: {self.username}")
-        print(f"Debug - Token starts with: {self.token[:10]}..." if len(self.token) > 10 else f"Debug - Full token: {self.token}")
-
         try:
-            response = requests.get(
-                "https://api.github.com/user",
-                headers={
-                    "Authorization": f"token {self.token}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "UnityPackageForge/1.0"
-                },
-                timeout=10
-            )
-
-            print(f"Debug - Response status: {response.status_code}")
-            print(f"Debug - Response headers: {dict(response.headers)}")
+            with span("github.check_credentials", username=self.username) as current:
+                response = self._request(
+                    "GET", "user",
+                    "https://api.github.com/user",
+                    headers={
+                        "Authorization": f"token {self.token}",
+                        "Accept": "application/vnd.github.v3+json",
+                        "User-Agent": "UnityPackageForge/1.0"
+                    },
+                    timeout=10
+                )
+                current.set_attribute("status_code", response.status_code)
 
             if response.status_code == 401:
                 return False, "Token inválido ou expirado. Verifique se:\n• O token não expirou\n• Tem permissões 'repo' e 'user'\n• Foi copiado corretamente"
@@ -64,37 +131,223 @@ class GitHubManager:
         except Exception as e:
             return False, f"Erro: {str(e)}"
 
-    def create_repository(self, display_name, description, private=False, auto_init=False):
+    def _api_headers(self):
+        return {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+
+    def _load_inventory_file(self):
+        try:
+            with open(self.inventory_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != REPO_INVENTORY_VERSION or data.get("username", "").lower() != self.username.lower():
+            return None
+        return data
+
+    def _save_inventory_file(self, inventory):
+        temp_path = self.inventory_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(inventory, f, ensure_ascii=False)
+            os.replace(temp_path, self.inventory_path)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar o inventário de repositórios: {str(e)}")
+
+    def get_repository_inventory(self, refresh=False):
+        """Repositórios da conta (nome em minúsculas -> dados), com cache em disco.
+
+        A listagem é paginada e cada página guarda o ETag; ao revalidar, as
+        páginas sem mudança voltam como 304 (sem custo de rate limit). Dentro de
+        ``INVENTORY_MAX_AGE`` nenhuma chamada é feita. Retorna None se o GitHub
+        não estiver configurado e não houver inventário em cache.
+        """
+        with self._inventory_lock:
+            if self._inventory is None:
+                self._set_inventory(self._load_inventory_file())
+            inventory = self._inventory
+            fresh = inventory and time.time() - inventory.get("fetched_at", 0) < self.INVENTORY_MAX_AGE
+            if self.is_configured() and (refresh or not fresh):
+                try:
+                    inventory = self._fetch_inventory(inventory)
+                    self._set_inventory(inventory)
+                    self._save_inventory_file(inventory)
+                except Exception as e:
+                    # Sem rede, o inventário anterior (mesmo vencido) ainda é útil
+                    print(f"⚠️ Erro ao atualizar inventário de repositórios: {str(e)}")
+            if inventory is None:
+                return None
+            return dict(self._repos)
+
+    def _set_inventory(self, inventory):
+        self._inventory = inventory
+        self._owners = inventory.setdefault("owners", {}) if inventory else {}
+        self._repos = {
+            repo["name"].lower(): repo for page in (inventory or {}).get("pages", []) for repo in page["repos"]
+        }
+
+    def _fetch_inventory(self, previous):
+        previous_pages = (previous or {}).get("pages", [])
+        pages = []
+        page_number = 1
+        with span("github.repo_inventory", username=self.username) as current:
+            while True:
+                cached = previous_pages[page_number - 1] if page_number <= len(previous_pages) else None
+                headers = self._api_headers()
+                if cached and cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                response = self._request(
+                    "GET", "list_repos",
+                    "https://api.github.com/user/repos",
+                    headers=headers,
+                    params={"affiliation": "owner", "per_page": self.INVENTORY_PAGE_SIZE, "page": page_number,
+                            "sort": "full_name"},
+                    timeout=15
+                )
+                if response.status_code == 304 and cached:
+                    page = cached
+                else:
+                    response.raise_for_status()
+                    page = {
+                        "etag": response.headers.get("ETag"),
+                        "next": "next" in response.links,
+                        "repos": [
+                            {
+                                "name": repo["name"],
+                                "html_url": repo["html_url"],
+                                "clone_url": repo["clone_url"],
+                                "private": repo.get("private", False),
+                            }
+                            for repo in response.json()
+                        ],
+                    }
+                pages.append(page)
+                if not page["next"]:
+                    break
+                page_number += 1
+            current.set_attribute("pages", len(pages))
+
+        return {
+            "version": REPO_INVENTORY_VERSION,
+            "username": self.username,
+            "fetched_at": time.time(),
+            "pages": pages,
+            "owners": dict((previous or {}).get("owners", {})),
+        }
+
+    def _add_to_inventory(self, repo, owner=None):
+        with self._inventory_lock:
+            if self._inventory is None:
+                return
+            if owner is not None:
+                self._owners[repo["name"].lower()] = owner
+            pages = self._inventory["pages"]
+            if repo["name"].lower() not in self._repos:
+                if not pages:
+                    pages.append({"etag": None, "next": False, "repos": []})
+                # Página sem ETag: a próxima revalidação a busca de novo
+                pages[-1]["repos"].append(repo)
+                pages[-1]["etag"] = None
+                self._repos[repo["name"].lower()] = repo
+            self._save_inventory_file(self._inventory)
+
+    def repository_exists(self, repo_name, refresh=False):
+        """Consulta o inventário em memória; None quando não há inventário disponível"""
+        inventory = self.get_repository_inventory(refresh)
+        if inventory is None:
+            return None
+        return repo_name.lower() in inventory
+
+    def repository_owner(self, repo_name):
+        """Nome de exibição do pacote que criou o repositório (None se desconhecido)"""
+        return self._owners.get(repo_name.lower())
+
+    def existing_repository_names(self):
+        """Nomes já usados na conta -> pacote dono, no formato aceito por ``NameAllocator``"""
+        inventory = self.get_repository_inventory() or {}
+        return {name: self._owners.get(name) for name in inventory}
+
+    def get_package_repo_name(self, package_path, display_name):
+        """Nome do repositório de um pacote gerado: o alocado (lockfile) ou o derivado do nome de exibição"""
+        from core.package_generator import read_lockfile
+
+        try:
+            params = (read_lockfile(package_path) or {}).get("params", {})
+        except (OSError, ValueError):
+            params = {}
+        return params.get("repo_name") or get_package_names(display_name).repo_name
+
+    def _adopt_repository(self, repo_name):
+        repo = self._repos[repo_name.lower()]
+        print(f"♻️ Repositório '{repo['name']}' já existe e pertence a esta tarefa, reaproveitando")
+        return {
+            "success": True,
+            "repo_url": repo["html_url"],
+            "clone_url": repo["clone_url"],
+            "ssh_url": f"git@github.com:{self.username}/{repo['name']}.git",
+            "repo_name": repo["name"],
+            "adopted": True
+        }
+
+    def create_repository(self, display_name, description, private=False, auto_init=False, adopt=False,
+                          repo_name=None, before_create=None):
+        """Cria o repositório do pacote (``repo_name`` alocado ou o derivado do nome de exibição).
+
+        Com ``adopt``, um repositório de mesmo nome já existente é reaproveitado
+        em vez de virar erro (retomada após queda entre o 201 e o journal); o
+        mesmo vale para um repositório criado antes para o mesmo pacote.
+        ``before_create`` é chamado logo antes do POST, depois da verificação
+        de existência. Erros de repositório já existente trazem ``"exists": True``.
+        """
         if not self.is_configured():
             return {"error": "Token de acesso GitHub não configurado"}
 
-        repo_name = sanitize_name_for_repo(display_name)
+        repo_name = repo_name or get_package_names(display_name).repo_name
+
+        # Evita a ida ao GitHub só para receber um 422
+        if self.repository_exists(repo_name, refresh=adopt):
+            if adopt or self.repository_owner(repo_name) == display_name:
+                return self._adopt_repository(repo_name)
+            return {"error": f"Repositório '{repo_name}' já existe", "exists": True}
 
         try:
-            response = requests.post(
-                "https://api.github.com/user/repos",
-                headers={
-                    "Authorization": f"token {self.token}",
-                    "Accept": "application/vnd.github.v3+json"
-                },
-                json={
-                    "name": repo_name,
-                    "description": description,
-                    "private": private,
-                    "auto_init": auto_init,
-                    "gitignore_template": None,
-                    "license_template": None,
-                    "homepage": f"https://github.com/{self.username}/{repo_name}",
-                    "has_issues": True,
-                    "has_projects": True,
-                    "has_wiki": True,
-                    "has_downloads": True
-                },
-                timeout=30
-            )
+            if before_create is not None:
+                before_create()
+            with span("github.repo_create", repo=repo_name) as current:
+                response = self._request(
+                    "POST", "create_repo",
+                    "https://api.github.com/user/repos",
+                    headers={
+                        "Authorization": f"token {self.token}",
+                        "Accept": "application/vnd.github.v3+json"
+                    },
+                    json={
+                        "name": repo_name,
+                        "description": description,
+                        "private": private,
+                        "auto_init": auto_init,
+                        "gitignore_template": None,
+                        "license_template": None,
+                        "homepage": f"https://github.com/{self.username}/{repo_name}",
+                        "has_issues": True,
+                        "has_projects": True,
+                        "has_wiki": True,
+                        "has_downloads": True
+                    },
+                    timeout=30
+                )
+                current.set_attribute("status_code", response.status_code)
 
             if response.status_code == 201:
                 repo_data = response.json()
+                self._add_to_inventory({
+                    "name": repo_data.get("name", repo_name),
+                    "html_url": repo_data["html_url"],
+                    "clone_url": repo_data["clone_url"],
+                    "private": private,
+                }, owner=display_name)
                 return {
                     "success": True,
                     "repo_url": repo_data["html_url"],
@@ -103,7 +356,9 @@ class GitHubManager:
                     "repo_name": repo_name
                 }
             elif response.status_code == 422:
-                return {"error": f"Repositório '{repo_name}' já existe"}
+                if adopt and self.repository_exists(repo_name, refresh=True):
+                    return self._adopt_repository(repo_name)
+                return {"error": f"Repositório '{repo_name}' já existe", "exists": True}
             else:
                 return {"error": f"Erro HTTP {response.status_code}: {response.text}"}
 
@@ -111,45 +366,104 @@ class GitHubManager:
             return {"error": f"Erro ao criar repositório: {str(e)}"}
 
     def setup_repository_with_semantic_release(self, package_path, display_name, description,
-                                               private=False, initial_version="0.1.0"):
+                                               private=False, initial_version="0.1.0", steps=None,
+                                               repo_name=None):
+        """Cria o repositório, faz o push inicial e publica a release.
+
+        ``steps`` (``JobSteps``) registra cada etapa concluída; ao repetir a
+        chamada após uma falha, as etapas já feitas são puladas. Sem
+        ``repo_name``, usa o nome gravado no lockfile do pacote, o mesmo das
+        URLs do package.json.
+        """
+        repo_name = repo_name or self.get_package_repo_name(package_path, display_name)
+        with span("github.setup", package=display_name):
+            return self._setup_repository_with_semantic_release(
+                package_path, display_name, description, private, initial_version,
+                steps if steps is not None else JobSteps(), repo_name
+            )
+
+    def _setup_repository_with_semantic_release(self, package_path, display_name, description,
+                                                private, initial_version, steps, repo_name):
         try:
-            repo_result = self.create_repository(display_name, description, private)
-            if "error" in repo_result:
-                return repo_result
+            if steps.is_done(STEP_REPO_CREATE):
+                repo_name = steps.get(STEP_REPO_CREATE)["repo_name"]
+                print(f"⏭️ Repositório '{repo_name}' já criado, retomando")
+            else:
+                # Um pedido anterior desta tarefa pode ter criado o repositório sem chegar ao journal
+                # O marcador só é gravado quando o POST vai de fato sair (nome livre na verificação)
+                requested = steps.get(STEP_REPO_REQUESTED, {}).get("repo_name") == repo_name
+                repo_result = self.create_repository(
+                    display_name, description, private, adopt=requested, repo_name=repo_name,
+                    before_create=lambda: steps.complete(STEP_REPO_REQUESTED, {"repo_name": repo_name})
+                )
+                if "error" in repo_result:
+                    if repo_result.get("exists"):
+                        # O repositório já existia antes do pedido: não é desta tarefa
+                        steps.discard(STEP_REPO_REQUESTED)
+                    return repo_result
+                repo_name = repo_result["repo_name"]
+                steps.complete(STEP_REPO_CREATE, {"repo_name": repo_name})
 
-            repo_name = repo_result["repo_name"]
             repo_url = f"https://github.com/{self.username}/{repo_name}.git"
 
-            os.chdir(package_path)
-            
+            # Usa cwd por chamada em vez de os.chdir, que altera o processo inteiro
             subprocess_kwargs = self._get_subprocess_kwargs()
-
-            subprocess.run(["git", "init"], check=True, capture_output=True, **subprocess_kwargs)
-            subprocess.run(["git", "branch", "-M", "main"], check=True, capture_output=True, **subprocess_kwargs)
-            subprocess.run(["git", "remote", "add", "origin", repo_url], check=True, capture_output=True, **subprocess_kwargs)
-
-            try:
-                subprocess.run(["git", "config", "user.name"], check=True, capture_output=True, **subprocess_kwargs)
-            except subprocess.CalledProcessError:
-                author_name = self.config.get_value(key='author_name', default='Author')
-                subprocess.run(["git", "config", "user.name", author_name], check=True, capture_output=True, **subprocess_kwargs)
-
-            try:
-                subprocess.run(["git", "config", "user.email"], check=True, capture_output=True, **subprocess_kwargs)
-            except subprocess.CalledProcessError:
-                author_email = self.config.get_value(key='author_email', default='author@example.com')
-                subprocess.run(["git", "config", "user.email", author_email], check=True, capture_output=True, **subprocess_kwargs)
-
-            subprocess.run(["git", "add", "."], check=True, capture_output=True, **subprocess_kwargs)
-
-            commit_message = f"chore: initial package structure\n\n- Unity package configuration v{initial_version}\n- Documentation and samples\n- Runtime and Editor assemblies"
-            subprocess.run(["git", "commit", "-m", commit_message], check=True, capture_output=True, **subprocess_kwargs)
-
-            subprocess.run(["git", "push", "-u", "origin", "main"], check=True, capture_output=True, **subprocess_kwargs)
-
-            self._create_initial_release(repo_name, initial_version, display_name)
-
-            self._setup_branch_protection(repo_name)
+            subprocess_kwargs['cwd'] = package_path
+
+            if not steps.is_done(STEP_GIT_INIT):
+                with span("git.init", repo=repo_name):
+                    subprocess.run(["git", "init"], check=True, capture_output=True, **subprocess_kwargs)
+                    subprocess.run(["git", "branch", "-M", "main"], check=True, capture_output=True, **subprocess_kwargs)
+                    try:
+                        subprocess.run(["git", "remote", "add", "origin", repo_url], check=True, capture_output=True, **subprocess_kwargs)
+                    except subprocess.CalledProcessError:
+                        # Remote já existe de uma execução interrompida
+                        subprocess.run(["git", "remote", "set-url", "origin", repo_url], check=True, capture_output=True, **subprocess_kwargs)
+
+                    try:
+                        subprocess.run(["git", "config", "user.name"], check=True, capture_output=True, **subprocess_kwargs)
+                    except subprocess.CalledProcessError:
+                        author_name = self.config.get_value(key='author_name', default='Author')
+                        subprocess.run(["git", "config", "user.name", author_name], check=True, capture_output=True, **subprocess_kwargs)
+
+                    try:
+                        subprocess.run(["git", "config", "user.email"], check=True, capture_output=True, **subprocess_kwargs)
+                    except subprocess.CalledProcessError:
+                        author_email = self.config.get_value(key='author_email', default='author@example.com')
+                        subprocess.run(["git", "config", "user.email", author_email], check=True, capture_output=True, **subprocess_kwargs)
+                steps.complete(STEP_GIT_INIT)
+
+            if not steps.is_done(STEP_GIT_COMMIT):
+                with span("git.commit", repo=repo_name):
+                    subprocess.run(["git", "add", "."], check=True, capture_output=True, **subprocess_kwargs)
+
+                    # Árvore limpa com HEAD existente: o commit foi feito antes de uma queda
+                    status = subprocess.run(["git", "status", "--porcelain"], check=True, capture_output=True,
+                                            **subprocess_kwargs)
+                    has_head = subprocess.run(["git", "rev-parse", "--verify", "HEAD"],
+                                              capture_output=True, **subprocess_kwargs).returncode == 0
+
+                    commit_message = f"chore: initial package structure\n\n- Unity package configuration v{initial_version}\n- Documentation and samples\n- Runtime and Editor assemblies"
+                    if status.stdout.strip() or not has_head:
+                        subprocess.run(["git", "commit", "-m", commit_message], check=True, capture_output=True, **subprocess_kwargs)
+                    else:
+                        print("⏭️ Commit inicial já feito, retomando")
+                steps.complete(STEP_GIT_COMMIT)
+
+            if not steps.is_done(STEP_GIT_PUSH):
+                with span("git.push", repo=repo_name):
+                    subprocess.run(["git", "push", "-u", "origin", "main"], check=True, capture_output=True, **subprocess_kwargs)
+                steps.complete(STEP_GIT_PUSH)
+
+            if not steps.is_done(STEP_RELEASE):
+                with span("github.release", repo=repo_name, version=initial_version):
+                    if self._create_initial_release(repo_name, initial_version, display_name):
+                        steps.complete(STEP_RELEASE, {"version": initial_version})
+
+            if not steps.is_done(STEP_BRANCH_PROTECTION):
+                with span("github.branch_protection", repo=repo_name):
+                    self._setup_branch_protection(repo_name)
+                steps.complete(STEP_BRANCH_PROTECTION)
 
             return {
                 "success": True,
@@ -165,7 +479,8 @@ class GitHubManager:
 
     def _create_initial_release(self, repo_name, version, display_name):
         try:
-            commits_response = requests.get(
+            commits_response = self._request(
+                "GET", "list_commits",
                 f"https://api.github.com/repos/{self.username}/{repo_name}/commits",
                 headers={
                     "Authorization": f"token {self.token}",
@@ -179,7 +494,8 @@ class GitHubManager:
                 if commits:
                     latest_commit_sha = commits[0]["sha"]
 
-                    tag_response = requests.post(
+                    tag_response = self._request(
+                        "POST", "create_ref",
                         f"https://api.github.com/repos/{self.username}/{repo_name}/git/refs",
                         headers={
                             "Authorization": f"token {self.token}",
@@ -192,8 +508,10 @@ class GitHubManager:
                         timeout=10
                     )
 
-                    if tag_response.status_code in [200, 201]:
-                        release_response = requests.post(
+                    # 422: tag já criada por uma execução interrompida
+                    if tag_response.status_code in [200, 201, 422]:
+                        release_response = self._request(
+                            "POST", "create_release",
                             f"https://api.github.com/repos/{self.username}/{repo_name}/releases",
                             headers={
                                 "Authorization": f"token {self.token}",
@@ -212,11 +530,12 @@ class GitHubManager:
 
                         if release_response.status_code == 201:
                             print(f"✅ Release v{version} criada com sucesso!")
-                        else:
-                            print(f"⚠️ Erro ao criar release: {release_response.status_code}")
+                            return True
+                        print(f"⚠️ Erro ao criar release: {release_response.status_code}")
 
         except Exception as e:
             print(f"⚠️ Erro ao criar release inicial: {e}")
+        return False
 
     def _setup_branch_protection(self, repo_name):
         try:
@@ -229,7 +548,8 @@ class GitHubManager:
                 "allow_deletions": False
             }
 
-            requests.put(
+            self._request(
+                "PUT", "branch_protection",
                 f"https://api.github.com/repos/{self.username}/{repo_name}/branches/main/protection",
                 headers={
                     "Authorization": f"token {self.token}",
@@ -241,13 +561,17 @@ class GitHubManager:
         except Exception:
             pass
 
-    def open_repository(self, display_name):
-        repo_name = sanitize_name_for_repo(display_name)
+    def open_repository(self, display_name, repo_name=None):
+        repo_name = repo_name or get_package_names(display_name).repo_name
         url = f"https://github.com/{self.username}/{repo_name}"
         webbrowser.open(url)
 
-    def get_repository_url(self, display_name, for_unity=True):
-        repo_name = sanitize_name_for_repo(display_name)
+    def get_repository_url(self, display_name, for_unity=True, repo_name=None):
+        repo_name = repo_name or get_package_names(display_name).repo_name
+        # Usa o inventário já carregado (sem chamadas à API) para respeitar a grafia real do repositório
+        repo = self._repos.get(repo_name.lower())
+        if repo:
+            return repo["clone_url"] if for_unity else repo["html_url"]
         if for_unity:
             return f"https://github.com/{self.username}/{repo_name}.git"
         else:
@@ -0,0 +1,161 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_JOURNAL_PATH = "jobs.db"
+
+# Etapas registradas por pacote, na ordem em que são executadas
+STEP_GENERATE = "generate"
+STEP_REPO_CREATE = "repo_create"
+# Gravada antes do POST: ao retomar, um repositório com esse nome já existente é desta tarefa
+STEP_REPO_REQUESTED = "repo_create_requested"
+STEP_GIT_INIT = "git_init"
+STEP_GIT_COMMIT = "git_commit"
+STEP_GIT_PUSH = "git_push"
+STEP_RELEASE = "release"
+STEP_BRANCH_PROTECTION = "branch_protection"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    job_key TEXT NOT NULL,
+    step TEXT NOT NULL,
+    data TEXT,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (job_key, step)
+);
+"""
+
+
+class JobSteps:
+    """Etapas concluídas de um pacote; sem journal, vale apenas em memória"""
+
+    def __init__(self, journal=None, key=None):
+        self.journal = journal
+        self.key = key
+        self._done = journal._load_steps(key) if journal else {}
+
+    def is_done(self, step):
+        return step in self._done
+
+    def get(self, step, default=None):
+        data = self._done.get(step)
+        return default if data is None else data
+
+    def complete(self, step, data=None):
+        self._done[step] = data or {}
+        if self.journal:
+            self.journal._save_step(self.key, step, self._done[step])
+
+    def discard(self, step):
+        if self._done.pop(step, None) is not None and self.journal:
+            self.journal._delete_step(self.key, step)
+
+    def completed(self):
+        return list(self._done)
+
+
+class JobJournal:
+    """Journal durável (SQLite) de jobs e etapas concluídas.
+
+    Cada etapa é gravada assim que termina, então uma nova execução após
+    uma queda pula o que já foi feito (ex: repositório já criado).
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_job(self, job_id, params, status="queued"):
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, params, status, error, created_at, updated_at) "
+                "VALUES (?, ?, ?, NULL, ?, ?)",
+                (job_id, json.dumps(params, ensure_ascii=False), status, now, now)
+            )
+
+    def update_job(self, job_id, status, error=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, error, datetime.now().isoformat(), job_id)
+            )
+
+    def remove_job(self, job_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            self._conn.execute("DELETE FROM steps WHERE job_key = ?", (job_id,))
+
+    def get_job(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, params, status, error, created_at, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, statuses=None):
+        query = "SELECT id, params, status, error, created_at, updated_at FROM jobs"
+        args = ()
+        if statuses:
+            query += f" WHERE status IN ({','.join('?' * len(statuses))})"
+            args = tuple(statuses)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_at", args).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def unfinished_jobs(self):
+        """Jobs que estavam na fila ou em execução quando o processo parou"""
+        return self.list_jobs(("queued", "running"))
+
+    def steps(self, key):
+        return JobSteps(self, key)
+
+    def clear_steps(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM steps WHERE job_key = ?", (key,))
+
+    def _load_steps(self, key):
+        with self._lock:
+            rows = self._conn.execute("SELECT step, data FROM steps WHERE job_key = ?", (key,)).fetchall()
+        return {step: json.loads(data) if data else {} for step, data in rows}
+
+    def _save_step(self, key, step, data):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO steps (job_key, step, data, completed_at) VALUES (?, ?, ?, ?)",
+                (key, step, json.dumps(data, ensure_ascii=False), datetime.now().isoformat())
+            )
+
+    def _delete_step(self, key, step):
+        with self._lock:
+            self._conn.execute("DELETE FROM steps WHERE job_key = ? AND step = ?", (key, step))
+
+    @staticmethod
+    def _row_to_job(row):
+        job_id, params, status, error, created_at, updated_at = row
+        return {
+            "id": job_id,
+            "params": json.loads(params),
+            "status": status,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
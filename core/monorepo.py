@@ -0,0 +1,166 @@
+import json
+from collections import deque
+
+from utils.version_utils import get_package_names
+from utils.tracing import span
+from core.name_allocator import NameAllocator, collect_taken_names
+
+# Campos de cada pacote do manifesto repassados a create_package_structure
+PACKAGE_FIELDS = (
+    "name", "description", "version", "create_samples", "create_runtime", "create_editor",
+    "create_tests", "create_github", "license_type",
+)
+
+
+class MonorepoError(ValueError):
+    """Manifesto de monorepo inválido (pacote desconhecido, ciclo, duplicado)"""
+
+
+def load_manifest(path):
+    """Lê o manifesto JSON do monorepo.
+
+    Formato::
+
+        {
+          "defaults": {"version": "0.1.0", "create_samples": false},
+          "packages": [
+            {"display_name": "Core"},
+            {"display_name": "Networking", "depends_on": ["Core"]}
+          ]
+        }
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class MonorepoPlanner:
+    """Resolve o grafo de pacotes em ordem topológica e calcula referências.
+
+    Para cada pacote, as dependências diretas viram ``references`` nos
+    asmdefs e entradas em ``dependencies`` do package.json, com a versão
+    declarada no próprio manifesto. As pastas recebem nomes únicos via
+    ``NameAllocator``, considerando ``taken`` (pastas/repositórios existentes).
+    """
+
+    def __init__(self, package_generator, manifest, taken=None):
+        self.generator = package_generator
+        self.taken = taken
+        self.defaults = dict(manifest.get("defaults", {}))
+        self.packages = {}
+        self._package_ids = {}
+
+        for package in manifest.get("packages", []):
+            display_name = package.get("display_name")
+            if not display_name:
+                raise MonorepoError("Todo pacote do manifesto precisa de display_name")
+            if display_name in self.packages:
+                raise MonorepoError(f"Pacote duplicado no manifesto: {display_name}")
+            self.packages[display_name] = dict(self.defaults, **package)
+
+        for display_name, package in self.packages.items():
+            for dependency in package.get("depends_on", []):
+                if dependency not in self.packages:
+                    raise MonorepoError(f"'{display_name}' depende de '{dependency}', que não está no manifesto")
+
+    def namespace(self, display_name):
+        """Namespace (e nome do asmdef de runtime) de um pacote"""
+        return get_package_names(display_name).runtime_assembly
+
+    def package_id(self, display_name):
+        package_id = self._package_ids.get(display_name)
+        if package_id is None:
+            package = self.packages[display_name]
+            package_id = self.generator.get_package_id(package.get("name", display_name), display_name)
+            self._package_ids[display_name] = package_id
+        return package_id
+
+    def topological_order(self):
+        """Ordena os pacotes de forma que dependências venham antes (Kahn)"""
+        pending = {name: len(set(package.get("depends_on", []))) for name, package in self.packages.items()}
+        dependents = {name: [] for name in self.packages}
+        for name, package in self.packages.items():
+            for dependency in set(package.get("depends_on", [])):
+                dependents[dependency].append(name)
+
+        # Mantém a ordem do manifesto entre pacotes independentes
+        ready = deque(name for name in self.packages if pending[name] == 0)
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.packages):
+            cycle = sorted(name for name, count in pending.items() if count > 0)
+            raise MonorepoError(f"Dependência circular entre: {', '.join(cycle)}")
+        return order
+
+    def check_unique_names(self):
+        """Rejeita pacotes que resultariam no mesmo package id ou assembly.
+
+        Pastas e repositórios recebem sufixo, mas o id UPM e o nome do asmdef
+        vêm do nome de exibição: dois pacotes iguais tornariam as referências ambíguas.
+        """
+        for label, key in (("package id", self.package_id), ("assembly", self.namespace)):
+            owners = {}
+            for display_name in self.packages:
+                owners.setdefault(key(display_name), []).append(display_name)
+            duplicates = [f"{value} ({', '.join(names)})" for value, names in owners.items() if len(names) > 1]
+            if duplicates:
+                raise MonorepoError(f"Pacotes com o mesmo {label}: {'; '.join(duplicates)}")
+
+    def repo_names(self):
+        """Nome de pasta/repositório de cada pacote, alocado na ordem do manifesto"""
+        allocations = NameAllocator(self.taken).allocate_batch(list(self.packages))
+        return {allocation["display_name"]: allocation for allocation in allocations}
+
+    def plan(self):
+        """Retorna os parâmetros de create_package_structure de cada pacote, em ordem"""
+        self.check_unique_names()
+        repo_names = self.repo_names()
+        plans = []
+        for display_name in self.topological_order():
+            package = self.packages[display_name]
+            dependencies = list(dict.fromkeys(package.get("depends_on", [])))
+
+            unity_dependencies = dict(package.get("unity_dependencies") or {})
+            for dependency in dependencies:
+                unity_dependencies[self.package_id(dependency)] = \
+                    self.packages[dependency].get("version", "0.1.0")
+
+            params = {field: package[field] for field in PACKAGE_FIELDS if field in package}
+            params.setdefault("name", display_name)
+            params.setdefault("description", "")
+            params.update(
+                display_name=display_name,
+                unity_dependencies=unity_dependencies or None,
+                assembly_references=[
+                    self.namespace(dependency) for dependency in dependencies
+                    if self.packages[dependency].get("create_runtime", True)
+                ],
+                repo_name=repo_names[display_name]["repo_name"],
+            )
+            if repo_names[display_name]["renamed"]:
+                self.generator.log(
+                    f"⚠️ '{display_name}' colide com '{repo_names[display_name]['base_name']}', "
+                    f"usando '{params['repo_name']}'"
+                )
+            plans.append(params)
+        return plans
+
+
+def generate_monorepo(package_generator, manifest, base_path, github_manager=None):
+    """Gera todos os pacotes do manifesto em ``base_path``; retorna os caminhos criados.
+
+    Com ``github_manager`` configurado, os nomes também são alocados contra os
+    repositórios já existentes na conta.
+    """
+    planner = MonorepoPlanner(package_generator, manifest, taken=collect_taken_names(base_path, github_manager))
+    paths = []
+    with span("monorepo", packages=len(planner.packages)):
+        for params in planner.plan():
+            paths.append(package_generator.create_package_structure(base_path=base_path, **params))
+    return paths
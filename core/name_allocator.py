@@ -0,0 +1,104 @@
+import os
+import json
+
+from utils.version_utils import derive_package_names, MAX_REPO_NAME_LENGTH
+
+
+def local_folder_owners(base_path):
+    """Pastas já existentes em ``base_path`` -> nome de exibição do pacote nelas (ou None)"""
+    owners = {}
+    try:
+        entries = os.scandir(base_path)
+    except OSError:
+        return owners
+    with entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            owner = None
+            try:
+                with open(os.path.join(entry.path, "package.json"), 'r', encoding='utf-8-sig') as f:
+                    owner = json.load(f).get("displayName")
+            except (OSError, ValueError):
+                pass
+            owners[entry.name.lower()] = owner
+    return owners
+
+
+def collect_taken_names(base_path, github_manager=None):
+    """Nomes já usados -> dono: repositórios da conta (com GitHub configurado) e pastas em ``base_path``.
+
+    Um nome presente nos dois fica com o dono conhecido, para que um lote
+    gerado de novo reaproveite as próprias pastas e repositórios.
+    """
+    taken = {}
+    if github_manager is not None and github_manager.is_configured():
+        taken.update(github_manager.existing_repository_names())
+    for name, owner in local_folder_owners(base_path).items():
+        if taken.get(name) is None:
+            taken[name] = owner
+    return taken
+
+
+class NameAllocator:
+    """Atribui nomes de repositório/pasta únicos a um lote de pacotes, sem I/O.
+
+    ``taken`` mapeia nomes já usados (pastas locais, repositórios remotos) para
+    o nome de exibição do pacote dono, ou None quando desconhecido; também
+    aceita uma lista simples de nomes. A comparação ignora maiúsculas, como no
+    GitHub. Um nome só é considerado livre para o próprio dono, então gerar
+    de novo o mesmo lote reaproveita as mesmas pastas.
+    """
+
+    def __init__(self, taken=None, max_length=MAX_REPO_NAME_LENGTH):
+        self.max_length = max_length
+        self._owners = {}
+        if isinstance(taken, dict):
+            for name, owner in taken.items():
+                self._owners[name.lower()] = owner
+        else:
+            for name in taken or ():
+                self._owners[name.lower()] = None
+
+    def add_taken(self, names, owner=None):
+        for name in names:
+            self._owners.setdefault(name.lower(), owner)
+
+    def is_available(self, name, display_name=None):
+        key = name.lower()
+        return key not in self._owners or (display_name is not None and self._owners[key] == display_name)
+
+    def reserve(self, name, display_name=None):
+        self._owners[name.lower()] = display_name
+
+    def _candidate(self, base_name, counter):
+        suffix = f"-{counter}"
+        return f"{base_name[:self.max_length - len(suffix)].rstrip('-')}{suffix}"
+
+    def allocate(self, display_name, base_name=None):
+        """Nome livre para ``display_name``: o derivado do nome de exibição ou ele com sufixo -2, -3..."""
+        if base_name is None:
+            base_name = derive_package_names([display_name])[0].repo_name
+        name = base_name
+        counter = 1
+        while not self.is_available(name, display_name):
+            counter += 1
+            name = self._candidate(base_name, counter)
+        self.reserve(name, display_name)
+        return name
+
+    def allocate_batch(self, display_names):
+        """Aloca nomes para o lote na ordem recebida (mesma entrada, mesmo resultado).
+
+        Retorna ``[{"display_name", "repo_name", "base_name", "renamed"}]``.
+        """
+        result = []
+        for names in derive_package_names(display_names):
+            repo_name = self.allocate(names.display_name, names.repo_name)
+            result.append({
+                "display_name": names.display_name,
+                "repo_name": repo_name,
+                "base_name": names.repo_name,
+                "renamed": repo_name != names.repo_name,
+            })
+        return result
@@ -1,9 +1,84 @@
 import os
 import json
+import time
+import difflib
+import hashlib
 from datetime import datetime
-from utils.version_utils import sanitize_name_for_repo, get_namespace_from_display_name, \
-    extract_package_name_from_full_name
+from utils.version_utils import get_package_names, extract_package_name_from_full_name
 from ui.strings import RELEASE_WORKFLOW, RELEASERC_JSON
+from utils.tracing import span
+from utils.json_merge import three_way_merge
+from core.package_index import PackageIndex
+from core.sample_templates import SampleTemplateIndex, default_templates_root, copy_file, render
+from utils import metrics
+
+_packages_generated = metrics.counter(
+    "upf_packages_generated_total", "Pacotes gerados por resultado", ("result",)
+)
+_package_seconds = metrics.histogram(
+    "upf_package_generation_seconds", "Tempo de geração de um pacote"
+)
+_files_written = metrics.counter("upf_files_written_total", "Arquivos escritos pelo gerador")
+_bytes_written = metrics.counter("upf_bytes_written_total", "Bytes escritos pelo gerador")
+_file_size_bytes = metrics.histogram(
+    "upf_file_size_bytes", "Tamanho dos arquivos escritos", buckets=metrics.SIZE_BUCKETS
+)
+_file_backups = metrics.counter("upf_file_backups_total", "Backups .bak criados antes de sobrescrever")
+_files_refreshed = metrics.counter(
+    "upf_files_refreshed_total", "Arquivos avaliados no modo refresh por resultado", ("status",)
+)
+
+# Lockfile gravado em cada pacote gerado: parâmetros de entrada e hash por arquivo.
+# Começa com "." para ser ignorado pelo AssetDatabase da Unity.
+LOCKFILE_NAME = ".upf-lock.json"
+LOCKFILE_VERSION = 1
+
+REFRESH_UNCHANGED = "unchanged"
+REFRESH_CREATED = "created"
+REFRESH_UPDATED = "updated"
+REFRESH_CONFLICT = "conflict"
+REFRESH_MERGED = "merged"
+
+# Segundos em que o índice de uma pasta de destino é reaproveitado sem varrer a árvore de novo
+PACKAGE_INDEX_MAX_AGE = 60
+
+# Arquivos JSON mesclados em 3 vias (gerado anterior, editado pelo usuário, novo gerado)
+# em vez de sobrescritos; o lockfile guarda a versão gerada como base.
+MERGEABLE_FILES = {"package.json"}
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def read_lockfile(package_path):
+    """Lê o lockfile de um pacote gerado (ou None se não existir)"""
+    lock_path = os.path.join(package_path, LOCKFILE_NAME)
+    if not os.path.isfile(lock_path):
+        return None
+    with open(lock_path, 'r', encoding='utf-8') as f:
+        lock = json.load(f)
+    if lock.get("lockfileVersion") != LOCKFILE_VERSION:
+        raise ValueError(f"Versão de lockfile não suportada em {lock_path}")
+    return lock
+
+
+def find_locked_packages(path):
+    """Retorna o próprio caminho se for um pacote gerado, senão os subdiretórios que forem"""
+    if os.path.isfile(os.path.join(path, LOCKFILE_NAME)):
+        return [path]
+    with os.scandir(path) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, LOCKFILE_NAME))
+        )
 
 
 class PackageGenerator:
@@ -11,12 +86,22 @@ class PackageGenerator:
         self.config = config_manager
         self.log_callback = print
         self.progress_callback = None
+        # Índices por pasta de destino, reaproveitados entre gerações (cache por mtime)
+        self._package_indexes = {}
+        # Pasta de destino -> (momento da última varredura completa, mtime da pasta)
+        self._package_index_scans = {}
+        # Índices de amostras por pasta de templates, lidos uma vez por processo
+        self._sample_indexes = {}
         self._reset_state()
 
     def _reset_state(self):
         """Reseta o estado interno do gerador"""
         self._is_generating = False
         self._current_operation = None
+        self._package_root = None
+        self._lock_entries = {}
+        self._previous_lock = {}
+        self._refresh = None
 
     def set_log_callback(self, callback):
         self.log_callback = callback
@@ -33,20 +118,26 @@ class PackageGenerator:
             self.progress_callback(value, message)
 
     def get_sanitized_repo_name(self, display_name):
-        return sanitize_name_for_repo(display_name)
+        return get_package_names(display_name).repo_name
 
     def is_busy(self):
         """Verifica se o gerador está ocupado"""
         return self._is_generating
 
-    def get_package_json(self, name, display_name, description, version="0.1.0", unity_dependencies=None):
+    def get_package_id(self, name, display_name):
+        """Identificador UPM (ex: com.example.meupacote) usado em package.json e dependências"""
+        company_prefix = self.config.get_value(key='company_prefix', default='com.example')
+        return get_package_names(display_name).package_id(company_prefix, name)
+
+    def get_package_json(self, name, display_name, description, version="0.1.0", unity_dependencies=None,
+                         repo_name=None, samples=None):
         company_prefix = self.config.get_value(key='company_prefix', default='com.example')
         author_name = self.config.get_value(key='author_name', default='Author')
         author_email = self.config.get_value(key='author_email', default='author@example.com')
         author_url = self.config.get_value(key='author_url', default='https://github.com/username')
         unity_version = self.config.get_value(key='unity_version', default='2021.3')
 
-        repo_name = self.get_sanitized_repo_name(display_name)
+        repo_name = repo_name or self.get_sanitized_repo_name(display_name)
         
         # Garantir que o nome do pacote seja válido
         package_name = extract_package_name_from_full_name(name).lower()
@@ -79,6 +170,9 @@ class PackageGenerator:
         if unity_dependencies:
             package_data["dependencies"] = unity_dependencies
 
+        if samples:
+            package_data["samples"] = samples
+
         # Validar o JSON gerado
         try:
             json.dumps(package_data)
@@ -94,13 +188,13 @@ class PackageGenerator:
 
         return package_data
 
-    def create_asmdef(self, path, name, display_name, is_editor=False):
-        namespace = get_namespace_from_display_name(display_name)
+    def create_asmdef(self, path, name, display_name, is_editor=False, references=None):
+        namespace = get_package_names(display_name).namespace
 
         asmdef_data = {
             "name": name,
             "rootNamespace": namespace,
-            "references": [],
+            "references": list(references or []),
             "includePlatforms": [],
             "excludePlatforms": [],
             "allowUnsafeCode": False,
@@ -115,13 +209,19 @@ class PackageGenerator:
         if is_editor:
             asmdef_data["includePlatforms"] = ["Editor"]
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(asmdef_data, f, indent=2)
+        self._create_file(path, json.dumps(asmdef_data, indent=2), backup=False)
 
     def create_package_structure(self, base_path, name, display_name, description, version="0.1.0",
                                  create_samples=True, create_runtime=True, create_editor=True,
                                  create_tests=True, create_github=True, license_type="MIT",
-                                 unity_dependencies=None):
+                                 unity_dependencies=None, assembly_references=None, repo_name=None):
+        """Gera a estrutura completa do pacote.
+
+        ``assembly_references`` lista os asmdefs de runtime de outros pacotes
+        (modo monorepo); quando informado, também são referenciados pelos
+        asmdefs de Editor e Tests. ``repo_name`` substitui o nome de pasta e
+        repositório derivado do nome de exibição (ex: vindo de ``NameAllocator``).
+        """
 
         # Validações iniciais
         if not base_path or not os.path.exists(base_path):
@@ -139,101 +239,378 @@ class PackageGenerator:
         # Reset do estado e marca como ocupado
         self._reset_state()
         self._is_generating = True
+        start = time.perf_counter()
 
         try:
-            self._current_operation = "Inicializando"
-            self.log(f"🚀 Iniciando criação do pacote '{display_name}'...")
+            with span("package", package=display_name):
+                package_folder_path = self._create_package_structure(
+                    base_path, name, display_name, description, version, create_samples,
+                    create_runtime, create_editor, create_tests, create_github, license_type,
+                    unity_dependencies, assembly_references, repo_name
+                )
+            _packages_generated.inc(result="success")
+            return package_folder_path
+
+        except Exception as e:
+            _packages_generated.inc(result="error")
+            self.log(f"❌ Erro ao criar pacote: {str(e)}")
+            self.log(f"❌ Operação atual: {self._current_operation}")
+            raise
+        finally:
+            _package_seconds.observe(time.perf_counter() - start)
+            # IMPORTANTE: Sempre reseta o estado, mesmo em caso de erro
+            self._reset_state()
+            self.log("🔄 Gerador pronto para nova operação")
 
-            clean_name = extract_package_name_from_full_name(name)
-            repo_name = self.get_sanitized_repo_name(display_name)
+    def refresh_package(self, package_path, dry_run=False, force=False):
+        """Regenera apenas os arquivos cujas entradas mudaram desde o lockfile.
+
+        Arquivos editados à mão (hash em disco diferente do lockfile) são
+        reportados como conflito e mantidos, a menos que ``force`` seja usado.
+        Retorna a lista de arquivos avaliados com status e diff.
+        """
+        lock = read_lockfile(package_path)
+        if lock is None:
+            raise ValueError(f"Lockfile não encontrado em {package_path}")
+
+        params = lock["params"]
+        base_path = os.path.dirname(os.path.abspath(package_path))
+        expected_path = os.path.join(
+            base_path, params.get("repo_name") or self.get_sanitized_repo_name(params["display_name"])
+        )
+        if os.path.normcase(expected_path) != os.path.normcase(os.path.abspath(package_path)):
+            raise ValueError(f"Pasta do pacote não corresponde ao lockfile: esperado {expected_path}")
 
-            package_folder_path = os.path.join(base_path, repo_name)
+        self._reset_state()
+        self._is_generating = True
+        self._previous_lock = lock.get("files", {})
+        self._refresh = {
+            "dry_run": dry_run,
+            "force": force,
+            "report": [],
+            "dirs": set(),
+        }
+        try:
+            with span("package.refresh", package=params["display_name"]):
+                self._create_package_structure(base_path, **params)
+            return self._refresh["report"]
+        finally:
+            self._reset_state()
 
-            if not os.path.exists(package_folder_path):
-                os.makedirs(package_folder_path)
-                self.log(f"📁 Diretório principal criado: {package_folder_path}")
-            else:
-                self.log(f"📁 Utilizando diretório existente: {package_folder_path}")
+    def _check_existing_packages(self, base_path, name, display_name, package_folder_path):
+        """Avisa sobre colisões com pacotes já existentes no destino (nome UPM, pasta, namespace)"""
+        index = self._get_package_index(base_path)
+        conflicts = index.find_conflicts(
+            self.get_package_id(name, display_name), display_name, exclude_path=package_folder_path,
+            folder=os.path.basename(package_folder_path)
+        )
+        for conflict in conflicts:
+            self.log(f"⚠️ {conflict}")
+        return conflicts
+
+    def _get_package_index(self, base_path):
+        """Índice da pasta de destino, varrido uma vez por lote.
+
+        A árvore só é percorrida de novo quando a pasta mudou por fora (mtime
+        diferente do registrado) ou o índice passou de ``PACKAGE_INDEX_MAX_AGE``;
+        os pacotes gerados aqui entram via ``_update_package_index``.
+        """
+        index = self._package_indexes.get(base_path)
+        scanned_at, root_mtime = self._package_index_scans.get(base_path, (0, None))
+        current_mtime = _mtime_ns(base_path)
+        if index is None:
+            index = self._package_indexes[base_path] = PackageIndex(base_path)
+        elif time.time() - scanned_at < PACKAGE_INDEX_MAX_AGE and current_mtime == root_mtime:
+            return index
+        with span("package.index", path=base_path):
+            index.scan()
+        self._package_index_scans[base_path] = (time.time(), current_mtime)
+        return index
+
+    def _update_package_index(self, base_path, package_folder_path):
+        """Inclui no índice o pacote recém-gerado, sem varrer o resto da pasta"""
+        index = self._package_indexes.get(base_path)
+        if index is None or base_path not in self._package_index_scans:
+            return
+        index.update_subtree(package_folder_path)
+        scanned_at, _ = self._package_index_scans[base_path]
+        # A criação da pasta do pacote muda o mtime do destino; não é mudança externa
+        self._package_index_scans[base_path] = (scanned_at, _mtime_ns(base_path))
+
+    def _stage(self, name, operation, display_name):
+        """Marca a operação atual e abre um span de trace para a etapa"""
+        self._current_operation = operation
+        return span(f"package.{name}", package=display_name)
+
+    def _create_package_structure(self, base_path, name, display_name, description, version,
+                                  create_samples, create_runtime, create_editor, create_tests,
+                                  create_github, license_type, unity_dependencies, assembly_references=None,
+                                  repo_name=None):
+        self._current_operation = "Inicializando"
+        self.log(f"🚀 Iniciando criação do pacote '{display_name}'...")
+
+        clean_name = extract_package_name_from_full_name(name)
+        names = get_package_names(display_name)
+        repo_name = repo_name or names.repo_name
+
+        package_folder_path = os.path.join(base_path, repo_name)
+        self._package_root = package_folder_path
+        if self._refresh is None:
+            self._check_existing_packages(base_path, name, display_name, package_folder_path)
+            # Atualização in-place: o lockfile existente fornece a base do merge de package.json
+            try:
+                self._previous_lock = (read_lockfile(package_folder_path) or {}).get("files", {})
+            except (OSError, ValueError) as e:
+                self.log(f"⚠️ Lockfile ignorado: {str(e)}")
+
+        if not os.path.exists(package_folder_path):
+            self._makedirs(package_folder_path)
+            self.log(f"📁 Diretório principal criado: {package_folder_path}")
+        else:
+            self.log(f"📁 Utilizando diretório existente: {package_folder_path}")
+
+        sample_packs = self._get_sample_packs() if create_samples else []
+        sample_values = {
+            "display_name": display_name,
+            "namespace": names.namespace,
+            "package_id": self.get_package_id(name, display_name),
+            "repo_name": repo_name,
+        }
 
-            self._current_operation = "Criando package.json"
+        with self._stage("package_json", "Criando package.json", display_name):
             self.update_progress(10, "Iniciando criação do pacote...")
 
-            package_json = self.get_package_json(name, display_name, description, version, unity_dependencies)
+            package_json = self.get_package_json(name, display_name, description, version, unity_dependencies,
+                                                 repo_name, [pack.entry(sample_values) for pack in sample_packs])
             self._create_file(
                 os.path.join(package_folder_path, "package.json"),
                 json.dumps(package_json, indent=2)
             )
             self.update_progress(20, "Arquivo package.json criado...")
 
-            if create_runtime:
-                self._current_operation = "Criando estrutura Runtime"
+        if create_runtime:
+            with self._stage("runtime", "Criando estrutura Runtime", display_name):
                 runtime_path = os.path.join(package_folder_path, "Runtime")
-                os.makedirs(runtime_path, exist_ok=True)
+                self._makedirs(runtime_path)
 
-                asmdef_name = f"{get_namespace_from_display_name(display_name)}"
+                asmdef_name = names.runtime_assembly
                 self.create_asmdef(
                     os.path.join(runtime_path, f"{asmdef_name}.asmdef"),
                     asmdef_name,
-                    display_name
+                    display_name,
+                    references=assembly_references
                 )
                 self.log("📁 Pasta Runtime criada com .asmdef")
 
-            if create_editor:
-                self._current_operation = "Criando estrutura Editor"
+        if create_editor:
+            with self._stage("editor", "Criando estrutura Editor", display_name):
                 editor_path = os.path.join(package_folder_path, "Editor")
-                os.makedirs(editor_path, exist_ok=True)
+                self._makedirs(editor_path)
 
-                asmdef_name = f"{get_namespace_from_display_name(display_name)}.Editor"
+                asmdef_name = names.editor_assembly
+                editor_references = None
+                if assembly_references is not None:
+                    editor_references = [names.runtime_assembly] if create_runtime else []
+                    editor_references += assembly_references
                 self.create_asmdef(
                     os.path.join(editor_path, f"{asmdef_name}.asmdef"),
                     asmdef_name,
                     display_name,
-                    is_editor=True
+                    is_editor=True,
+                    references=editor_references
                 )
                 self.log("📁 Pasta Editor criada com .asmdef")
 
-            self.update_progress(40, "Estrutura de pastas criada...")
+        self.update_progress(40, "Estrutura de pastas criada...")
 
-            if create_tests:
-                self._current_operation = "Criando testes"
-                self._create_tests_structure(package_folder_path, display_name)
-                self.update_progress(50, "Estrutura de testes criada...")
+        if create_tests:
+            with self._stage("tests", "Criando testes", display_name):
+                self._create_tests_structure(package_folder_path, display_name, assembly_references)
+            self.update_progress(50, "Estrutura de testes criada...")
 
-            if create_samples:
-                self._current_operation = "Criando samples"
-                self._create_samples_structure(package_folder_path, display_name)
-                self.update_progress(60, "Amostras criadas...")
+        if create_samples:
+            with self._stage("samples", "Criando samples", display_name):
+                self._create_samples_structure(package_folder_path, display_name, sample_packs, sample_values)
+            self.update_progress(60, "Amostras criadas...")
 
-            self._current_operation = "Criando documentação"
+        with self._stage("docs", "Criando documentação", display_name):
             self._create_documentation(package_folder_path, display_name, description, repo_name)
-            self.update_progress(70, "Documentação criada...")
+        self.update_progress(70, "Documentação criada...")
 
-            if license_type:
-                self._current_operation = "Criando licença"
+        if license_type:
+            with self._stage("license", "Criando licença", display_name):
                 self._create_license(package_folder_path, license_type, display_name)
-                self.update_progress(80, "Licença criada...")
+            self.update_progress(80, "Licença criada...")
 
-            if create_github:
-                self._current_operation = "Criando arquivos GitHub"
+        if create_github:
+            with self._stage("github_files", "Criando arquivos GitHub", display_name):
                 self._create_github_files(package_folder_path, display_name, version)
-                self.update_progress(90, "Arquivos GitHub criados...")
+            self.update_progress(90, "Arquivos GitHub criados...")
+
+        self._current_operation = "Finalizando"
+        if not (self._refresh and self._refresh["dry_run"]):
+            params = {
+                "name": name,
+                "display_name": display_name,
+                "description": description,
+                "version": version,
+                "create_samples": create_samples,
+                "create_runtime": create_runtime,
+                "create_editor": create_editor,
+                "create_tests": create_tests,
+                "create_github": create_github,
+                "license_type": license_type,
+                "unity_dependencies": unity_dependencies,
+                "assembly_references": assembly_references,
+            }
+            if repo_name != names.repo_name:
+                params["repo_name"] = repo_name
+            self._write_lockfile(package_folder_path, params)
+            if self._refresh is None:
+                self._update_package_index(base_path, package_folder_path)
 
-            self._current_operation = "Finalizando"
-            self.update_progress(100, "Pacote criado com sucesso!")
-            self.log(f"✅ Pacote '{display_name}' criado com sucesso em: {package_folder_path}")
+        self.update_progress(100, "Pacote criado com sucesso!")
+        self.log(f"✅ Pacote '{display_name}' criado com sucesso em: {package_folder_path}")
 
-            return package_folder_path
+        return package_folder_path
 
-        except Exception as e:
-            self.log(f"❌ Erro ao criar pacote: {str(e)}")
-            self.log(f"❌ Operação atual: {self._current_operation}")
-            raise
-        finally:
-            # IMPORTANTE: Sempre reseta o estado, mesmo em caso de erro
-            self._reset_state()
-            self.log("🔄 Gerador pronto para nova operação")
+    def _write_lockfile(self, package_path, params):
+        from utils.version_utils import get_current_version
+
+        lock = {
+            "lockfileVersion": LOCKFILE_VERSION,
+            "generator": get_current_version(),
+            "params": params,
+            "files": dict(sorted(self._lock_entries.items())),
+        }
+        with open(os.path.join(package_path, LOCKFILE_NAME), 'w', encoding='utf-8') as f:
+            json.dump(lock, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    def _relative_to_package(self, path):
+        if not self._package_root:
+            return None
+        return os.path.relpath(path, self._package_root).replace(os.sep, "/")
+
+    def _refresh_should_write(self, path, rel_path, content, generated, input_hash, merged):
+        """Decide no modo refresh se o arquivo precisa ser reescrito e registra no relatório"""
+        previous = self._previous_lock.get(rel_path)
+        exists = os.path.exists(path)
+
+        if previous and exists and previous["inputs"] == input_hash:
+            self._lock_entries[rel_path] = previous
+            self._refresh_report(rel_path, REFRESH_UNCHANGED)
+            return False
+
+        old_content = None
+        if exists:
+            with open(path, 'r', encoding='utf-8') as f:
+                old_content = f.read()
+            if old_content == content:
+                self._set_lock_entry(rel_path, input_hash, content, generated)
+                self._refresh_report(rel_path, REFRESH_UNCHANGED)
+                return False
+
+        diff = "".join(difflib.unified_diff(
+            (old_content or "").splitlines(True), content.splitlines(True),
+            fromfile=f"a/{rel_path}", tofile=f"b/{rel_path}"
+        ))
+
+        if merged:
+            self._refresh_report(rel_path, REFRESH_MERGED, diff)
+        elif exists and (previous is None or _sha256(old_content) != previous["sha256"]):
+            # Editado à mão depois da geração
+            self._refresh_report(rel_path, REFRESH_CONFLICT, diff)
+            if not self._refresh["force"]:
+                if previous:
+                    self._lock_entries[rel_path] = previous
+                return False
+        else:
+            self._refresh_report(rel_path, REFRESH_UPDATED if exists else REFRESH_CREATED, diff)
+
+        return not self._refresh["dry_run"]
+
+    def _set_lock_entry(self, rel_path, input_hash, content, generated):
+        entry = {"inputs": input_hash, "sha256": _sha256(content)}
+        if rel_path in MERGEABLE_FILES:
+            entry["base"] = generated
+        self._lock_entries[rel_path] = entry
+
+    def _merge_user_edits(self, path, rel_path, generated):
+        """Mescla em 3 vias um JSON editado pelo usuário com a nova versão gerada.
+
+        Retorna o conteúdo mesclado, ou None quando não há edição do usuário
+        (ou base no lockfile) e o arquivo pode ser escrito normalmente.
+        """
+        previous = self._previous_lock.get(rel_path)
+        if not previous or "base" not in previous or not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            current = f.read()
+        if current == previous["base"]:
+            return None
+
+        try:
+            merged, conflicts = three_way_merge(
+                json.loads(previous["base"]), json.loads(current), json.loads(generated)
+            )
+        except ValueError as e:
+            self.log(f"⚠️ {rel_path} não é um JSON válido, merge ignorado: {str(e)}")
+            return None
+
+        for key in conflicts:
+            self.log(f"⚠️ {rel_path}: '{key}' alterado pelo usuário e pelo gerador, mantendo valor local")
+        self.log(f"🔀 {rel_path} mesclado com as edições locais")
+        return json.dumps(merged, indent=2)
+
+    def _makedirs(self, path):
+        """Cria a pasta; no refresh reporta as pastas novas e, em dry-run, não cria nada"""
+        if os.path.isdir(path):
+            return
+        if self._refresh is not None:
+            missing = []
+            directory = path
+            while not os.path.isdir(directory):
+                rel_path = self._relative_to_package(directory)
+                if not rel_path or rel_path == "." or rel_path.startswith(".."):
+                    break
+                missing.append(rel_path)
+                directory = os.path.dirname(directory)
+            for rel_path in reversed(missing):
+                if rel_path not in self._refresh["dirs"]:
+                    self._refresh["dirs"].add(rel_path)
+                    self._refresh_report(f"{rel_path}/", REFRESH_CREATED, f"+++ b/{rel_path}/ (nova pasta)\n")
+            if self._refresh["dry_run"]:
+                return
+        os.makedirs(path, exist_ok=True)
+
+    def _refresh_report(self, rel_path, status, diff=""):
+        self._refresh["report"].append({"path": rel_path, "status": status, "diff": diff})
+        _files_refreshed.inc(status=status)
+
+    def _create_file(self, path, content, inputs=None, backup=True):
+        """Escreve um arquivo gerado e registra seus hashes no lockfile.
+
+        ``inputs`` substitui o conteúdo no hash de entrada quando o arquivo
+        tem partes voláteis (ex: data no CHANGELOG).
+        """
+        input_hash = _sha256(content if inputs is None else inputs)
+        rel_path = self._relative_to_package(path)
+        generated = content
+
+        merged = None
+        if rel_path in MERGEABLE_FILES:
+            merged = self._merge_user_edits(path, rel_path, generated)
+            if merged is not None:
+                content = merged
+
+        if self._refresh is not None and rel_path:
+            if not self._refresh_should_write(path, rel_path, content, generated, input_hash, merged is not None):
+                return True
+            # Conteúdo anterior era gerado (ou --force): dispensa o backup
+            backup = backup and self._refresh["force"]
 
-    def _create_file(self, path, content):
         try:
             # Garantir que o diretório exista
             dir_path = os.path.dirname(path)
@@ -241,47 +618,59 @@ class PackageGenerator:
                 os.makedirs(dir_path, exist_ok=True)
                 
             # Verificar se o arquivo já existe e fazer backup se necessário
-            if os.path.exists(path):
+            if backup and os.path.exists(path):
                 self.log(f"⚠️ Arquivo já existe, criando backup: {path}")
                 backup_path = f"{path}.bak"
                 try:
                     import shutil
                     shutil.copy2(path, backup_path)
+                    _file_backups.inc()
                 except Exception as backup_error:
                     self.log(f"⚠️ Não foi possível criar backup: {str(backup_error)}")
             
             # Escrever o conteúdo no arquivo
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            self._record_write(content)
                 
             # Verificar se o arquivo foi criado corretamente
             if not os.path.exists(path):
                 raise IOError(f"Falha ao verificar a existência do arquivo após criação: {path}")
-                
+
+            if rel_path:
+                self._set_lock_entry(rel_path, input_hash, content, generated)
             return True
         except Exception as e:
             self.log(f"❌ Erro ao criar arquivo {path}: {str(e)}")
             raise
 
-    def _create_tests_structure(self, base_path, display_name):
+    @staticmethod
+    def _record_write(content):
+        size = len(content.encode('utf-8'))
+        _files_written.inc()
+        _bytes_written.inc(size)
+        _file_size_bytes.observe(size)
+
+    def _create_tests_structure(self, base_path, display_name, assembly_references=None):
         tests_path = os.path.join(base_path, "Tests")
 
         runtime_tests_path = os.path.join(tests_path, "Runtime")
-        os.makedirs(runtime_tests_path, exist_ok=True)
+        self._makedirs(runtime_tests_path)
 
         editor_tests_path = os.path.join(tests_path, "Editor")
-        os.makedirs(editor_tests_path, exist_ok=True)
+        self._makedirs(editor_tests_path)
 
-        namespace = get_namespace_from_display_name(display_name)
+        names = get_package_names(display_name)
+        namespace = names.namespace
 
         runtime_asmdef = {
-            "name": f"{namespace}.Tests",
+            "name": names.runtime_tests_assembly,
             "rootNamespace": namespace,
             "references": [
                 "UnityEngine.TestRunner",
                 "UnityEditor.TestRunner",
                 namespace
-            ],
+            ] + list(assembly_references or []),
             "includePlatforms": [],
             "excludePlatforms": [],
             "allowUnsafeCode": False,
@@ -296,32 +685,107 @@ class PackageGenerator:
         }
 
         self._create_file(
-            os.path.join(runtime_tests_path, f"{namespace}.Tests.asmdef"),
+            os.path.join(runtime_tests_path, f"{names.runtime_tests_assembly}.asmdef"),
             json.dumps(runtime_asmdef, indent=2)
         )
 
         editor_asmdef = runtime_asmdef.copy()
-        editor_asmdef["name"] = f"{namespace}.Editor.Tests"
+        editor_asmdef["name"] = names.editor_tests_assembly
         editor_asmdef["rootNamespace"] = namespace
         editor_asmdef["includePlatforms"] = ["Editor"]
 
         self._create_file(
-            os.path.join(editor_tests_path, f"{namespace}.Editor.Tests.asmdef"),
+            os.path.join(editor_tests_path, f"{names.editor_tests_assembly}.asmdef"),
             json.dumps(editor_asmdef, indent=2)
         )
 
         self.log("🧪 Estrutura de testes criada")
 
-    def _create_samples_structure(self, base_path, display_name):
-        from ui.strings import SAMPLE_FOLDERS_INFO
-
+    def _get_sample_packs(self):
+        """Amostras configuradas em ``sample_packs`` (todas quando vazio)"""
+        root = self.config.get_value(key='sample_templates_dir', default='') or default_templates_root()
+        index = self._sample_indexes.get(root)
+        if index is None:
+            index = self._sample_indexes[root] = SampleTemplateIndex(root)
+        if not index.packs:
+            self.log(f"⚠️ Nenhuma amostra encontrada em {root}, usando apenas os READMEs padrão")
+            return []
+
+        selected = self.config.get_value(key='sample_packs', default='')
+        names = [name.strip() for name in selected.split(',') if name.strip()]
+        packs, missing = index.select(names)
+        for name in missing:
+            self.log(f"⚠️ Amostra '{name}' não encontrada em {root}")
+        return packs
+
+    def _create_samples_structure(self, base_path, display_name, packs=None, values=None):
         samples_path = os.path.join(base_path, "Samples~")
 
-        sample_folders = ["Basic", "Advanced", "Utilities"]
+        if not packs:
+            self._create_default_samples(samples_path, display_name)
+            return
+
+        assets = []
+        for pack in packs:
+            pack_values = dict(values or {}, display_name=display_name, folder=pack.name)
+            # GUIDs por pacote: duas amostras importadas no mesmo projeto não colidem
+            guid_map = pack.guid_map(pack_values.get("package_id", display_name))
+            pack_path = os.path.join(samples_path, pack.name)
+            self._makedirs(pack_path)
+            for sample_file in pack.files:
+                path = os.path.join(pack_path, *render(sample_file.rel_path, pack_values).split("/"))
+                if sample_file.is_binary:
+                    assets.append((sample_file, path))
+                else:
+                    self._create_file(path, sample_file.expand(pack_values, guid_map))
+
+        # Binários vão direto do template para o pacote, sem passar pela memória
+        if assets:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(assets))) as executor:
+                list(executor.map(lambda asset: self._copy_sample_asset(*asset), assets))
+
+        self.log(f"📦 Amostras criadas: {', '.join(pack.name for pack in packs)}")
+
+    def _copy_sample_asset(self, sample_file, path):
+        """Copia um binário de amostra; pula se o lockfile indica a mesma origem e o arquivo existe"""
+        rel_path = self._relative_to_package(path)
+        input_hash = _sha256(f"{sample_file.rel_path}:{sample_file.size}:{sample_file.mtime_ns}")
+        previous = self._previous_lock.get(rel_path) if rel_path else None
+        exists = os.path.exists(path)
+
+        if previous and exists and previous["inputs"] == input_hash:
+            self._lock_entries[rel_path] = previous
+            if self._refresh is not None:
+                self._refresh_report(rel_path, REFRESH_UNCHANGED)
+            return
+
+        if self._refresh is not None and rel_path:
+            self._refresh_report(rel_path, REFRESH_UPDATED if exists else REFRESH_CREATED)
+            if self._refresh["dry_run"]:
+                return
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            copy_file(sample_file.source, path)
+        except OSError as e:
+            self.log(f"❌ Erro ao copiar amostra {path}: {str(e)}")
+            raise
+
+        _files_written.inc()
+        _bytes_written.inc(sample_file.size)
+        _file_size_bytes.observe(sample_file.size)
+        if rel_path:
+            self._lock_entries[rel_path] = {"inputs": input_hash, "size": sample_file.size}
+
+    def _create_default_samples(self, samples_path, display_name):
+        """Estrutura antiga (só READMEs), usada quando não há templates de amostras"""
+        from ui.strings import SAMPLE_FOLDERS_INFO
 
-        for folder in sample_folders:
+        for folder in ["Basic", "Advanced", "Utilities"]:
             folder_path = os.path.join(samples_path, folder)
-            os.makedirs(folder_path, exist_ok=True)
+            self._makedirs(folder_path)
 
             readme_content = SAMPLE_FOLDERS_INFO.get(folder, "").format(
                 display_name=display_name,
@@ -345,7 +809,9 @@ class PackageGenerator:
         changelog_content = CHANGELOG_TEMPLATE.format(
             date=datetime.now().strftime('%Y-%m-%d')
         )
-        self._create_file(os.path.join(base_path, "CHANGELOG.md"), changelog_content)
+        # A data não entra no hash de entrada: o refresh não reescreve o CHANGELOG todo dia
+        self._create_file(os.path.join(base_path, "CHANGELOG.md"), changelog_content,
+                          inputs=CHANGELOG_TEMPLATE)
 
         self.log("📝 Documentação criada")
 
@@ -359,7 +825,8 @@ class PackageGenerator:
                 author=author_name,
                 package=display_name
             )
-            self._create_file(os.path.join(base_path, "LICENSE.md"), license_content)
+            self._create_file(os.path.join(base_path, "LICENSE.md"), license_content,
+                              inputs=LICENSE_MIT.format(year="", author=author_name, package=display_name))
             self.log("📄 Licença MIT criada")
 
     def _validate_json_string(self, json_string, file_name):
@@ -375,7 +842,7 @@ class PackageGenerator:
         from ui.strings import RELEASE_WORKFLOW, RELEASERC_JSON, GITIGNORE_UNITY
 
         github_path = os.path.join(base_path, ".github", "workflows")
-        os.makedirs(github_path, exist_ok=True)
+        self._makedirs(github_path)
 
         # Validar e criar o arquivo release.yml
         self._create_file(
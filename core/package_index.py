@@ -0,0 +1,202 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.version_utils import get_package_names
+
+INDEX_VERSION = 1
+
+# Pastas que nunca contêm pacotes de interesse (e podem ser enormes)
+SKIPPED_DIRS = {"Library", "Temp", "Logs", "obj", "Build", "Builds", "UserSettings", "node_modules"}
+
+
+def _is_skipped(name):
+    return name.startswith(".") or name.endswith("~") or name in SKIPPED_DIRS
+
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return json.load(f)
+
+
+class PackageIndex:
+    """Índice dos pacotes UPM (package.json e .asmdef) existentes sob uma pasta.
+
+    A varredura usa os.scandir e só reabre arquivos cujo ``mtime``/tamanho
+    mudou desde a última vez; o cache pode ser persistido em JSON. Depois de
+    ``scan()``, nomes, pastas e namespaces são consultados em O(1).
+    """
+
+    def __init__(self, root, cache_path=None, workers=1):
+        self.root = root
+        self.cache_path = cache_path
+        self.workers = max(1, int(workers))
+        # caminho do arquivo -> {"mtime_ns", "size", "data"}
+        self._files = {}
+        self.packages = {}
+        self.by_name = {}
+        self.by_folder = {}
+        self.by_namespace = {}
+        self.stats = {"parsed": 0, "cached": 0}
+        if cache_path:
+            self._load_cache()
+
+    def _load_cache(self):
+        try:
+            cache = _read_json(self.cache_path)
+        except (OSError, ValueError):
+            return
+        if cache.get("version") == INDEX_VERSION and cache.get("root") == os.path.abspath(self.root):
+            self._files = cache.get("files", {})
+
+    def save(self):
+        if not self.cache_path:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "root": os.path.abspath(self.root), "files": self._files}, f)
+
+    def scan(self):
+        """Varre a pasta e reconstrói as tabelas de consulta"""
+        found = []
+        if os.path.isdir(self.root):
+            subdirs = self._scan_dir(self.root, found)
+            if self.workers > 1 and len(subdirs) > 1:
+                # Cada subárvore é percorrida em paralelo; scandir libera o GIL nas chamadas ao SO
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    for partial in pool.map(self._walk, subdirs):
+                        found.extend(partial)
+            else:
+                for directory in subdirs:
+                    found.extend(self._walk(directory))
+
+        self.stats = {"parsed": 0, "cached": 0}
+        self._files = self._read_found(found, {})
+        self._build_tables()
+        return self
+
+    def update_subtree(self, directory):
+        """Revarre só ``directory`` (ex: um pacote recém-gerado) e atualiza as tabelas"""
+        prefix = os.path.join(directory, "")
+        found = self._walk(directory) if os.path.isdir(directory) else []
+        kept = {path: entry for path, entry in self._files.items() if not path.startswith(prefix)}
+        self.stats = {"parsed": 0, "cached": 0}
+        self._files = self._read_found(found, kept)
+        self._build_tables()
+        return self
+
+    def _read_found(self, found, files):
+        # Reaproveita o que não mudou (mtime e tamanho iguais) e relê o resto
+        for path, mtime_ns, size in found:
+            cached = self._files.get(path)
+            if cached and cached["mtime_ns"] == mtime_ns and cached["size"] == size:
+                files[path] = cached
+                self.stats["cached"] += 1
+                continue
+            try:
+                data = self._extract(path, _read_json(path))
+            except (OSError, ValueError) as e:
+                data = {"error": str(e)}
+            files[path] = {"mtime_ns": mtime_ns, "size": size, "data": data}
+            self.stats["parsed"] += 1
+        return files
+
+    def _walk(self, directory):
+        found = []
+        stack = [directory]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop(), found))
+        return found
+
+    @staticmethod
+    def _scan_dir(directory, found):
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_skipped(name):
+                            subdirs.append(entry.path)
+                    elif name == "package.json" or name.endswith(".asmdef"):
+                        stat = entry.stat()
+                        found.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            pass
+        return subdirs
+
+    @staticmethod
+    def _extract(path, data):
+        # Guarda só o necessário para as consultas
+        if path.endswith(".asmdef"):
+            return {"name": data.get("name"), "rootNamespace": data.get("rootNamespace")}
+        return {"name": data.get("name"), "version": data.get("version"), "displayName": data.get("displayName")}
+
+    def _build_tables(self):
+        self.packages = {}
+        asmdefs = []
+        for path, entry in self._files.items():
+            data = entry["data"]
+            if "error" in data:
+                continue
+            if os.path.basename(path) == "package.json":
+                package_path = os.path.dirname(path)
+                self.packages[package_path] = dict(data, path=package_path, assemblies=[])
+            else:
+                asmdefs.append((path, data))
+
+        self.by_name = {}
+        self.by_folder = {}
+        for package_path, package in self.packages.items():
+            if package["name"]:
+                self.by_name.setdefault(package["name"], []).append(package_path)
+            self.by_folder.setdefault(os.path.basename(package_path).lower(), []).append(package_path)
+
+        self.by_namespace = {}
+        for path, data in asmdefs:
+            owner = self._owner_package(os.path.dirname(path))
+            if owner:
+                self.packages[owner]["assemblies"].append(data["name"])
+            for namespace in {data["name"], data["rootNamespace"]} - {None, ""}:
+                self.by_namespace.setdefault(namespace, []).append(owner or path)
+
+    def _owner_package(self, directory):
+        while True:
+            if directory in self.packages:
+                return directory
+            parent = os.path.dirname(directory)
+            if parent == directory or len(parent) < len(self.root):
+                return None
+            directory = parent
+
+    def errors(self):
+        return {path: entry["data"]["error"] for path, entry in self._files.items() if "error" in entry["data"]}
+
+    def find_conflicts(self, package_id, display_name, exclude_path=None, folder=None):
+        """Lista colisões de um novo pacote com os já indexados (nome UPM, pasta, namespace)"""
+        exclude = os.path.normcase(os.path.abspath(exclude_path)) if exclude_path else None
+
+        def others(paths):
+            return [p for p in paths if os.path.normcase(os.path.abspath(p)) != exclude]
+
+        conflicts = []
+        for path in others(self.by_name.get(package_id, [])):
+            version = self.packages[path]["version"]
+            conflicts.append(f"Pacote '{package_id}' já existe em {path} (versão {version})")
+        names = get_package_names(display_name)
+        folder = (folder or names.repo_name).lower()
+        for path in others(self.by_folder.get(folder, [])):
+            conflicts.append(f"Pasta '{folder}' já usada por {path}")
+        namespace = names.namespace
+        for path in sorted(set(others(self.by_namespace.get(namespace, [])))):
+            conflicts.append(f"Namespace '{namespace}' já usado em {path}")
+        return conflicts
+
+    def duplicates(self):
+        """Nomes de pacote e namespaces definidos em mais de um lugar"""
+        return {
+            "names": {name: paths for name, paths in self.by_name.items() if len(paths) > 1},
+            "namespaces": {
+                namespace: sorted(set(paths)) for namespace, paths in self.by_namespace.items()
+                if len(set(paths)) > 1
+            },
+        }
@@ -0,0 +1,244 @@
+import os
+import re
+import io
+import gzip
+import json
+import base64
+import hashlib
+import tarfile
+
+DEFAULT_COMPRESS_LEVEL = 9
+
+# Mesma data fixa usada pelo npm nas entradas do tarball (1985-10-26T08:15:00Z)
+NPM_FIXED_MTIME = 499162500
+
+# Sempre fora do tarball (como no npm), mais os arquivos internos do gerador
+ALWAYS_IGNORED = [
+    ".npmignore", ".gitignore", ".git", "CVS", ".svn", ".hg", ".lock-wscript", ".wafpickle-*",
+    ".*.swp", ".DS_Store", "._*",
+    "npm-debug.log", ".npmrc", "node_modules", "config.gypi", "*.orig", "package-lock.json",
+    ".upf-lock.json", "*.bak",
+]
+# Sempre dentro do tarball, mesmo fora de "files" (apenas na raiz)
+ALWAYS_INCLUDED = re.compile(r"^(package\.json|readme(\..*)?|licen[cs]e(\..*)?)$", re.IGNORECASE)
+
+
+def _translate(pattern):
+    """Converte um glob no estilo .gitignore em regex (sem âncoras)"""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("(?:/.*)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape("["))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+class IgnoreRule:
+    __slots__ = ("regex", "negated", "dir_only")
+
+    def __init__(self, pattern):
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "^" if anchored else "^(?:.*/)?"
+        self.regex = re.compile(prefix + _translate(pattern) + "$")
+
+    def matches(self, relative_path, is_dir):
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.match(relative_path) is not None
+
+
+def parse_ignore_file(text):
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if line and not line.startswith("#"):
+            rules.append(IgnoreRule(line))
+    return rules
+
+
+class _FilesFilter:
+    """Filtro do campo "files" do package.json"""
+
+    def __init__(self, patterns):
+        self.rules = []
+        for pattern in patterns:
+            if pattern.startswith("./"):
+                pattern = pattern[2:]
+            pattern = pattern.strip("/")
+            if pattern:
+                self.rules.append(IgnoreRule("/" + pattern))
+
+    def matches_file(self, relative_path):
+        if ALWAYS_INCLUDED.match(relative_path):
+            return True
+        # Um arquivo entra se ele ou alguma pasta acima dele casar com "files"
+        path = relative_path
+        while path:
+            if any(rule.matches(path, True) for rule in self.rules):
+                return True
+            path = path.rpartition("/")[0]
+        return False
+
+
+def list_package_files(package_path):
+    """Arquivos que entram no tarball, relativos à raiz e ordenados (como ``npm pack --dry-run``)"""
+    manifest = _read_manifest(package_path)
+    files_filter = _FilesFilter(manifest["files"]) if isinstance(manifest.get("files"), list) else None
+    always_ignored = [IgnoreRule(pattern) for pattern in ALWAYS_IGNORED]
+
+    result = []
+    # Pilha de (pasta absoluta, caminho relativo, regras herdadas como [(base, regras)])
+    stack = [(package_path, "", [])]
+    while stack:
+        directory, relative_dir, inherited = stack.pop()
+        rules = inherited + _load_dir_rules(directory, relative_dir)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir and not entry.is_file(follow_symlinks=False):
+                    continue
+                relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                if any(rule.matches(entry.name, is_dir) for rule in always_ignored):
+                    continue
+                if _is_ignored(rules, relative, is_dir) and not ALWAYS_INCLUDED.match(relative):
+                    continue
+                if is_dir:
+                    stack.append((entry.path, relative, rules))
+                elif files_filter is None or files_filter.matches_file(relative):
+                    result.append(relative)
+    return sorted(result)
+
+
+def _load_dir_rules(directory, relative_dir):
+    # .npmignore tem prioridade; sem ele, o npm usa o .gitignore
+    for name in (".npmignore", ".gitignore"):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return [(relative_dir, parse_ignore_file(f.read()))]
+    return []
+
+
+def _is_ignored(rules, relative_path, is_dir):
+    ignored = False
+    for base, base_rules in rules:
+        local = relative_path[len(base) + 1:] if base else relative_path
+        for rule in base_rules:
+            if rule.matches(local, is_dir):
+                ignored = not rule.negated
+    return ignored
+
+
+def _read_manifest(package_path):
+    with open(os.path.join(package_path, "package.json"), 'r', encoding='utf-8-sig') as f:
+        manifest = json.load(f)
+    if not manifest.get("name") or not manifest.get("version"):
+        raise ValueError(f"package.json sem name/version em {package_path}")
+    return manifest
+
+
+def tarball_name(name, version):
+    """Nome do arquivo igual ao do npm (``@scope/nome`` vira ``scope-nome``)"""
+    return f"{name.lstrip('@').replace('/', '-')}-{version}.tgz"
+
+
+class _HashingWriter(io.RawIOBase):
+    """Repassa a escrita para o arquivo calculando sha1/sha512 em streaming"""
+
+    def __init__(self, target):
+        self.target = target
+        self.sha1 = hashlib.sha1()
+        self.sha512 = hashlib.sha512()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.sha1.update(data)
+        self.sha512.update(data)
+        self.size += len(data)
+        return self.target.write(data)
+
+
+def pack_package(package_path, output_dir=".", compresslevel=DEFAULT_COMPRESS_LEVEL):
+    """Gera o .tgz do pacote de forma determinística (mesma entrada, mesmos bytes).
+
+    As entradas ficam sob ``package/``, ordenadas, com dono/data fixos e
+    permissões normalizadas. Os arquivos são lidos e comprimidos em
+    streaming. Retorna os metadados do tarball, incluindo ``integrity``.
+    """
+    manifest = _read_manifest(package_path)
+    files = list_package_files(package_path)
+    filename = tarball_name(manifest["name"], manifest["version"])
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, filename)
+    temp_path = output_path + ".tmp"
+
+    unpacked_size = 0
+    with open(temp_path, 'wb') as raw:
+        writer = _HashingWriter(raw)
+        # mtime=0 e sem nome no cabeçalho gzip para manter o resultado reprodutível
+        with gzip.GzipFile(filename="", mode='wb', fileobj=writer, compresslevel=compresslevel, mtime=0) as gz:
+            with tarfile.open(fileobj=gz, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                for relative in files:
+                    source = os.path.join(package_path, *relative.split("/"))
+                    stat = os.stat(source)
+                    info = tarfile.TarInfo(f"package/{relative}")
+                    info.size = stat.st_size
+                    info.mtime = NPM_FIXED_MTIME
+                    info.mode = 0o755 if stat.st_mode & 0o111 else 0o644
+                    info.uid = info.gid = 0
+                    info.uname = info.gname = ""
+                    # addfile copia em blocos, sem carregar o arquivo inteiro
+                    with open(source, 'rb') as f:
+                        tar.addfile(info, f)
+                    unpacked_size += stat.st_size
+    os.replace(temp_path, output_path)
+
+    return {
+        "name": manifest["name"],
+        "version": manifest["version"],
+        "package_path": package_path,
+        "filename": filename,
+        "path": output_path,
+        "files": files,
+        "size": writer.size,
+        "unpacked_size": unpacked_size,
+        "shasum": writer.sha1.hexdigest(),
+        "integrity": "sha512-" + base64.b64encode(writer.sha512.digest()).decode("ascii"),
+    }
+
@@ -0,0 +1,115 @@
+import os
+import json
+import base64
+from urllib.parse import quote
+
+from utils.lazy_import import lazy_import
+from utils.tracing import span
+from utils import metrics
+
+requests = lazy_import("requests")
+
+PUBLISH_PUBLISHED = "published"
+PUBLISH_SKIPPED = "skipped"
+PUBLISH_CONFLICT = "conflict"
+PUBLISH_ERROR = "error"
+
+_publish_results = metrics.counter(
+    "upf_registry_publish_total", "Publicações no registry por resultado", ("result",)
+)
+_upload_bytes = metrics.counter("upf_registry_upload_bytes_total", "Bytes de tarballs enviados ao registry")
+
+
+class RegistryPublisher:
+    """Publica tarballs em um registry compatível com npm (ex: scoped registry da Unity).
+
+    Uma única ``requests.Session`` mantém as conexões abertas (keep-alive)
+    entre publicações. Antes de enviar, o packument é consultado: versões já
+    publicadas com o mesmo hash são puladas, com hash diferente viram conflito.
+    """
+
+    def __init__(self, registry_url, token=None, timeout=60):
+        self.registry_url = registry_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["Accept"] = "application/json"
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        self._packuments = {}
+
+    def close(self):
+        self.session.close()
+
+    def _package_url(self, name):
+        # Nomes com escopo (@scope/nome) são enviados como @scope%2fnome
+        return f"{self.registry_url}/{quote(name, safe='@')}"
+
+    def get_packument(self, name, refresh=False):
+        """Packument do pacote no registry (None se ainda não existir), com cache por nome"""
+        if refresh or name not in self._packuments:
+            response = self.session.get(self._package_url(name), timeout=self.timeout)
+            if response.status_code == 404:
+                self._packuments[name] = None
+            else:
+                response.raise_for_status()
+                self._packuments[name] = response.json()
+        return self._packuments[name]
+
+    def publish(self, pack_result, tag="latest"):
+        """Publica o resultado de ``pack_package``; retorna ``(status, mensagem)``"""
+        name, version = pack_result["name"], pack_result["version"]
+        with span("registry.publish", package=name, version=version) as current:
+            status, message = self._publish(pack_result, tag)
+            current.set_attribute("result", status)
+        _publish_results.inc(result=status)
+        return status, message
+
+    def _publish(self, pack_result, tag):
+        name, version = pack_result["name"], pack_result["version"]
+        try:
+            packument = self.get_packument(name)
+            existing = (packument or {}).get("versions", {}).get(version)
+            if existing:
+                dist = existing.get("dist", {})
+                if dist.get("integrity") == pack_result["integrity"] or dist.get("shasum") == pack_result["shasum"]:
+                    return PUBLISH_SKIPPED, f"{name}@{version} já publicado (mesmo hash)"
+                return PUBLISH_CONFLICT, f"{name}@{version} já publicado com conteúdo diferente"
+
+            with open(pack_result["path"], 'rb') as f:
+                data = f.read()
+            with open(os.path.join(pack_result["package_path"], "package.json"), 'r', encoding='utf-8-sig') as f:
+                manifest = json.load(f)
+
+            document = {
+                "_id": name,
+                "name": name,
+                "description": manifest.get("description", ""),
+                "dist-tags": {tag: version},
+                "versions": {
+                    version: dict(manifest, _id=f"{name}@{version}", dist={
+                        "shasum": pack_result["shasum"],
+                        "integrity": pack_result["integrity"],
+                        "tarball": f"{self._package_url(name)}/-/{pack_result['filename']}",
+                    }),
+                },
+                "_attachments": {
+                    pack_result["filename"]: {
+                        "content_type": "application/octet-stream",
+                        "data": base64.b64encode(data).decode("ascii"),
+                        "length": len(data),
+                    },
+                },
+            }
+            response = self.session.put(self._package_url(name), json=document, timeout=self.timeout)
+            if response.status_code in (200, 201):
+                _upload_bytes.inc(len(data))
+                # Mantém o cache coerente sem uma nova consulta
+                cached = self._packuments.get(name) or {"name": name, "versions": {}}
+                cached["versions"][version] = document["versions"][version]
+                self._packuments[name] = cached
+                return PUBLISH_PUBLISHED, f"{name}@{version} publicado"
+            if response.status_code in (403, 409):
+                return PUBLISH_CONFLICT, f"{name}@{version} recusado pelo registry: {response.text}"
+            return PUBLISH_ERROR, f"Erro HTTP {response.status_code}: {response.text}"
+        except Exception as e:
+            return PUBLISH_ERROR, f"Erro ao publicar {name}@{version}: {str(e)}"
@@ -0,0 +1,235 @@
+import os
+import json
+import base64
+import hashlib
+import threading
+from datetime import datetime, timezone
+from urllib.parse import unquote
+
+from utils.version_utils import compare_versions
+
+DEFAULT_REGISTRY_HOST = "127.0.0.1"
+DEFAULT_REGISTRY_PORT = 4873
+INDEX_FILE = "index.json"
+
+
+class RegistryError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _write_json_atomic(path, data):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+class FileRegistry:
+    """Registry npm em disco, usado como substituto local de um scoped registry.
+
+    Estrutura::
+
+        <root>/index.json                     nome -> versão latest e descrição
+        <root>/<nome>/packument.json          documento do pacote (versões, dist-tags)
+        <root>/<nome>/-/<nome>-<versão>.tgz   tarballs
+
+    O packument e o índice são atualizados de forma incremental a cada
+    publicação, sem reler os tarballs.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _package_dir(self, name):
+        if not name or ".." in name or name.startswith(("/", ".")):
+            raise RegistryError(400, f"Nome de pacote inválido: {name}")
+        return os.path.join(self.root, *name.split("/"))
+
+    def get_packument(self, name):
+        path = os.path.join(self._package_dir(name), "packument.json")
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def tarball_path(self, name, filename):
+        if "/" in filename or "\\" in filename or not filename.endswith(".tgz"):
+            raise RegistryError(400, f"Tarball inválido: {filename}")
+        return os.path.join(self._package_dir(name), "-", filename)
+
+    def get_index(self):
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.isfile(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def publish(self, document):
+        """Aplica um documento de ``npm publish`` (uma versão + anexo em base64).
+
+        Retorna ``(status, mensagem)``; a mesma versão com o mesmo conteúdo é
+        aceita sem alterações, com conteúdo diferente é recusada.
+        """
+        name = document.get("name")
+        versions = document.get("versions") or {}
+        attachments = document.get("_attachments") or {}
+        if len(versions) != 1 or len(attachments) != 1:
+            raise RegistryError(400, "O documento deve conter exatamente uma versão e um anexo")
+
+        (version, manifest), = versions.items()
+        (filename, attachment), = attachments.items()
+        data = base64.b64decode(attachment.get("data", ""))
+        shasum = hashlib.sha1(data).hexdigest()
+        dist = manifest.get("dist") or {}
+        if dist.get("shasum") and dist["shasum"] != shasum:
+            raise RegistryError(400, "shasum do anexo não confere com dist.shasum")
+
+        with self._lock:
+            packument = self.get_packument(name) or {
+                "_id": name, "name": name, "versions": {}, "dist-tags": {}, "time": {"created": _now()}
+            }
+            existing = packument["versions"].get(version)
+            if existing:
+                if existing["dist"]["shasum"] == shasum:
+                    return 200, f"{name}@{version} já publicado com o mesmo conteúdo"
+                raise RegistryError(409, f"{name}@{version} já publicado com conteúdo diferente")
+
+            tarball_path = self.tarball_path(name, filename)
+            os.makedirs(os.path.dirname(tarball_path), exist_ok=True)
+            with open(tarball_path + ".tmp", 'wb') as f:
+                f.write(data)
+            os.replace(tarball_path + ".tmp", tarball_path)
+
+            entry = dict(manifest)
+            entry["_id"] = f"{name}@{version}"
+            # URL relativa; o servidor completa com o host de quem pediu
+            entry["dist"] = dict(dist, shasum=shasum, tarball=f"{name}/-/{filename}")
+            packument["versions"][version] = entry
+            packument["time"][version] = packument["time"]["modified"] = _now()
+            latest = packument["dist-tags"].get("latest")
+            if not latest or compare_versions(version, latest) > 0:
+                packument["dist-tags"]["latest"] = version
+                # Metadados de topo acompanham a versão latest
+                for key in ("description", "displayName", "keywords"):
+                    if key in manifest:
+                        packument[key] = manifest[key]
+            _write_json_atomic(os.path.join(self._package_dir(name), "packument.json"), packument)
+
+            index = self.get_index()
+            index[name] = {
+                "latest": packument["dist-tags"]["latest"],
+                "description": packument.get("description", ""),
+                "displayName": packument.get("displayName", ""),
+                "versions": len(packument["versions"]),
+            }
+            _write_json_atomic(os.path.join(self.root, INDEX_FILE), index)
+
+        return 201, f"{name}@{version} publicado"
+
+    def search(self, text="", size=250, offset=0):
+        """Resposta no formato de /-/v1/search (usado pelo Package Manager da Unity)"""
+        text = (text or "").lower()
+        objects = []
+        for name, info in sorted(self.get_index().items()):
+            if text and text not in name.lower() and text not in info.get("displayName", "").lower():
+                continue
+            objects.append({"package": {
+                "name": name,
+                "version": info["latest"],
+                "description": info.get("description", ""),
+                "displayName": info.get("displayName", ""),
+            }})
+        return {"objects": objects[offset:offset + size], "total": len(objects), "time": _now()}
+
+
+def create_registry_server(root, host=DEFAULT_REGISTRY_HOST, port=DEFAULT_REGISTRY_PORT, token=None):
+    """Servidor HTTP compatível com npm sobre um ``FileRegistry``.
+
+    Rotas: ``GET /<nome>`` (packument), ``GET /<nome>/-/<arquivo>.tgz``,
+    ``PUT /<nome>`` (npm publish) e ``GET /-/v1/search``. Se ``token`` for
+    informado, o PUT exige ``Authorization: Bearer <token>``.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlsplit, parse_qs
+
+    registry = FileRegistry(root)
+
+    class RegistryHandler(BaseHTTPRequestHandler):
+        # Keep-alive para o cliente reaproveitar a conexão entre publicações
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body, content_type="application/json"):
+            if isinstance(body, (dict, list)):
+                body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _base_url(self):
+            return f"http://{self.headers.get('Host') or f'{host}:{port}'}"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            path = unquote(parts.path).strip("/")
+            try:
+                if path == "-/v1/search":
+                    query = parse_qs(parts.query)
+                    self._send(200, registry.search(
+                        query.get("text", [""])[0],
+                        int(query.get("size", ["250"])[0]),
+                        int(query.get("from", ["0"])[0]),
+                    ))
+                elif "/-/" in path:
+                    name, filename = path.rsplit("/-/", 1)
+                    tarball_path = registry.tarball_path(name, filename)
+                    if not os.path.isfile(tarball_path):
+                        self._send(404, {"error": "not_found"})
+                        return
+                    with open(tarball_path, 'rb') as f:
+                        self._send(200, f.read(), "application/octet-stream")
+                else:
+                    packument = registry.get_packument(path)
+                    if packument is None:
+                        self._send(404, {"error": "not_found"})
+                        return
+                    base_url = self._base_url()
+                    for entry in packument["versions"].values():
+                        entry["dist"]["tarball"] = f"{base_url}/{entry['dist']['tarball']}"
+                    self._send(200, packument)
+            except RegistryError as e:
+                self._send(e.status, {"error": str(e)})
+
+        def do_PUT(self):
+            # Lê o corpo mesmo quando recusa, para não quebrar a conexão keep-alive
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if token and self.headers.get("Authorization") != f"Bearer {token}":
+                self._send(401, {"error": "unauthorized"})
+                return
+            try:
+                document = json.loads(body.decode("utf-8"))
+                name = unquote(urlsplit(self.path).path).strip("/")
+                if document.get("name") != name:
+                    raise RegistryError(400, "Nome do documento não confere com a URL")
+                status, message = registry.publish(document)
+                self._send(status, {"ok": message})
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+            except RegistryError as e:
+                self._send(e.status, {"error": str(e)})
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), RegistryHandler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,231 @@
+import os
+import re
+import sys
+import json
+import errno
+import shutil
+import hashlib
+import threading
+
+SAMPLES_TEMPLATE_DIR = os.path.join("templates", "samples")
+SAMPLE_MANIFEST = "sample.json"
+
+# Arquivos de texto com placeholders {{nome}}; qualquer outra extensão é copiada byte a byte
+TEXT_EXTENSIONS = {
+    ".md", ".txt", ".cs", ".json", ".asmdef", ".asmref", ".shader", ".hlsl", ".cginc",
+    ".uss", ".uxml", ".xml", ".yml", ".yaml",
+}
+# Acima disso o arquivo é tratado como binário mesmo com extensão de texto
+MAX_TEXT_TEMPLATE_SIZE = 1024 * 1024
+# Assets serializados pela Unity que referenciam outros por GUID. Em modo texto (YAML) os GUIDs
+# da própria amostra são trocados; em modo binário o arquivo é copiado como está
+UNITY_YAML_EXTENSIONS = {
+    ".meta", ".unity", ".prefab", ".mat", ".asset", ".controller", ".overridecontroller", ".anim",
+    ".mask", ".physicmaterial", ".physicsmaterial2d", ".playable", ".signal", ".spriteatlas",
+    ".lighting", ".rendertexture", ".mixer", ".guiskin", ".fontsettings", ".terrainlayer", ".brush",
+}
+_UNITY_YAML_HEADER = "%YAML"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_GUID = re.compile(r"(\bguid:\s*)([0-9a-fA-F]{32})\b")
+
+
+def _escape_csharp(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _escape_json(value):
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+# Escape dos valores por tipo de arquivo: um nome com aspas não pode quebrar literais
+ESCAPERS = {".cs": _escape_csharp, ".json": _escape_json, ".asmdef": _escape_json, ".asmref": _escape_json}
+
+
+def default_templates_root():
+    """templates/samples do executável (PyInstaller) ou da instalação, independente do cwd"""
+    base_path = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, SAMPLES_TEMPLATE_DIR)
+
+# ioctl FICLONE do Linux (cópia por reflink em btrfs/xfs); sem suporte cai na cópia normal
+_FICLONE = 0x40049409
+_REFLINK_ERRORS = {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EBADF}
+_reflink_unsupported = set()
+_reflink_lock = threading.Lock()
+
+
+def render(text, values, escape=None):
+    """Substitui {{chave}} pelos valores; chaves desconhecidas ficam como estão"""
+    def replace(match):
+        if match.group(1) not in values:
+            return match.group(0)
+        value = str(values[match.group(1)])
+        return escape(value) if escape else value
+
+    return _PLACEHOLDER.sub(replace, text)
+
+
+def remap_guids(text, guid_map):
+    """Troca os GUIDs (``guid: ...``) presentes em ``guid_map``; referências externas ficam"""
+    if not guid_map:
+        return text
+    return _GUID.sub(lambda m: m.group(1) + guid_map.get(m.group(2).lower(), m.group(2)), text)
+
+
+def _reflink(source, destination):
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    devices = (os.stat(source).st_dev, os.stat(os.path.dirname(destination) or ".").st_dev)
+    if devices in _reflink_unsupported:
+        return False
+
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            if e.errno in _REFLINK_ERRORS:
+                with _reflink_lock:
+                    _reflink_unsupported.add(devices)
+                return False
+            raise
+
+
+def copy_file(source, destination):
+    """Copia um arquivo sem carregá-lo em memória: reflink quando o sistema de
+    arquivos suporta, senão ``shutil.copyfile`` (sendfile/cópia em blocos)."""
+    if not _reflink(source, destination):
+        shutil.copyfile(source, destination)
+    shutil.copymode(source, destination)
+
+
+class SampleFile:
+    __slots__ = ("rel_path", "source", "size", "mtime_ns", "template", "placeholders")
+
+    def __init__(self, rel_path, source, size, mtime_ns, template=None, placeholders=False):
+        self.rel_path = rel_path
+        self.source = source
+        self.size = size
+        self.mtime_ns = mtime_ns
+        # Conteúdo para arquivos de texto; None para binários (copiados do disco)
+        self.template = template
+        # False para YAML da Unity: só os GUIDs são trocados
+        self.placeholders = placeholders
+
+    @property
+    def is_binary(self):
+        return self.template is None
+
+    def expand(self, values, guid_map=None):
+        text = self.template
+        if self.placeholders:
+            text = render(text, values, ESCAPERS.get(os.path.splitext(self.rel_path)[1].lower()))
+        return remap_guids(text, guid_map)
+
+
+class SamplePack:
+    """Uma amostra em templates/samples/<nome>/, registrada em ``samples`` do package.json"""
+
+    def __init__(self, name, path, manifest, files):
+        self.name = name
+        self.path = path
+        self.display_name = manifest.get("displayName", name)
+        self.description = manifest.get("description", "")
+        self.order = manifest.get("order", 0)
+        self.files = files
+        # GUIDs definidos pelos .meta da amostra
+        self.guids = set()
+        for sample_file in files:
+            if sample_file.rel_path.endswith(".meta") and not sample_file.is_binary:
+                self.guids.update(m.group(2).lower() for m in _GUID.finditer(sample_file.template))
+
+    def guid_map(self, seed):
+        """GUIDs novos e estáveis por pacote (``seed``), mantendo as referências internas da amostra"""
+        return {guid: hashlib.md5(f"{seed}:{guid}".encode("utf-8")).hexdigest() for guid in self.guids}
+
+    def entry(self, values):
+        return {
+            "displayName": render(self.display_name, values),
+            "description": render(self.description, values),
+            "path": f"Samples~/{self.name}",
+        }
+
+
+class SampleTemplateIndex:
+    """Índice dos pacotes de amostras, lido uma única vez por processo.
+
+    Textos ficam em memória (são pequenos e renderizados por pacote);
+    binários guardam só caminho, tamanho e mtime e são copiados direto
+    do disco a cada expansão.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.packs = {}
+        if os.path.isdir(root):
+            with os.scandir(root) as entries:
+                packs = [
+                    self._load_pack(entry.name, entry.path) for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+            # "order" do sample.json define a ordem no Package Manager; empate por nome
+            for pack in sorted(packs, key=lambda p: (p.order, p.name)):
+                self.packs[pack.name] = pack
+
+    @staticmethod
+    def _load_pack(name, path):
+        manifest = {}
+        manifest_path = os.path.join(path, SAMPLE_MANIFEST)
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+        files = []
+        stack = [(path, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    rel_path = prefix + entry.name
+                    if entry.is_dir():
+                        stack.append((entry.path, rel_path + "/"))
+                        continue
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if rel_path == SAMPLE_MANIFEST or rel_path == SAMPLE_MANIFEST + ".meta":
+                        continue
+                    stat = entry.stat()
+                    template = None
+                    placeholders = False
+                    if extension in TEXT_EXTENSIONS and stat.st_size <= MAX_TEXT_TEMPLATE_SIZE:
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            template = f.read()
+                        placeholders = True
+                    elif extension in UNITY_YAML_EXTENSIONS:
+                        template = SampleTemplateIndex._read_unity_yaml(entry.path)
+                    files.append(SampleFile(rel_path, entry.path, stat.st_size, stat.st_mtime_ns,
+                                            template, placeholders))
+        files.sort(key=lambda f: f.rel_path)
+        return SamplePack(name, path, manifest, files)
+
+    @staticmethod
+    def _read_unity_yaml(path):
+        # .meta e assets em modo texto; assets em modo binário voltam None (cópia direta)
+        with open(path, 'rb') as f:
+            head = f.read(len(_UNITY_YAML_HEADER))
+        if not path.endswith(".meta") and head != _UNITY_YAML_HEADER.encode("ascii"):
+            return None
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+
+    def select(self, names=None):
+        """Amostras pedidas (todas quando ``names`` vazio) e os nomes não encontrados"""
+        if not names:
+            return list(self.packs.values()), []
+        found = [self.packs[name] for name in names if name in self.packs]
+        missing = [name for name in names if name not in self.packs]
+        return found, missing
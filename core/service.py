@@ -0,0 +1,398 @@
+import json
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from core.package_generator import PackageGenerator
+from core.job_journal import JobSteps, STEP_GENERATE
+from utils import metrics
+
+DEFAULT_SERVICE_HOST = "127.0.0.1"
+DEFAULT_SERVICE_PORT = 8765
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 100
+DEFAULT_MAX_FINISHED_JOBS = 1000
+# Intervalo em que o reenfileiramento de jobs retomados confere se o serviço foi parado
+RESUME_PUT_TIMEOUT = 0.5
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Campos aceitos em um job e o parâmetro correspondente de create_package_structure
+GENERATION_FIELDS = {
+    "base_path": "base_path",
+    "name": "name",
+    "display_name": "display_name",
+    "description": "description",
+    "version": "version",
+    "create_samples": "create_samples",
+    "create_runtime": "create_runtime",
+    "create_editor": "create_editor",
+    "create_tests": "create_tests",
+    "create_github": "create_github",
+    "license_type": "license_type",
+    "unity_dependencies": "unity_dependencies",
+}
+GITHUB_FIELDS = {"create_repo", "private"}
+
+_jobs_submitted = metrics.counter("upf_service_jobs_submitted_total", "Jobs recebidos pelo serviço")
+_jobs_finished = metrics.counter("upf_service_jobs_finished_total", "Jobs finalizados por status", ("status",))
+_jobs_rejected = metrics.counter("upf_service_jobs_rejected_total", "Jobs recusados por motivo", ("reason",))
+_job_wait_seconds = metrics.histogram("upf_service_job_wait_seconds", "Tempo de espera na fila")
+
+
+class JobValidationError(ValueError):
+    """Parâmetros de job inválidos"""
+
+
+class QueueFullError(RuntimeError):
+    """Fila de jobs cheia"""
+
+
+class Job:
+    def __init__(self, params, job_id=None, created_at=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.params = params
+        self.status = JOB_QUEUED
+        self.created_at = created_at or datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.logs = []
+
+    def to_dict(self, include_logs=False):
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "params": self.params,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "result": self.result,
+            "error": self.error,
+        }
+        if include_logs:
+            data["logs"] = list(self.logs)
+        return data
+
+
+def validate_job_params(params):
+    """Valida e normaliza os parâmetros de um job de geração"""
+    if not isinstance(params, dict):
+        raise JobValidationError("O corpo do job deve ser um objeto JSON")
+
+    unknown = set(params) - set(GENERATION_FIELDS) - GITHUB_FIELDS
+    if unknown:
+        raise JobValidationError(f"Campos desconhecidos: {', '.join(sorted(unknown))}")
+
+    if not params.get("display_name"):
+        raise JobValidationError("Campo obrigatório: display_name")
+    if not params.get("base_path"):
+        raise JobValidationError("Campo obrigatório: base_path")
+
+    normalized = dict(params)
+    normalized.setdefault("name", normalized["display_name"])
+    normalized.setdefault("description", "")
+
+    dependencies = normalized.get("unity_dependencies")
+    if dependencies is not None and not isinstance(dependencies, dict):
+        raise JobValidationError("unity_dependencies deve ser um objeto {package_id: versão}")
+
+    return normalized
+
+
+class GenerationService:
+    """Serviço de geração com fila de jobs e limite de concorrência.
+
+    Mantém ``ConfigManager`` e ``GitHubManager`` aquecidos; cada worker tem
+    seu próprio ``PackageGenerator``, já que o gerador guarda estado da
+    operação em andamento. Com um ``JobJournal``, jobs e etapas concluídas
+    sobrevivem a quedas do processo e são retomados no próximo ``start()``.
+    """
+
+    def __init__(self, config_manager, github_manager=None, workers=DEFAULT_WORKERS,
+                 max_queue=DEFAULT_MAX_QUEUE, max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS,
+                 journal=None):
+        self.config = config_manager
+        self._github_manager = github_manager
+        self.journal = journal
+        self.workers = max(1, int(workers))
+        self.max_finished_jobs = max_finished_jobs
+
+        self._queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._running = False
+
+    @property
+    def github_manager(self):
+        # GitHubManager (e requests) só é carregado quando um job pede repositório
+        if self._github_manager is None:
+            from core.github_manager import GitHubManager
+            self._github_manager = GitHubManager(self.config)
+        return self._github_manager
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        for index in range(self.workers):
+            generator = PackageGenerator(self.config)
+            thread = threading.Thread(
+                target=self._worker, args=(generator,), name=f"generation-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        if self.journal:
+            threading.Thread(target=self._resume_unfinished, name="journal-resume", daemon=True).start()
+
+    def _resume_unfinished(self):
+        # Reenfileira o que estava pendente quando o processo parou, esperando vaga na fila.
+        # Se o serviço parar antes, os restantes seguem pendentes no journal para a próxima execução
+        for record in self.journal.unfinished_jobs():
+            job = Job(record["params"], job_id=record["id"],
+                      created_at=datetime.fromisoformat(record["created_at"]))
+            with self._lock:
+                self._jobs[job.id] = job
+            while True:
+                if not self._running:
+                    with self._lock:
+                        self._jobs.pop(job.id, None)
+                    return
+                try:
+                    self._queue.put(job, timeout=RESUME_PUT_TIMEOUT)
+                    break
+                except queue.Full:
+                    pass
+
+    def stop(self, wait=True):
+        self._running = False
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                pass
+        if wait:
+            for thread in self._threads:
+                thread.join(timeout=5)
+        self._threads = []
+
+    def submit(self, params):
+        params = validate_job_params(params)
+        job = Job(params)
+        if self.journal:
+            self.journal.add_job(job.id, job.params)
+        try:
+            self._enqueue(job)
+        except QueueFullError:
+            if self.journal:
+                self.journal.remove_job(job.id)
+            raise
+        _jobs_submitted.inc()
+        return job
+
+    def resume(self, job_id):
+        """Reenfileira um job que falhou; etapas já concluídas são puladas"""
+        job = self.get(job_id)
+        if job is None and self.journal:
+            record = self.journal.get_job(job_id)
+            if record:
+                job = Job(record["params"], job_id=record["id"],
+                          created_at=datetime.fromisoformat(record["created_at"]))
+                job.status = record["status"]
+        if job is None:
+            return None
+        if job.status != JOB_FAILED:
+            raise JobValidationError(f"Só jobs com falha podem ser retomados (status: {job.status})")
+
+        job.status = JOB_QUEUED
+        job.error = None
+        job.finished_at = None
+        self._enqueue(job)
+        if self.journal:
+            self.journal.update_job(job.id, JOB_QUEUED)
+        return job
+
+    def _enqueue(self, job):
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            _jobs_rejected.inc(reason="queue_full")
+            raise QueueFullError("Fila de jobs cheia, tente novamente mais tarde")
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def stats(self):
+        counts = {}
+        for job in self.list_jobs():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"workers": self.workers, "queued": self._queue.qsize(), "jobs": counts}
+
+    def _worker(self, generator):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            try:
+                self._run_job(generator, job)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, generator, job):
+        job.status = JOB_RUNNING
+        job.started_at = datetime.now()
+        _job_wait_seconds.observe((job.started_at - job.created_at).total_seconds())
+        steps = self.journal.steps(job.id) if self.journal else JobSteps()
+        if self.journal:
+            self.journal.update_job(job.id, JOB_RUNNING)
+
+        generator.set_log_callback(job.logs.append)
+        try:
+            if steps.is_done(STEP_GENERATE):
+                package_path = steps.get(STEP_GENERATE)["package_path"]
+                job.logs.append(f"⏭️ Pacote já gerado em {package_path}, retomando")
+            else:
+                kwargs = {
+                    parameter: job.params[field]
+                    for field, parameter in GENERATION_FIELDS.items()
+                    if field in job.params
+                }
+                package_path = generator.create_package_structure(**kwargs)
+                steps.complete(STEP_GENERATE, {"package_path": package_path})
+            job.result = {"package_path": package_path}
+
+            if job.params.get("create_repo"):
+                github = self.github_manager
+                if not github.is_configured():
+                    raise RuntimeError("Credenciais GitHub não configuradas")
+                github_result = github.setup_repository_with_semantic_release(
+                    package_path=package_path,
+                    display_name=job.params["display_name"],
+                    description=job.params["description"],
+                    private=bool(job.params.get("private")),
+                    initial_version=job.params.get("version", "0.1.0"),
+                    steps=steps
+                )
+                if "error" in github_result:
+                    raise RuntimeError(github_result["error"])
+                job.result["repository"] = github_result
+
+            job.status = JOB_SUCCEEDED
+        except Exception as e:
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            generator.set_log_callback(None)
+            job.finished_at = datetime.now()
+            if self.journal:
+                self.journal.update_job(job.id, job.status, job.error)
+            _jobs_finished.inc(status=job.status)
+            self._prune_finished_jobs()
+
+    def _prune_finished_jobs(self):
+        with self._lock:
+            finished = [
+                job_id for job_id, job in self._jobs.items()
+                if job.status in (JOB_SUCCEEDED, JOB_FAILED)
+            ]
+            for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+                del self._jobs[job_id]
+
+
+def create_server(service, host=DEFAULT_SERVICE_HOST, port=DEFAULT_SERVICE_PORT):
+    """Cria o servidor HTTP/JSON local do serviço.
+
+    Rotas: ``POST /jobs``, ``POST /jobs/<id>/resume``, ``GET /jobs``,
+    ``GET /jobs/<id>``, ``GET /health`` e ``GET /metrics``.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class ServiceHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path == "/health":
+                self._send_json(200, dict(service.stats(), status="ok"))
+            elif path == "/metrics":
+                body = metrics.get_registry().render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            elif path == "/jobs":
+                self._send_json(200, {"jobs": [job.to_dict() for job in service.list_jobs()]})
+            elif path.startswith("/jobs/"):
+                job = service.get(path[len("/jobs/"):])
+                if job is None:
+                    self._send_json(404, {"error": "Job não encontrado"})
+                else:
+                    self._send_json(200, job.to_dict(include_logs=True))
+            else:
+                self._send_json(404, {"error": "Rota não encontrada"})
+
+        def do_POST(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path.startswith("/jobs/") and path.endswith("/resume"):
+                self._resume(path[len("/jobs/"):-len("/resume")])
+                return
+            if path != "/jobs":
+                self._send_json(404, {"error": "Rota não encontrada"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                params = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+                job = service.submit(params)
+            except (ValueError, UnicodeDecodeError) as e:
+                _jobs_rejected.inc(reason="invalid")
+                self._send_json(400, {"error": str(e)})
+                return
+            except QueueFullError as e:
+                self._send_json(429, {"error": str(e)})
+                return
+            self._send_json(202, job.to_dict())
+
+        def _resume(self, job_id):
+            try:
+                job = service.resume(job_id)
+            except JobValidationError as e:
+                self._send_json(409, {"error": str(e)})
+                return
+            except QueueFullError as e:
+                self._send_json(429, {"error": str(e)})
+                return
+            if job is None:
+                self._send_json(404, {"error": "Job não encontrado"})
+            else:
+                self._send_json(202, job.to_dict())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,82 @@
+import os
+import json
+
+from core.assembly_graph import AssemblyGraph, AssemblyInfo, analyze_packages
+
+
+def assembly(name, *references, auto_referenced=True):
+    return AssemblyInfo(name, f"{name}.asmdef", list(references), auto_referenced, False, False)
+
+
+def components(graph):
+    return sorted(sorted(component) for component in graph.strongly_connected_components())
+
+
+def test_scc_finds_cycles():
+    graph = AssemblyGraph([
+        assembly("A", "B"), assembly("B", "C"), assembly("C", "A"),
+        assembly("D", "A"), assembly("E"),
+    ])
+    assert components(graph) == [["A", "B", "C"], ["D"], ["E"]]
+    assert graph.analyze()["cycles"] == [["A", "B", "C"]]
+
+
+def test_scc_order_puts_dependencies_first():
+    graph = AssemblyGraph([assembly("App", "Net"), assembly("Net", "Core"), assembly("Core")])
+    order = [component[0] for component in graph.strongly_connected_components()]
+    assert order == ["Core", "Net", "App"]
+
+
+def test_scc_on_deep_chain_does_not_recurse():
+    count = 5000
+    graph = AssemblyGraph([assembly(f"A{i}", f"A{i + 1}") for i in range(count - 1)] + [assembly(f"A{count - 1}")])
+    assert len(graph.strongly_connected_components()) == count
+    assert graph.blast_radius()[f"A{count - 1}"] == count - 1
+
+
+def test_blast_radius_counts_transitive_dependents():
+    graph = AssemblyGraph([
+        assembly("Core"), assembly("Net", "Core"), assembly("UI", "Core"),
+        assembly("App", "Net", "UI"), assembly("Tool"),
+    ])
+    radius = graph.blast_radius()
+    assert radius == {"Core": 3, "Net": 1, "UI": 1, "App": 0, "Tool": 0}
+    assert graph.fan_in("Core") == 2
+
+
+def test_blast_radius_inside_a_cycle():
+    graph = AssemblyGraph([assembly("A", "B"), assembly("B", "A"), assembly("C", "A")])
+    # A e B recompilam juntos; C depende dos dois
+    assert graph.blast_radius() == {"A": 2, "B": 2, "C": 0}
+
+
+def test_external_self_and_duplicate_references():
+    graph = AssemblyGraph([
+        assembly("A", "A", "B", "B", "UnityEngine.UI"), assembly("B"), assembly("B"),
+    ])
+    assert graph.references["A"] == ["B"]
+    assert graph.external == {"UnityEngine.UI": {"A"}}
+    assert graph.duplicates == ["B.asmdef"]
+
+
+def test_analyze_packages_resolves_guid_references(tmp_path):
+    def asmdef(folder, data, guid=None):
+        path = tmp_path / folder / f"{data['name']}.asmdef"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+        if guid:
+            (tmp_path / folder / f"{data['name']}.asmdef.meta").write_text(f"fileFormatVersion: 2\nguid: {guid}\n")
+
+    asmdef("core", {"name": "Core"}, guid="0123456789abcdef0123456789abcdef")
+    asmdef("net", {"name": "Net", "references": ["GUID:0123456789abcdef0123456789abcdef"], "autoReferenced": False})
+    asmdef("Samples~", {"name": "Sample", "references": ["Core"]})
+    asmdef(".hidden", {"name": "Hidden"})
+
+    report = analyze_packages(str(tmp_path))
+
+    rows = {row["name"]: row for row in report["assemblies"]}
+    assert set(rows) == {"Core", "Net"}
+    assert rows["Core"]["blast_radius"] == 1
+    assert [w["name"] for w in report["auto_referenced"]] == ["Core"]
+    assert report["errors"] == []
+    assert os.path.basename(rows["Net"]["path"]) == "Net.asmdef"
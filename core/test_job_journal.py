@@ -0,0 +1,60 @@
+from core.job_journal import JobJournal, JobSteps, STEP_GENERATE, STEP_REPO_CREATE, STEP_REPO_REQUESTED
+
+
+def test_steps_survive_reopening_the_journal(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    journal = JobJournal(path)
+    journal.add_job("job-1", {"display_name": "Core"}, status="running")
+    steps = journal.steps("job-1:core")
+    steps.complete(STEP_GENERATE, {"path": "/tmp/core"})
+    steps.complete(STEP_REPO_REQUESTED, {"repo_name": "core"})
+    journal.close()
+
+    journal = JobJournal(path)
+    steps = journal.steps("job-1:core")
+    assert steps.is_done(STEP_GENERATE)
+    assert steps.get(STEP_GENERATE) == {"path": "/tmp/core"}
+    assert not steps.is_done(STEP_REPO_CREATE)
+    assert steps.get(STEP_REPO_REQUESTED, {}).get("repo_name") == "core"
+    assert [job["id"] for job in journal.unfinished_jobs()] == ["job-1"]
+    journal.close()
+
+
+def test_discarded_request_marker_is_not_resumed(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    journal = JobJournal(path)
+    steps = journal.steps("job-1:core")
+    steps.complete(STEP_REPO_REQUESTED, {"repo_name": "core"})
+    # Repositório já existia e não é desta tarefa: o marcador não pode levar a adotá-lo depois
+    steps.discard(STEP_REPO_REQUESTED)
+    steps.discard(STEP_REPO_REQUESTED)
+    journal.close()
+
+    journal = JobJournal(path)
+    assert not journal.steps("job-1:core").is_done(STEP_REPO_REQUESTED)
+    journal.close()
+
+
+def test_job_status_and_removal(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    journal.add_job("a", {"n": 1})
+    journal.add_job("b", {"n": 2})
+    journal.update_job("a", "failed", error="boom")
+    journal.steps("b").complete(STEP_GENERATE)
+
+    assert journal.get_job("a")["error"] == "boom"
+    assert [job["id"] for job in journal.unfinished_jobs()] == ["b"]
+
+    journal.remove_job("b")
+    assert journal.get_job("b") is None
+    assert journal.steps("b").completed() == []
+    journal.close()
+
+
+def test_steps_without_journal_live_in_memory():
+    steps = JobSteps()
+    steps.complete(STEP_GENERATE)
+    assert steps.get(STEP_GENERATE) == {}
+    assert steps.completed() == [STEP_GENERATE]
+    steps.discard(STEP_GENERATE)
+    assert not steps.is_done(STEP_GENERATE)
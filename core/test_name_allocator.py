@@ -0,0 +1,56 @@
+import json
+
+from core.name_allocator import NameAllocator, collect_taken_names, local_folder_owners
+
+
+def test_batch_collisions_get_suffixes_in_order():
+    allocations = NameAllocator().allocate_batch(["Core Utils", "Core-Utils", "Net"])
+
+    assert [a["repo_name"] for a in allocations] == ["core-utils", "core-utils-2", "net"]
+    assert [a["renamed"] for a in allocations] == [False, True, False]
+    assert allocations[1]["base_name"] == "core-utils"
+
+
+def test_taken_names_are_case_insensitive():
+    allocator = NameAllocator(["Core-Utils", "core-utils-2"])
+    assert allocator.allocate("Core Utils") == "core-utils-3"
+
+
+def test_owner_reuses_its_own_name():
+    allocator = NameAllocator({"core-utils": "Core Utils", "net": "Outro"})
+    assert allocator.allocate("Core Utils") == "core-utils"
+    assert allocator.allocate("Net") == "net-2"
+
+
+def test_allocation_is_deterministic():
+    names = ["A", "A!", "B", "a"]
+    first = NameAllocator({"a": None}).allocate_batch(names)
+    second = NameAllocator({"a": None}).allocate_batch(names)
+    assert first == second
+
+
+def test_suffix_respects_max_length():
+    allocator = NameAllocator(["x" * 10], max_length=10)
+    name = allocator.allocate("X", base_name="x" * 10)
+    assert name == "xxxxxxxx-2"
+    assert len(name) <= 10
+
+
+def test_local_folders_and_remote_repositories(tmp_path):
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core" / "package.json").write_text(json.dumps({"displayName": "Core"}), encoding="utf-8")
+    (tmp_path / "Sem Pacote").mkdir()
+    (tmp_path / "arquivo.txt").write_text("", encoding="utf-8")
+
+    assert local_folder_owners(str(tmp_path)) == {"core": "Core", "sem pacote": None}
+    assert local_folder_owners(str(tmp_path / "inexistente")) == {}
+
+    class Remote:
+        def is_configured(self):
+            return True
+
+        def existing_repository_names(self):
+            return {"core": None, "net": "Net"}
+
+    taken = collect_taken_names(str(tmp_path), Remote())
+    assert taken == {"core": "Core", "net": "Net", "sem pacote": None}
@@ -0,0 +1,112 @@
+import os
+import json
+import shutil
+
+import pytest
+
+from config.config_manager import ConfigManager
+from core.package_generator import (
+    PackageGenerator, read_lockfile, find_locked_packages,
+    REFRESH_UNCHANGED, REFRESH_UPDATED, REFRESH_CONFLICT, REFRESH_MERGED, REFRESH_CREATED,
+)
+
+
+@pytest.fixture
+def generated(tmp_path):
+    """Pacote gerado em tmp_path/Packages, com config.ini próprio"""
+    packages = tmp_path / "Packages"
+    packages.mkdir()
+    config = ConfigManager(str(tmp_path / "config.ini"))
+    generator = PackageGenerator(config)
+    logs = []
+    generator.set_log_callback(logs.append)
+    package_path = generator.create_package_structure(
+        str(packages), "core", "Core", "Pacote de teste", create_samples=False, create_github=False
+    )
+    return config, generator, package_path
+
+
+def read(package_path, rel_path):
+    with open(os.path.join(package_path, rel_path), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def statuses(report):
+    return {entry["path"]: entry["status"] for entry in report if entry["status"] != REFRESH_UNCHANGED}
+
+
+def test_refresh_without_changes_touches_nothing(generated):
+    _, generator, package_path = generated
+    lock_before = read(package_path, ".upf-lock.json")
+
+    report = generator.refresh_package(package_path)
+
+    assert report
+    assert statuses(report) == {}
+    assert read(package_path, ".upf-lock.json") == lock_before
+    assert find_locked_packages(os.path.dirname(package_path)) == [package_path]
+
+
+def test_dry_run_reports_without_writing(generated):
+    config, generator, package_path = generated
+    config.set_value(key='author_name', value='Outro Autor')
+    before = {name: read(package_path, name) for name in ("package.json", "LICENSE.md", ".upf-lock.json")}
+
+    report = generator.refresh_package(package_path, dry_run=True)
+
+    assert statuses(report) == {"package.json": REFRESH_UPDATED, "LICENSE.md": REFRESH_UPDATED}
+    assert all(entry["diff"] for entry in report if entry["status"] == REFRESH_UPDATED)
+    assert {name: read(package_path, name) for name in before} == before
+
+
+def test_refresh_merges_package_json_and_keeps_hand_edits(generated):
+    config, generator, package_path = generated
+    manifest = json.loads(read(package_path, "package.json"))
+    manifest["keywords"] = ["local"]
+    with open(os.path.join(package_path, "package.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    with open(os.path.join(package_path, "LICENSE.md"), 'a', encoding='utf-8') as f:
+        f.write("editado\n")
+    config.set_value(key='author_name', value='Outro Autor')
+
+    report = generator.refresh_package(package_path)
+
+    assert statuses(report) == {"package.json": REFRESH_MERGED, "LICENSE.md": REFRESH_CONFLICT}
+    manifest = json.loads(read(package_path, "package.json"))
+    assert manifest["author"]["name"] == "Outro Autor"
+    assert manifest["keywords"] == ["local"]
+    assert read(package_path, "LICENSE.md").endswith("editado\n")
+
+    # A edição continua em conflito até ser forçada; com --force vira backup
+    assert statuses(generator.refresh_package(package_path)) == {"LICENSE.md": REFRESH_CONFLICT}
+    generator.refresh_package(package_path, force=True)
+    assert "Outro Autor" in read(package_path, "LICENSE.md")
+    assert read(package_path, "LICENSE.md.bak").endswith("editado\n")
+    assert statuses(generator.refresh_package(package_path)) == {}
+
+
+def test_dry_run_reports_missing_folders_without_creating_them(generated):
+    _, generator, package_path = generated
+    shutil.rmtree(os.path.join(package_path, "Tests"))
+
+    report = generator.refresh_package(package_path, dry_run=True)
+
+    changed = statuses(report)
+    assert changed["Tests/"] == REFRESH_CREATED
+    assert not os.path.exists(os.path.join(package_path, "Tests"))
+
+    generator.refresh_package(package_path)
+    assert os.path.isdir(os.path.join(package_path, "Tests"))
+    assert statuses(generator.refresh_package(package_path)) == {}
+
+
+def test_refresh_requires_matching_lockfile(generated, tmp_path):
+    _, generator, package_path = generated
+    assert read_lockfile(str(tmp_path)) is None
+    with pytest.raises(ValueError):
+        generator.refresh_package(str(tmp_path))
+
+    moved = os.path.join(os.path.dirname(package_path), "outro-nome")
+    os.rename(package_path, moved)
+    with pytest.raises(ValueError):
+        generator.refresh_package(moved)
@@ -0,0 +1,78 @@
+import os
+import json
+import tarfile
+
+import pytest
+
+from core.packer import list_package_files, pack_package, tarball_name, NPM_FIXED_MTIME
+
+
+def write(path, content=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def make_package(root, manifest=None):
+    write(os.path.join(root, "package.json"), json.dumps(manifest or {"name": "com.test.core", "version": "1.0.0"}))
+    write(os.path.join(root, "README.md"), "# Core")
+    write(os.path.join(root, "Runtime", "Core.cs"), "class Core {}")
+    write(os.path.join(root, "Runtime", "Core.cs.bak"), "backup")
+    write(os.path.join(root, ".upf-lock.json"), "{}")
+    return root
+
+
+def test_tarball_name():
+    assert tarball_name("com.test.core", "1.0.0") == "com.test.core-1.0.0.tgz"
+    assert tarball_name("@scope/core", "1.0.0") == "scope-core-1.0.0.tgz"
+
+
+def test_generator_files_are_excluded_and_ignore_rules_apply(tmp_path):
+    root = make_package(str(tmp_path / "pkg"))
+    write(os.path.join(root, ".npmignore"), "Docs/\n!Docs/keep.md\n")
+    write(os.path.join(root, "Docs", "notes.md"))
+    write(os.path.join(root, "Runtime", ".gitignore"), "*.tmp\n")
+    write(os.path.join(root, "Runtime", "x.tmp"))
+
+    assert list_package_files(root) == ["README.md", "Runtime/Core.cs", "package.json"]
+
+
+def test_files_field_keeps_readme_and_manifest(tmp_path):
+    root = make_package(str(tmp_path / "pkg"), {"name": "com.test.core", "version": "1.0.0", "files": ["Runtime"]})
+    write(os.path.join(root, "Editor", "Tool.cs"))
+
+    assert list_package_files(root) == ["README.md", "Runtime/Core.cs", "package.json"]
+
+
+def test_pack_is_deterministic(tmp_path):
+    root = make_package(str(tmp_path / "pkg"))
+    first = pack_package(root, str(tmp_path / "a"))
+    # Mesmo conteúdo com datas diferentes gera os mesmos bytes
+    os.utime(os.path.join(root, "README.md"), (1, 1))
+    second = pack_package(root, str(tmp_path / "b"))
+
+    with open(first["path"], 'rb') as f1, open(second["path"], 'rb') as f2:
+        assert f1.read() == f2.read()
+    assert first["integrity"] == second["integrity"]
+    assert first["shasum"] == second["shasum"]
+    assert first["filename"] == "com.test.core-1.0.0.tgz"
+    assert not os.path.exists(first["path"] + ".tmp")
+
+
+def test_pack_entries_are_normalized(tmp_path):
+    root = make_package(str(tmp_path / "pkg"))
+    result = pack_package(root, str(tmp_path / "out"))
+
+    with tarfile.open(result["path"], 'r:gz') as tar:
+        members = tar.getmembers()
+    assert [m.name for m in members] == ["package/README.md", "package/Runtime/Core.cs", "package/package.json"]
+    assert {m.mtime for m in members} == {NPM_FIXED_MTIME}
+    assert {(m.uid, m.gid, m.uname, m.gname) for m in members} == {(0, 0, "", "")}
+    assert result["unpacked_size"] == sum(m.size for m in members)
+
+
+def test_pack_requires_name_and_version(tmp_path):
+    root = str(tmp_path / "pkg")
+    write(os.path.join(root, "package.json"), json.dumps({"name": "com.test.core"}))
+    with pytest.raises(ValueError):
+        pack_package(root, str(tmp_path / "out"))
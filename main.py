@@ -1,49 +1,49 @@
+import time
+_startup_t0 = time.perf_counter()
+
 import sys
 import os
 import logging
-import customtkinter as ctk
-from ui.ctk_generator_gui import PackageGeneratorGUI
+import argparse
 from utils.version_utils import get_current_version
-from utils.resource_utils import get_resource_path, is_executable
+from utils.resource_utils import get_resource_path, get_config_directory, is_executable
+from utils.lazy_import import is_module_available
 from ui.strings import (
     APP_GEOMETRY, APP_MIN_SIZE, APP_APPEARANCE_MODE, APP_COLOR_THEME,
     ERROR_APP_INITIALIZATION, ERROR_ICON_LOAD, PROMPT_PRESS_ENTER
 )
+from utils import startup_timer
+
+# Tk, customtkinter, requests e cryptography só são importados quando necessários
+startup_timer.set_start_time(_startup_t0)
+startup_timer.record("imports", time.perf_counter() - _startup_t0)
+
+# config.ini e journal ficam na pasta de configuração, como o log: rodar de dentro de um
+# pacote não cria arquivos nele (o cache github_repos.json acompanha o config.ini)
+DEFAULT_CONFIG_FILE = os.path.join(get_config_directory(), 'config.ini')
+DEFAULT_JOURNAL_FILE = os.path.join(get_config_directory(), 'jobs.db')
+
+
+def setup_logging(stream=sys.stdout):
+    # Sempre na pasta de configuração (ao lado do executável ou do projeto), nunca no cwd:
+    # rodar o modo headless dentro de um pacote não deixa o log no repositório dele
+    log_file = os.path.join(get_config_directory(), 'unity_package_forge.log')
 
-def setup_logging():
-    if is_executable():
-        log_dir = os.path.dirname(sys.executable)
-        log_file = os.path.join(log_dir, 'unity_package_forge.log')
-    else:
-        log_file = 'unity_package_forge.log'
-    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
+            logging.StreamHandler(stream)
         ]
     )
     return logging.getLogger(__name__)
 
 
-def check_dependencies():
-    missing_deps = []
-    try:
-        import requests
-    except ImportError:
-        missing_deps.append('requests')
-    
-    try:
-        import customtkinter
-    except ImportError:
-        missing_deps.append('customtkinter')
-    
-    try:
-        import cryptography
-    except ImportError:
-        missing_deps.append('cryptography')
+def check_dependencies(gui=True):
+    # Verifica a presença sem importar: importar só para testar custa caro na inicialização
+    required = ['requests', 'customtkinter', 'cryptography'] if gui else []
+    missing_deps = [dep for dep in required if not is_module_available(dep)]
     
     if missing_deps:
         error_msg = f"Dependências críticas não encontradas: {', '.join(missing_deps)}"
@@ -59,6 +59,10 @@ def start_gui():
     logger = logging.getLogger(__name__)
     logger.info(f"Starting Unity Package Forge v{get_current_version()}")
     logger.info(f"Running as executable: {is_executable()}")
+
+    with startup_timer.measure("gui imports"):
+        import customtkinter as ctk
+        from ui.ctk_generator_gui import PackageGeneratorGUI
     
     ctk.set_appearance_mode(APP_APPEARANCE_MODE)
     ctk.set_default_color_theme(APP_COLOR_THEME)
@@ -102,6 +106,9 @@ def start_gui():
         root.geometry(f"{width}x{height}+{x}+{y}")
 
         root.deiconify()
+        root.update_idletasks()
+
+        logger.info(startup_timer.finish())
 
     root.after(50, center_and_show)
 
@@ -113,29 +120,433 @@ def start_gui():
         logger.error(f"Unexpected error during GUI execution: {str(e)}", exc_info=True)
         raise
 
-if __name__ == "__main__":
+def parse_dependency(value):
+    if '=' not in value:
+        raise argparse.ArgumentTypeError(f"Dependência inválida '{value}', use package_id=versão")
+    package_id, version = value.split('=', 1)
+    return package_id.strip(), version.strip()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="unity-package-forge",
+        description="Gerador profissional de pacotes Unity com integração GitHub"
+    )
+    parser.add_argument('--version', action='version', version=f"%(prog)s {get_current_version()}")
+    parser.add_argument('--trace', metavar="ARQUIVO",
+                        help="Grava spans de execução (.jsonl = JSON lines, outros = Chrome Trace)")
+    parser.add_argument('--metrics-port', type=int, metavar="PORTA",
+                        help="Expõe métricas em http://127.0.0.1:PORTA/metrics (Prometheus) e /metrics.json")
+    parser.add_argument('--metrics-snapshot', metavar="ARQUIVO",
+                        help="Grava o snapshot das métricas em JSON ao final da execução")
+    subparsers = parser.add_subparsers(dest='command')
+
+    generate = subparsers.add_parser('generate', help="Gera um pacote sem abrir a interface gráfica")
+    generate.add_argument('display_name', help="Nome de exibição do pacote")
+    generate.add_argument('-o', '--output', required=True, help="Pasta de destino (ex: Packages do projeto)")
+    generate.add_argument('-d', '--description', default="", help="Descrição do pacote")
+    generate.add_argument('--package-version', default="0.1.0", help="Versão inicial do pacote")
+    generate.add_argument('--license', default="MIT", help="Tipo de licença")
+    generate.add_argument('--dependency', action='append', type=parse_dependency, default=[],
+                          metavar="PACKAGE_ID=VERSION", help="Dependência Unity (pode repetir)")
+    generate.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="Arquivo de configuração")
+    generate.add_argument('--no-samples', action='store_true', help="Não cria Samples~")
+    generate.add_argument('--no-runtime', action='store_true', help="Não cria Runtime")
+    generate.add_argument('--no-editor', action='store_true', help="Não cria Editor")
+    generate.add_argument('--no-tests', action='store_true', help="Não cria Tests")
+    generate.add_argument('--no-github-files', action='store_true', help="Não cria arquivos do GitHub Actions")
+
+    monorepo = subparsers.add_parser('monorepo', help="Gera vários pacotes a partir de um manifesto com dependências")
+    monorepo.add_argument('manifest', help="Manifesto JSON com a lista de pacotes e depends_on")
+    monorepo.add_argument('-o', '--output', required=True, help="Pasta de destino dos pacotes")
+    monorepo.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="Arquivo de configuração")
+    monorepo.add_argument('--check-github', action='store_true',
+                          help="Evita também nomes de repositórios já existentes na conta do GitHub")
+
+    analyze = subparsers.add_parser('analyze', help="Analisa o grafo de assemblies (.asmdef) de uma pasta Packages")
+    analyze.add_argument('path', help="Pasta a analisar (ex: caminho/do/projeto/Packages)")
+    analyze.add_argument('--top', type=int, default=20, help="Quantidade de assemblies listados")
+    analyze.add_argument('--json', action='store_true', help="Emite o relatório completo em JSON")
+
+    index = subparsers.add_parser('index', help="Indexa os pacotes UPM existentes e aponta colisões")
+    index.add_argument('path', help="Projeto Unity, pasta Packages ou monorepo")
+    index.add_argument('--cache', metavar="ARQUIVO", help="Arquivo de cache do índice (reaproveitado por mtime)")
+    index.add_argument('--workers', type=int, default=4, help="Threads para percorrer subpastas em paralelo")
+    index.add_argument('--json', action='store_true', help="Emite o índice em JSON")
+
+    pack = subparsers.add_parser('pack', help="Gera tarballs .tgz determinísticos (equivalente ao npm pack)")
+    pack.add_argument('paths', nargs='+', metavar="CAMINHO", help="Pacote ou pasta com vários pacotes")
+    pack.add_argument('-o', '--output', default=".", help="Pasta onde os .tgz são gravados")
+    pack.add_argument('--level', type=int, default=9, choices=range(0, 10), metavar="0-9",
+                      help="Nível de compressão zlib (padrão: 9)")
+    pack.add_argument('--dry-run', action='store_true', help="Apenas lista os arquivos que seriam incluídos")
+
+    publish = subparsers.add_parser('publish', help="Empacota e publica em um registry npm (scoped registry)")
+    publish.add_argument('paths', nargs='+', metavar="CAMINHO", help="Pacote ou pasta com vários pacotes")
+    publish.add_argument('--registry', help="URL do registry (padrão: [registry] url do config)")
+    publish.add_argument('--token', help="Token do registry (padrão: [registry] token do config)")
+    publish.add_argument('-o', '--output', default="dist", help="Pasta onde os .tgz são gravados")
+    publish.add_argument('--level', type=int, default=9, choices=range(0, 10), metavar="0-9",
+                         help="Nível de compressão zlib")
+    publish.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="Arquivo de configuração")
+
+    registry = subparsers.add_parser('registry', help="Sobe um registry npm local baseado em arquivos")
+    registry.add_argument('root', help="Pasta onde os pacotes publicados são guardados")
+    registry.add_argument('--host', default="127.0.0.1", help="Endereço de escuta")
+    registry.add_argument('--port', type=int, default=4873, help="Porta do registry")
+    registry.add_argument('--token', help="Exige este token (Bearer) para publicar")
+
+    refresh = subparsers.add_parser('refresh', help="Regenera só os arquivos cujas entradas mudaram (via lockfile)")
+    refresh.add_argument('paths', nargs='+', metavar="CAMINHO",
+                         help="Pacote gerado ou pasta com vários pacotes (ex: Packages)")
+    refresh.add_argument('--dry-run', action='store_true', help="Apenas reporta, sem escrever")
+    refresh.add_argument('--force', action='store_true', help="Sobrescreve arquivos editados à mão (com backup)")
+    refresh.add_argument('--diff', action='store_true', help="Mostra o diff dos arquivos alterados")
+    refresh.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="Arquivo de configuração")
+
+    subparsers.add_parser('selftest', help="Verifica criptografia e módulos carregados sob demanda (usado no build)")
+
+    serve = subparsers.add_parser('serve', help="Mantém o gerador em execução com uma API HTTP/JSON local")
+    serve.add_argument('--host', default="127.0.0.1", help="Endereço de escuta (padrão: apenas local)")
+    serve.add_argument('--port', type=int, default=8765, help="Porta da API")
+    serve.add_argument('--workers', type=int, default=2, help="Gerações simultâneas")
+    serve.add_argument('--max-queue', type=int, default=100, help="Jobs aguardando antes de recusar com 429")
+    serve.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="Arquivo de configuração")
+    serve.add_argument('--journal', default=DEFAULT_JOURNAL_FILE,
+                       help="Journal SQLite para retomar jobs após quedas (vazio desativa)")
+
+    return parser
+
+
+def run_generate(args):
+    """Gera um pacote em modo headless (sem Tk nem requests)"""
+    logger = logging.getLogger(__name__)
+
+    from config.config_manager import ConfigManager
+    from core.package_generator import PackageGenerator
+
+    generator = PackageGenerator(ConfigManager(args.config))
+    generator.set_log_callback(logger.info)
+
+    package_path = generator.create_package_structure(
+        base_path=args.output,
+        name=args.display_name,
+        display_name=args.display_name,
+        description=args.description,
+        version=args.package_version,
+        create_samples=not args.no_samples,
+        create_runtime=not args.no_runtime,
+        create_editor=not args.no_editor,
+        create_tests=not args.no_tests,
+        create_github=not args.no_github_files,
+        license_type=args.license,
+        unity_dependencies=dict(args.dependency) or None
+    )
+    print(package_path)
+    return 0
+
+
+def run_monorepo(args):
+    """Gera os pacotes do manifesto em ordem topológica, com referências entre asmdefs"""
+    logger = logging.getLogger(__name__)
+
+    from config.config_manager import ConfigManager
+    from core.package_generator import PackageGenerator
+    from core.monorepo import load_manifest, generate_monorepo
+
+    config = ConfigManager(args.config)
+    generator = PackageGenerator(config)
+    generator.set_log_callback(logger.info)
+
+    # Consultar a conta exige o token (cryptography) e rede: só quando pedido
+    github_manager = None
+    if args.check_github:
+        from core.github_manager import GitHubManager
+        github_manager = GitHubManager(config)
+    for package_path in generate_monorepo(generator, load_manifest(args.manifest), args.output, github_manager):
+        print(package_path)
+    return 0
+
+
+# Módulos importados só sob demanda; no executável, um exclude errado só aparece quando são usados
+SELFTEST_MODULES = ['requests', 'core.package_generator', 'core.github_manager', 'core.registry']
+
+
+def run_selftest(args):
+    """Verifica o executável empacotado sem tocar no config.ini: criptografa e descriptografa
+    um valor como um token da configuração e importa os módulos carregados sob demanda"""
+    import importlib
+    from utils.crypto_utils import SimpleCrypto
+
+    sample = "unity-package-forge-selftest"
+    crypto = SimpleCrypto()
+    if crypto.decrypt(crypto.encrypt(sample)) != sample:
+        print("❌ Criptografia da configuração falhou")
+        return 1
+    print("✅ Criptografia da configuração OK")
+
+    for module in SELFTEST_MODULES:
+        importlib.import_module(module)
+    print(f"✅ Módulos carregados: {', '.join(SELFTEST_MODULES)}")
+    return 0
+
+
+def run_analyze(args):
+    """Relatório de fan-in, raio de recompilação e autoReferenced dos assemblies"""
+    from core.assembly_graph import analyze_packages, format_report
+
+    report = analyze_packages(args.path)
+    if args.json:
+        import json
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(format_report(report, top=args.top))
+    return 1 if report["cycles"] else 0
+
+
+def run_index(args):
+    """Lista os pacotes encontrados e os nomes/namespaces duplicados"""
+    from core.package_index import PackageIndex
+
+    package_index = PackageIndex(args.path, cache_path=args.cache, workers=args.workers).scan()
+    package_index.save()
+    duplicates = package_index.duplicates()
+
+    if args.json:
+        import json
+        print(json.dumps({
+            "packages": list(package_index.packages.values()),
+            "duplicates": duplicates,
+            "errors": package_index.errors(),
+        }, indent=2, ensure_ascii=False))
+    else:
+        for package in sorted(package_index.packages.values(), key=lambda p: p["path"]):
+            print(f"{package['name'] or '?':<48} {package['version'] or '?':<10} {package['path']}")
+        for name, paths in duplicates["names"].items():
+            print(f"⚠️ Pacote '{name}' duplicado: {', '.join(paths)}")
+        for namespace, paths in duplicates["namespaces"].items():
+            print(f"⚠️ Namespace '{namespace}' duplicado: {', '.join(paths)}")
+        for path, error in package_index.errors().items():
+            print(f"❌ {path}: {error}")
+        stats = package_index.stats
+        print(f"{len(package_index.packages)} pacote(s); {stats['parsed']} arquivo(s) lidos, {stats['cached']} do cache")
+    return 1 if duplicates["names"] or duplicates["namespaces"] else 0
+
+
+def find_package_dirs(path):
+    """O próprio caminho se tiver package.json, senão os subdiretórios que tiverem"""
+    if os.path.isfile(os.path.join(path, "package.json")):
+        return [path]
+    with os.scandir(path) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "package.json"))
+        )
+
+
+def run_pack(args):
+    """Empacota vários pacotes no mesmo processo, sem Node"""
+    from core.packer import pack_package, list_package_files
+
+    packages = [package for path in args.paths for package in find_package_dirs(path)]
+    for package_path in packages:
+        if args.dry_run:
+            print(f"📦 {package_path}")
+            for relative in list_package_files(package_path):
+                print(f"  {relative}")
+            continue
+        result = pack_package(package_path, args.output, compresslevel=args.level)
+        print(f"{result['path']}  {len(result['files'])} arquivos  {result['size']} bytes  {result['integrity'][:30]}...")
+    if not packages:
+        print("⚠️ Nenhum package.json encontrado")
+        return 1
+    return 0
+
+
+def run_publish(args):
+    """Empacota cada pacote e publica, pulando versões já publicadas com o mesmo hash"""
+    from config.config_manager import ConfigManager
+    from core.packer import pack_package
+    from core.publisher import RegistryPublisher, PUBLISH_CONFLICT, PUBLISH_ERROR
+
+    config = ConfigManager(args.config)
+    registry_url = args.registry or config.get_value(section='registry', key='url', default='')
+    if not registry_url:
+        print("❌ Informe --registry ou [registry] url no config")
+        return 1
+    token = args.token or config.get_value(section='registry', key='token', default='')
+
+    publisher = RegistryPublisher(registry_url, token=token)
+    failures = 0
+    try:
+        for path in args.paths:
+            for package_path in find_package_dirs(path):
+                status, message = publisher.publish(pack_package(package_path, args.output, compresslevel=args.level))
+                print(f"{status:<10} {message}")
+                if status in (PUBLISH_CONFLICT, PUBLISH_ERROR):
+                    failures += 1
+    finally:
+        publisher.close()
+    return 1 if failures else 0
+
+
+def run_registry(args):
+    """Registry npm local para testes e como substituto de um scoped registry"""
+    from core.registry import create_registry_server
+
+    server = create_registry_server(args.root, args.host, args.port, token=args.token)
+    print(f"Registry em http://{args.host}:{args.port} (pasta {args.root}, Ctrl+C para encerrar)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def run_refresh(args):
+    """Atualiza pacotes existentes a partir do lockfile e reporta as diferenças"""
+    logger = logging.getLogger(__name__)
+
+    from config.config_manager import ConfigManager
+    from core.package_generator import (
+        PackageGenerator, find_locked_packages, REFRESH_UNCHANGED, REFRESH_CONFLICT
+    )
+
+    generator = PackageGenerator(ConfigManager(args.config))
+    generator.set_log_callback(logger.debug)
+
+    packages = []
+    for path in args.paths:
+        found = find_locked_packages(path)
+        if not found:
+            print(f"⚠️ Nenhum pacote com lockfile em {path}")
+        packages.extend(found)
+
+    totals = {}
+    for package_path in packages:
+        report = generator.refresh_package(package_path, dry_run=args.dry_run, force=args.force)
+        changed = [entry for entry in report if entry["status"] != REFRESH_UNCHANGED]
+        for entry in report:
+            totals[entry["status"]] = totals.get(entry["status"], 0) + 1
+        if not changed:
+            continue
+
+        print(f"📦 {package_path}")
+        for entry in changed:
+            print(f"  {entry['status']:<9} {entry['path']}")
+            if args.diff and entry["diff"]:
+                print(entry["diff"].rstrip("\n"))
+
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(totals.items()))
+    print(f"{len(packages)} pacote(s) verificados: {summary or 'nada a fazer'}"
+          + (" (dry-run)" if args.dry_run else ""))
+    return 1 if totals.get(REFRESH_CONFLICT) and not args.force else 0
+
+
+def run_serve(args):
+    """Sobe o serviço de geração e atende jobs até Ctrl+C"""
+    logger = logging.getLogger(__name__)
+
+    from config.config_manager import ConfigManager
+    from core.service import GenerationService, create_server
+    from core.job_journal import JobJournal
+
+    journal = JobJournal(args.journal) if args.journal else None
+    service = GenerationService(ConfigManager(args.config), workers=args.workers,
+                                max_queue=args.max_queue, journal=journal)
+    server = create_server(service, args.host, args.port)
+    service.start()
+    logger.info(f"Generation service listening on http://{args.host}:{args.port} ({args.workers} workers)")
+    print(f"Serviço em http://{args.host}:{args.port} (Ctrl+C para encerrar)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Generation service stopping...")
+    finally:
+        server.server_close()
+        service.stop()
+        if journal:
+            journal.close()
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    headless = args.command is not None
+
     logger = None
     try:
-        logger = setup_logging()
+        # No modo headless o stdout é a saída do comando (ex: --json); o log vai para o stderr
+        logger = setup_logging(sys.stderr if headless else sys.stdout)
         logger.info("Unity Package Forge starting...")
         
-        check_dependencies()
+        check_dependencies(gui=not headless)
         logger.info("All dependencies verified")
-        
+
+        if args.trace:
+            from utils.tracing import get_tracer, create_exporter
+            get_tracer().add_exporter(create_exporter(args.trace))
+            logger.info(f"Tracing enabled: {args.trace}")
+
+        if args.metrics_port:
+            from utils.metrics import start_metrics_server
+            start_metrics_server(args.metrics_port)
+            logger.info(f"Metrics endpoint: http://127.0.0.1:{args.metrics_port}/metrics")
+
+        if args.command == 'generate':
+            return run_generate(args)
+        if args.command == 'monorepo':
+            return run_monorepo(args)
+        if args.command == 'analyze':
+            return run_analyze(args)
+        if args.command == 'index':
+            return run_index(args)
+        if args.command == 'pack':
+            return run_pack(args)
+        if args.command == 'publish':
+            return run_publish(args)
+        if args.command == 'registry':
+            return run_registry(args)
+        if args.command == 'refresh':
+            return run_refresh(args)
+        if args.command == 'serve':
+            return run_serve(args)
+        if args.command == 'selftest':
+            return run_selftest(args)
+
         start_gui()
+        return 0
         
     except ImportError as e:
         error_msg = f"Erro de dependências: {str(e)}"
         print(error_msg)
         if logger:
             logger.error(error_msg)
-        input(PROMPT_PRESS_ENTER)
-        sys.exit(1)
+        if not headless:
+            input(PROMPT_PRESS_ENTER)
+        return 1
         
     except Exception as e:
         error_msg = ERROR_APP_INITIALIZATION.format(error=str(e))
         print(error_msg)
         if logger:
             logger.error(error_msg, exc_info=True)
-        input(PROMPT_PRESS_ENTER)
-        sys.exit(1)
+        if not headless:
+            input(PROMPT_PRESS_ENTER)
+        return 1
+
+    finally:
+        if args.trace:
+            from utils.tracing import get_tracer
+            get_tracer().shutdown()
+        if args.metrics_snapshot:
+            import json
+            from utils.metrics import get_registry
+            with open(args.metrics_snapshot, 'w', encoding='utf-8') as f:
+                json.dump(get_registry().snapshot(), f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+using System.Collections;
+using UnityEngine;
+
+namespace {{namespace}}.Samples.Advanced
+{
+    /// <summary>
+    /// Exemplo avançado do {{display_name}}: execução periódica via corrotina.
+    /// </summary>
+    public class AdvancedExample : MonoBehaviour
+    {
+        [SerializeField] private float interval = 1f;
+
+        private IEnumerator Start()
+        {
+            var wait = new WaitForSeconds(interval);
+            while (enabled)
+            {
+                Debug.Log("{{display_name}}: tick em " + Time.time.ToString("F1") + "s");
+                yield return wait;
+            }
+        }
+    }
+}
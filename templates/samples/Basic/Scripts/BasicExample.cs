@@ -0,0 +1,15 @@
+using UnityEngine;
+
+namespace {{namespace}}.Samples.Basic
+{
+    /// <summary>
+    /// Exemplo básico de uso do {{display_name}}.
+    /// </summary>
+    public class BasicExample : MonoBehaviour
+    {
+        private void Start()
+        {
+            Debug.Log("{{display_name}}: exemplo básico iniciado");
+        }
+    }
+}
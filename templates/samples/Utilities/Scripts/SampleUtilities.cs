@@ -0,0 +1,16 @@
+using UnityEngine;
+
+namespace {{namespace}}.Samples.Utilities
+{
+    /// <summary>
+    /// Helpers de exemplo para projetos que usam o {{display_name}}.
+    /// </summary>
+    public static class SampleUtilities
+    {
+        public static T GetOrAddComponent<T>(this GameObject gameObject) where T : Component
+        {
+            var component = gameObject.GetComponent<T>();
+            return component != null ? component : gameObject.AddComponent<T>();
+        }
+    }
+}
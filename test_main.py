@@ -0,0 +1,40 @@
+import os
+import sys
+import json
+import subprocess
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def run_main(*args, cwd):
+    return subprocess.run([sys.executable, MAIN, *args], cwd=cwd, capture_output=True, text=True, timeout=60)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_index_json_stdout_is_only_json(tmp_path):
+    write_json(str(tmp_path / "core" / "package.json"), {"name": "com.test.core", "version": "1.0.0"})
+    write_json(str(tmp_path / "core" / "Runtime" / "Core.asmdef"), {"name": "Core", "rootNamespace": "Core"})
+
+    result = run_main("index", str(tmp_path), "--json", cwd=str(tmp_path))
+
+    assert result.returncode == 0, result.stderr
+    index = json.loads(result.stdout)
+    assert [package["name"] for package in index["packages"]] == ["com.test.core"]
+    # O log continua no stderr
+    assert "Unity Package Forge starting" in result.stderr
+
+
+def test_analyze_json_stdout_is_only_json(tmp_path):
+    write_json(str(tmp_path / "A" / "A.asmdef"), {"name": "A", "references": ["B"]})
+    write_json(str(tmp_path / "B" / "B.asmdef"), {"name": "B"})
+
+    result = run_main("analyze", str(tmp_path), "--json", cwd=str(tmp_path))
+
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout)
+    assert {assembly["name"] for assembly in report["assemblies"]} == {"A", "B"}
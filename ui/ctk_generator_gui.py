@@ -1,14 +1,16 @@
 import os
 import threading
-from datetime import datetime
 from tkinter import filedialog, messagebox, BooleanVar, StringVar, DoubleVar
 import customtkinter as ctk
 from ui.strings import *
 from config.config_manager import ConfigManager
 from core.github_manager import GitHubManager
 from core.package_generator import PackageGenerator
+from ui.update_queue import UIUpdateQueue
+from ui.log_store import LogStore, DEFAULT_VIEW_MAX_LINES
 from utils.helpers import open_folder, validate_package_name
 from utils.version_utils import get_current_version, extract_package_name_from_full_name
+from utils import startup_timer
 
 
 class PackageGeneratorGUI:
@@ -27,15 +29,28 @@ class PackageGeneratorGUI:
         self.config_manager = ConfigManager()
         self.github_manager = GitHubManager(self.config_manager)
         self.package_generator = PackageGenerator(self.config_manager)
+        self._job_journal = None
+
+        try:
+            log_max_lines = int(self.config_manager.get_value(key='log_max_lines', default=DEFAULT_VIEW_MAX_LINES))
+        except (TypeError, ValueError):
+            log_max_lines = DEFAULT_VIEW_MAX_LINES
+        self.log_store = LogStore(view_max_lines=log_max_lines)
+        self._log_view_lines = 0
+        self._log_view_dirty = False
 
         self.package_generator.set_log_callback(self.add_log)
         self.package_generator.set_progress_callback(self.update_progress)
 
         self.init_variables()
-        self.create_ui()
+        with startup_timer.measure("widget creation"):
+            self.create_ui()
         self.load_ui_values()
         self.setup_bindings()
 
+        self.ui_queue = UIUpdateQueue(self.root, self._apply_progress, self._apply_logs)
+        self.ui_queue.start()
+
     def init_variables(self):
         self.display_name = StringVar()
         self.description = StringVar()
@@ -66,6 +81,7 @@ class PackageGeneratorGUI:
         self.progress_messages = StringVar(value="Pronto para começar")  # Nova variável para mensagens de progresso
         self.unity_dependencies = {}
         self.selected_dependencies = []
+        self.dependency_vars = {}
         self.dependency_widgets = {}  # Para armazenar widgets de dependência
 
         self.display_name.trace('w', self.on_display_name_change)
@@ -112,7 +128,7 @@ class PackageGeneratorGUI:
         subtitle.grid(row=1, column=0, pady=(0, 8))
 
     def create_tabs(self):
-        self.tab_view = ctk.CTkTabview(self.main_frame, height=550)
+        self.tab_view = ctk.CTkTabview(self.main_frame, height=550, command=self.on_tab_change)
         self.tab_view.grid(row=1, column=0, sticky="ew", pady=5)
         self.tab_view.grid_columnconfigure(0, weight=1)
 
@@ -128,12 +144,32 @@ class PackageGeneratorGUI:
         for tab_name, tab_key in tabs:
             self.tab_view.add(tab_name)
 
-        self.create_package_tab()
-        self.create_config_tab()
-        self.create_github_tab()
-        self.create_dependencies_tab()
-        self.create_debug_tab()
-        self.create_about_tab()
+        # As abas são construídas na primeira ativação; só a de Pacote é pintada de início
+        self._tab_builders = {
+            "📦 Pacote": self.create_package_tab,
+            "⚙️ Configurações": self.create_config_tab,
+            "🐙 GitHub": self.create_github_tab,
+            "🔧 Dependências": self.create_dependencies_tab,
+            "🐛 Debug": self.create_debug_tab,
+            "ℹ️ Sobre": self.create_about_tab
+        }
+        self._built_tabs = set()
+
+        self.tab_view.set("📦 Pacote")
+        self.ensure_tab_built("📦 Pacote")
+
+    def ensure_tab_built(self, tab_name):
+        if tab_name in self._built_tabs:
+            return
+        self._built_tabs.add(tab_name)
+        with startup_timer.measure(f"tab {tab_name}"):
+            self._tab_builders[tab_name]()
+
+    def on_tab_change(self):
+        current = self.tab_view.get()
+        self.ensure_tab_built(current)
+        if current == "🐛 Debug" and self._log_view_dirty:
+            self._render_log_view()
 
     def create_entry_row(self, parent, label, variable, placeholder="", row=0):
         frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -452,6 +488,7 @@ class PackageGeneratorGUI:
             text_color="gray60"
         )
         self.repo_preview_label.grid(row=3, column=0, sticky="w", padx=12, pady=8)
+        self.on_display_name_change()
 
         instructions_section = self.create_section(tab, "📋 Como obter um Token", 2)
 
@@ -766,62 +803,74 @@ class PackageGeneratorGUI:
             self.selected_deps_text.insert("1.0", preview_text)
 
     def generate_package(self):
-        def run_generation():
-            try:
-                if not self.display_name.get().strip():
-                    self.add_log("❌ Nome de exibição é obrigatório")
-                    return
+        if not self.display_name.get().strip():
+            self.add_log("❌ Nome de exibição é obrigatório")
+            return
 
-                if not self.folder_path.get().strip():
-                    self.add_log("❌ Pasta de destino é obrigatória")
-                    return
+        if not self.folder_path.get().strip():
+            self.add_log("❌ Pasta de destino é obrigatória")
+            return
 
-                # Bloquear UI durante a geração
-                self.toggle_ui_state(disabled=True)
-                self.root.title(f"Unity Package Forge v{get_current_version()} [Gerando...]")
+        # Coleta os valores dos widgets na thread do Tk antes de iniciar o trabalho
+        selected_deps = {}
+        for package_id, var in self.dependency_vars.items():
+            if var.get() and self._is_valid_unity_package_id(package_id):
+                custom_info = self.config_manager.get_dependency_info(package_id)
+                if custom_info:
+                    version = custom_info["version"]
+                else:
+                    version = "1.0.0"
+                    for name, deps in UNITY_DEPENDENCIES.items():
+                        if package_id in deps:
+                            version = deps[package_id]
+                            break
+                selected_deps[package_id] = version
+
+        params = {
+            "base_path": self.folder_path.get(),
+            "name": self.display_name.get(),
+            "display_name": self.display_name.get(),
+            "description": self.description.get(),
+            "version": self.version.get(),
+            "create_samples": self.create_samples.get(),
+            "create_runtime": self.create_runtime.get(),
+            "create_editor": self.create_editor.get(),
+            "create_tests": self.create_tests.get(),
+            "create_github": self.create_github.get(),
+            "license_type": self.license_type.get(),
+            "unity_dependencies": selected_deps if selected_deps else None
+        }
+        create_repo = self.create_repo.get()
+        repo_private = self.repo_private.get()
 
-                selected_deps = {}
-                for package_id, var in self.dependency_vars.items():
-                    if var.get() and self._is_valid_unity_package_id(package_id):
-                        custom_info = self.config_manager.get_dependency_info(package_id)
-                        if custom_info:
-                            version = custom_info["version"]
-                        else:
-                            version = "1.0.0"
-                            for name, deps in UNITY_DEPENDENCIES.items():
-                                if package_id in deps:
-                                    version = deps[package_id]
-                                    break
-                        selected_deps[package_id] = version
-
-                package_path = self.package_generator.create_package_structure(
-                    base_path=self.folder_path.get(),
-                    name=self.display_name.get(),
-                    display_name=self.display_name.get(),
-                    description=self.description.get(),
-                    version=self.version.get(),
-                    create_samples=self.create_samples.get(),
-                    create_runtime=self.create_runtime.get(),
-                    create_editor=self.create_editor.get(),
-                    create_tests=self.create_tests.get(),
-                    create_github=self.create_github.get(),
-                    license_type=self.license_type.get(),
-                    unity_dependencies=selected_deps if selected_deps else None
-                )
+        # Bloquear UI durante a geração
+        self.toggle_ui_state(disabled=True)
+        self.root.title(f"Unity Package Forge v{get_current_version()} [Gerando...]")
+
+        def run_generation():
+            self.log_store.current_package = params["display_name"]
+            try:
+                package_path = self.package_generator.create_package_structure(**params)
+
+                self.log_store.current_package = None
 
-                if self.create_repo.get():
+                if create_repo:
                     if self.github_manager.is_configured():
+                        # Etapas concluídas ficam no journal; repetir após uma queda retoma de onde parou
+                        journal_key = os.path.abspath(package_path)
                         result = self.github_manager.setup_repository_with_semantic_release(
                             package_path=package_path,
-                            display_name=self.display_name.get(),
-                            description=self.description.get(),
-                            private=self.repo_private.get(),
-                            initial_version=self.version.get()
+                            display_name=params["display_name"],
+                            description=params["description"],
+                            private=repo_private,
+                            initial_version=params["version"],
+                            steps=self.job_journal.steps(journal_key)
                         )
 
                         if "success" in result:
+                            self.job_journal.clear_steps(journal_key)
                             self.add_log(f"✅ {result['message']}")
-                            repo_url = self.github_manager.get_repository_url(self.display_name.get())
+                            repo_url = result["clone_url"]
                             self.add_log(f"📋 URL para Unity: {repo_url}")
                         else:
                             self.add_log(f"❌ Erro no GitHub: {result['error']}")
@@ -830,20 +879,34 @@ class PackageGeneratorGUI:
 
                 self.add_log("🎉 Pacote gerado com sucesso!")
                 self.update_progress(100, "Concluído!")
-
-                if messagebox.askyesno("Sucesso", "✅ Pacote criado com sucesso!\nDeseja abrir a pasta?"):
-                    open_folder(package_path)
+                self.ui_queue.post_call(self._on_generation_success, package_path)
 
             except Exception as e:
                 self.add_log(f"❌ Erro crítico: {str(e)}")
                 self.update_progress(0, f"Erro: {str(e)}")
             finally:
+                self.log_store.current_package = None
                 # Restaurar estado da UI
-                self.toggle_ui_state(disabled=False)
-                self.root.title(f"Unity Package Forge v{get_current_version()}")
+                self.ui_queue.post_call(self._on_generation_finished)
 
         threading.Thread(target=run_generation, daemon=True).start()
 
+    @property
+    def job_journal(self):
+        # Aberto só quando um repositório é criado pela primeira vez
+        if self._job_journal is None:
+            from core.job_journal import JobJournal
+            self._job_journal = JobJournal()
+        return self._job_journal
+
+    def _on_generation_success(self, package_path):
+        if messagebox.askyesno("Sucesso", "✅ Pacote criado com sucesso!\nDeseja abrir a pasta?"):
+            open_folder(package_path)
+
+    def _on_generation_finished(self):
+        self.toggle_ui_state(disabled=False)
+        self.root.title(f"Unity Package Forge v{get_current_version()}")
+
     def toggle_ui_state(self, disabled=True):
         """Habilita/desabilita elementos da UI durante operações longas"""
         state = "disabled" if disabled else "normal"
@@ -864,38 +927,76 @@ class PackageGeneratorGUI:
             self.generate_btn.configure(state="normal", text="🚀 Gerar Pacote Unity")
 
     def update_progress(self, value, message=""):
+        """Enfileira atualização de progresso; seguro para chamar de qualquer thread"""
+        self.ui_queue.post_progress(value, message)
+        if message:
+            self.add_log(message)  # Mostra também no log
+
+    def _apply_progress(self, value, message):
         self.progress_var.set(value / 100)
         if message:
             self.progress_messages.set(message)
-            self.add_log(message)  # Mostra também no log
-        self.root.update_idletasks()  # Força atualização da UI
 
     def add_log(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-
-        # Configurar cores baseadas no tipo de mensagem
-        if message.startswith("✅") or message.startswith("🎉"):
-            tag = "success"
-        elif message.startswith("❌"):
-            tag = "error"
-        elif message.startswith("⚠️"):
-            tag = "warning"
-        else:
-            tag = "info"
+        """Registra a mensagem e enfileira sua exibição; seguro para chamar de qualquer thread"""
+        record = self.log_store.add(message)
+        self.ui_queue.post_log(record)
+
+    def _apply_logs(self, batch):
+        # Com a aba de log oculta, apenas marca a visão como desatualizada
+        if self.tab_view.get() != "🐛 Debug":
+            self._log_view_dirty = True
+            return
+
+        if self._log_view_dirty:
+            self._render_log_view()
+            return
+
+        max_lines = self.log_store.view_max_lines
+        rebuild = len(batch) >= max_lines
+        if rebuild:
+            batch = batch[-max_lines:]
 
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", log_entry + "\n", tag)
+        if rebuild:
+            self.log_text.delete("1.0", "end")
+            self._log_view_lines = 0
+
+        for record in batch:
+            self.log_text.insert("end", record.format() + "\n", record.level)
+        self._log_view_lines += len(batch)
+
+        overflow = self._log_view_lines - max_lines
+        if overflow > 0:
+            self.log_text.delete("1.0", f"{overflow + 1}.0")
+            self._log_view_lines = max_lines
+
+        self.log_text.configure(state="disabled")
+        self.log_text.see("end")
+
+    def _render_log_view(self):
+        """Reconstrói o widget de log a partir da janela do LogStore"""
+        records = self.log_store.view()
+        self.log_text.configure(state="normal")
+        self.log_text.delete("1.0", "end")
+        for record in records:
+            self.log_text.insert("end", record.format() + "\n", record.level)
         self.log_text.configure(state="disabled")
         self.log_text.see("end")
+        self._log_view_lines = len(records)
+        self._log_view_dirty = False
 
     def clear_log(self):
+        self.log_store.clear()
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
+        self._log_view_lines = 0
+        self._log_view_dirty = False
 
     def save_log(self):
-        content = self.log_text.get("1.0", "end")
+        # Salva o histórico completo, não apenas as linhas visíveis
+        content = self.log_store.format_all()
         if content.strip():
             filename = filedialog.asksaveasfilename(
                 defaultextension=".log",
@@ -911,24 +1012,32 @@ class PackageGeneratorGUI:
         self.verify_github_credentials_direct()
 
     def verify_github_credentials_direct(self):
+        self.show_loading_indicator(True)
+        username = self.github_username.get()
+        token = self.github_token.get()
+
         def verify():
-            self.show_loading_indicator(True)
             try:
                 temp_github_manager = GitHubManager(self.config_manager)
-                temp_github_manager.username = self.github_username.get()
-                temp_github_manager.token = self.github_token.get()
+                temp_github_manager.username = username
+                temp_github_manager.token = token
 
                 success, message = temp_github_manager.check_credentials()
-                self.github_status_label.configure(
-                    text=message,
-                    text_color="green" if success else "red"
-                )
+                self.ui_queue.post_call(self._show_github_status, success, message)
                 self.add_log(message)
             finally:
-                self.show_loading_indicator(False)
+                self.ui_queue.post_call(self.show_loading_indicator, False)
 
         threading.Thread(target=verify, daemon=True).start()
 
+    def _show_github_status(self, success, message):
+        if not hasattr(self, 'github_status_label'):
+            return
+        self.github_status_label.configure(
+            text=message,
+            text_color="green" if success else "red"
+        )
+
     def show_loading_indicator(self, show=True):
         """Mostra/oculta indicador de carregamento durante operações longas"""
         if show and not hasattr(self, "loading_indicator"):
@@ -960,17 +1069,15 @@ class PackageGeneratorGUI:
             self.config_manager.set_value(key='last_directory', value=folder)
 
     def verify_github_credentials(self):
+        self.show_loading_indicator(True)
+
         def verify():
-            self.show_loading_indicator(True)
             try:
                 success, message = self.github_manager.check_credentials()
-                self.github_status_label.configure(
-                    text=message,
-                    text_color="green" if success else "red"
-                )
+                self.ui_queue.post_call(self._show_github_status, success, message)
                 self.add_log(message)
             finally:
-                self.show_loading_indicator(False)
+                self.ui_queue.post_call(self.show_loading_indicator, False)
 
         threading.Thread(target=verify, daemon=True).start()
 
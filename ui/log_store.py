@@ -0,0 +1,90 @@
+import threading
+from collections import deque
+from datetime import datetime
+
+
+LEVEL_SUCCESS = "success"
+LEVEL_ERROR = "error"
+LEVEL_WARNING = "warning"
+LEVEL_INFO = "info"
+
+DEFAULT_VIEW_MAX_LINES = 2000
+
+
+def classify_level(message):
+    """Determina o nível de uma mensagem pelo prefixo (feito uma única vez por registro)"""
+    if message.startswith("✅") or message.startswith("🎉"):
+        return LEVEL_SUCCESS
+    elif message.startswith("❌"):
+        return LEVEL_ERROR
+    elif message.startswith("⚠️"):
+        return LEVEL_WARNING
+    return LEVEL_INFO
+
+
+class LogRecord:
+    """Registro estruturado de log"""
+
+    __slots__ = ("timestamp", "level", "message", "package")
+
+    def __init__(self, message, level=None, package=None, timestamp=None):
+        self.message = message
+        self.level = level or classify_level(message)
+        self.package = package
+        self.timestamp = timestamp or datetime.now()
+
+    def format(self):
+        return f"[{self.timestamp.strftime('%H:%M:%S')}] {self.message}"
+
+
+class LogStore:
+    """Armazena o histórico completo de logs e uma janela limitada para exibição.
+
+    O histórico completo é mantido para ``save_log`` e filtros; a janela de
+    exibição é um ring buffer com no máximo ``view_max_lines`` registros, que
+    é o que o widget de texto efetivamente renderiza.
+    """
+
+    def __init__(self, view_max_lines=DEFAULT_VIEW_MAX_LINES):
+        self.view_max_lines = max(1, int(view_max_lines))
+        self.current_package = None
+        self._records = []
+        self._view = deque(maxlen=self.view_max_lines)
+        self._lock = threading.Lock()
+
+    def add(self, message, level=None, package=None):
+        record = LogRecord(message, level, package or self.current_package)
+        with self._lock:
+            self._records.append(record)
+            self._view.append(record)
+        return record
+
+    def clear(self):
+        with self._lock:
+            self._records = []
+            self._view.clear()
+
+    def __len__(self):
+        return len(self._records)
+
+    def view(self):
+        """Retorna os registros atualmente visíveis (mais recentes)"""
+        with self._lock:
+            return list(self._view)
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def filter(self, level=None, package=None, since=None):
+        """Filtra o histórico por nível, pacote e/ou horário mínimo"""
+        levels = {level} if isinstance(level, str) else (set(level) if level else None)
+        return [
+            record for record in self.records()
+            if (levels is None or record.level in levels)
+            and (package is None or record.package == package)
+            and (since is None or record.timestamp >= since)
+        ]
+
+    def format_all(self):
+        return "".join(record.format() + "\n" for record in self.records())
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from ui.log_store import LogStore, LEVEL_SUCCESS, LEVEL_ERROR, LEVEL_WARNING, LEVEL_INFO, classify_level
+
+
+def test_classify_level_by_prefix():
+    assert classify_level("✅ Pacote criado") == LEVEL_SUCCESS
+    assert classify_level("🎉 Pronto") == LEVEL_SUCCESS
+    assert classify_level("❌ Erro") == LEVEL_ERROR
+    assert classify_level("⚠️ Aviso") == LEVEL_WARNING
+    assert classify_level("📁 Criando pasta") == LEVEL_INFO
+
+
+def test_view_is_a_ring_buffer_but_history_is_complete():
+    store = LogStore(view_max_lines=3)
+    for i in range(10):
+        store.add(f"linha {i}")
+
+    assert len(store) == 10
+    assert [record.message for record in store.view()] == ["linha 7", "linha 8", "linha 9"]
+    assert [record.message for record in store.records()][0] == "linha 0"
+    assert store.format_all().count("\n") == 10
+
+
+def test_view_max_lines_has_a_minimum_of_one():
+    store = LogStore(view_max_lines=0)
+    store.add("a")
+    store.add("b")
+    assert [record.message for record in store.view()] == ["b"]
+
+
+def test_filter_by_level_package_and_time():
+    store = LogStore()
+    store.current_package = "Core"
+    store.add("✅ ok")
+    store.add("❌ falhou")
+    store.add("⚠️ aviso", package="Net")
+
+    assert [r.message for r in store.filter(level=LEVEL_ERROR)] == ["❌ falhou"]
+    assert [r.message for r in store.filter(level=[LEVEL_ERROR, LEVEL_WARNING])] == ["❌ falhou", "⚠️ aviso"]
+    assert [r.message for r in store.filter(package="Net")] == ["⚠️ aviso"]
+    assert store.filter(since=datetime.now() + timedelta(seconds=60)) == []
+
+
+def test_clear():
+    store = LogStore(view_max_lines=2)
+    store.add("a")
+    store.clear()
+    assert len(store) == 0
+    assert store.view() == []
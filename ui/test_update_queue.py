@@ -0,0 +1,104 @@
+import threading
+
+from ui.update_queue import UIUpdateQueue
+
+
+class FakeRoot:
+    """Só o necessário do Tk: after/after_cancel, com o pump disparado manualmente"""
+
+    def __init__(self):
+        self.scheduled = []
+        self.cancelled = []
+
+    def after(self, interval_ms, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, []
+        for callback in pending:
+            callback()
+
+
+def make_queue():
+    applied = {"progress": [], "logs": []}
+    root = FakeRoot()
+    ui_queue = UIUpdateQueue(
+        root,
+        lambda value, message: applied["progress"].append((value, message)),
+        lambda batch: applied["logs"].append(list(batch)),
+    )
+    return root, ui_queue, applied
+
+
+def test_progress_is_coalesced_keeping_last_message():
+    _, ui_queue, applied = make_queue()
+    ui_queue.post_progress(10, "Criando pastas")
+    ui_queue.post_progress(20)
+    ui_queue.post_progress(30)
+    ui_queue.flush()
+    assert applied["progress"] == [(30, "Criando pastas")]
+
+    ui_queue.flush()
+    assert applied["progress"] == [(30, "Criando pastas")]
+
+
+def test_logs_from_worker_threads_are_delivered_in_one_batch():
+    _, ui_queue, applied = make_queue()
+
+    def worker(prefix):
+        for i in range(50):
+            ui_queue.post_log(f"{prefix}{i}")
+
+    threads = [threading.Thread(target=worker, args=(prefix,)) for prefix in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ui_queue.flush()
+
+    assert len(applied["logs"]) == 1
+    batch = applied["logs"][0]
+    assert sorted(batch) == sorted(f"{p}{i}" for p in "ab" for i in range(50))
+    # A ordem de cada produtor é preservada
+    assert [line for line in batch if line.startswith("a")] == [f"a{i}" for i in range(50)]
+
+
+def test_calls_run_on_flush_and_errors_do_not_stop_the_pump():
+    _, ui_queue, _ = make_queue()
+    calls = []
+
+    def fail():
+        raise RuntimeError("falhou")
+
+    ui_queue.post_call(fail)
+    ui_queue.post_call(calls.append, "ok")
+    ui_queue.flush()
+    assert calls == ["ok"]
+
+
+def test_pump_reschedules_until_stopped():
+    root, ui_queue, applied = make_queue()
+    ui_queue.start()
+    ui_queue.post_log("linha")
+    root.run_pending()
+    assert applied["logs"] == [["linha"]]
+    assert len(root.scheduled) == 1
+
+    ui_queue.stop()
+    assert root.cancelled
+    root.run_pending()
+    assert root.scheduled == []
+
+
+def test_is_ui_thread():
+    _, ui_queue, _ = make_queue()
+    result = []
+    thread = threading.Thread(target=lambda: result.append(ui_queue.is_ui_thread()))
+    thread.start()
+    thread.join()
+    assert ui_queue.is_ui_thread()
+    assert result == [False]
@@ -0,0 +1,98 @@
+import queue
+import threading
+
+
+class UIUpdateQueue:
+    """Fila produtor/consumidor para atualizações de UI vindas de threads de trabalho.
+
+    Threads de trabalho apenas enfileiram eventos; a thread do Tk drena a fila
+    em um pump agendado com ``root.after`` a uma taxa fixa de quadros.
+    Atualizações de progresso são coalescidas (só a última é aplicada) e linhas
+    de log são entregues em lote.
+    """
+
+    DEFAULT_FPS = 30
+
+    def __init__(self, root, apply_progress, apply_logs, fps=DEFAULT_FPS):
+        self.root = root
+        self.apply_progress = apply_progress
+        self.apply_logs = apply_logs
+        self.interval_ms = max(1, int(1000 / fps))
+
+        self._logs = queue.SimpleQueue()
+        self._calls = queue.SimpleQueue()
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._main_thread = threading.current_thread()
+        self._after_id = None
+        self._running = False
+
+    def is_ui_thread(self):
+        """Indica se a chamada atual está na thread que criou a fila (thread do Tk)"""
+        return threading.current_thread() is self._main_thread
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._schedule()
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post_progress(self, value, message=""):
+        with self._progress_lock:
+            if self._pending_progress and not message:
+                # Mantém a última mensagem pendente se a nova não tiver texto
+                message = self._pending_progress[1]
+            self._pending_progress = (value, message)
+
+    def post_log(self, record):
+        self._logs.put(record)
+
+    def post_call(self, func, *args, **kwargs):
+        """Agenda uma chamada arbitrária para ser executada na thread do Tk"""
+        self._calls.put((func, args, kwargs))
+
+    def _schedule(self):
+        if self._running:
+            self._after_id = self.root.after(self.interval_ms, self._pump)
+
+    def _pump(self):
+        try:
+            self.flush()
+        finally:
+            self._schedule()
+
+    def flush(self):
+        """Drena a fila e aplica as atualizações pendentes (apenas na thread do Tk)"""
+        with self._progress_lock:
+            progress = self._pending_progress
+            self._pending_progress = None
+
+        if progress is not None:
+            self.apply_progress(*progress)
+
+        batch = []
+        while True:
+            try:
+                batch.append(self._logs.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.apply_logs(batch)
+
+        while True:
+            try:
+                func, args, kwargs = self._calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                print(f"Erro ao aplicar atualização de UI: {e}")
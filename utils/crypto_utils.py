@@ -1,9 +1,6 @@
 import base64
 import os
 import hashlib
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 
 class SimpleCrypto:
@@ -11,6 +8,9 @@ class SimpleCrypto:
 
     def __init__(self, machine_key=None):
         """Inicializa o sistema de criptografia com chave da máquina"""
+        # cryptography é importado sob demanda para não pesar na inicialização
+        from cryptography.fernet import Fernet
+
         if machine_key is None:
             machine_key = self._get_machine_key()
         
@@ -49,6 +49,9 @@ class SimpleCrypto:
     def _derive_key(self, password):
         """Deriva chave criptográfica segura usando PBKDF2"""
         try:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
             # Salt específico da aplicação (não deve mudar)
             salt = b"unity_package_forge_salt_v2_2025"
 
@@ -150,6 +153,8 @@ class SimpleCrypto:
     def change_key(self, new_machine_key):
         """Permite trocar a chave de criptografia"""
         try:
+            from cryptography.fernet import Fernet
+
             self.key = self._derive_key(new_machine_key)
             self.cipher = Fernet(self.key)
             return True
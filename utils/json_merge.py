@@ -0,0 +1,47 @@
+_MISSING = object()
+
+
+def three_way_merge(base, ours, theirs, path=""):
+    """Merge de 3 vias entre objetos JSON.
+
+    ``base`` é a versão gerada anteriormente, ``ours`` a versão editada pelo
+    usuário e ``theirs`` a nova versão gerada. Dicionários são mesclados por
+    chave; listas e valores simples são atômicos. Quando os dois lados mudam
+    a mesma chave de forma diferente, a edição do usuário é mantida e o
+    caminho da chave entra na lista de conflitos.
+
+    Retorna ``(merged, conflicts)``.
+    """
+    conflicts = []
+    merged = _merge_value(base, ours, theirs, path, conflicts)
+    return (None if merged is _MISSING else merged), conflicts
+
+
+def _merge_value(base, ours, theirs, path, conflicts):
+    if ours == theirs:
+        return ours
+    if theirs == base:
+        return ours
+    if ours == base:
+        return theirs
+    if isinstance(base, dict) and isinstance(ours, dict) and isinstance(theirs, dict):
+        return _merge_dict(base, ours, theirs, path, conflicts)
+    if isinstance(ours, dict) and isinstance(theirs, dict) and base is _MISSING:
+        return _merge_dict({}, ours, theirs, path, conflicts)
+
+    conflicts.append(path or "/")
+    return ours
+
+
+def _merge_dict(base, ours, theirs, path, conflicts):
+    merged = {}
+    # Mantém a ordem do arquivo do usuário e acrescenta chaves novas do gerador no fim
+    keys = list(ours) + [key for key in theirs if key not in ours]
+    for key in keys:
+        value = _merge_value(
+            base.get(key, _MISSING), ours.get(key, _MISSING), theirs.get(key, _MISSING),
+            f"{path}/{key}", conflicts
+        )
+        if value is not _MISSING:
+            merged[key] = value
+    return merged
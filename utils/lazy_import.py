@@ -0,0 +1,49 @@
+import importlib
+import importlib.util
+import sys
+import threading
+
+
+class LazyModule:
+    """Proxy que só importa o módulo real no primeiro acesso a um atributo"""
+
+    def __init__(self, module_name):
+        self.__dict__['_module_name'] = module_name
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            with self.__dict__['_lock']:
+                module = self.__dict__['_module']
+                if module is None:
+                    module = importlib.import_module(self.__dict__['_module_name'])
+                    self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __repr__(self):
+        state = "carregado" if self.__dict__['_module'] is not None else "não carregado"
+        return f"<LazyModule '{self.__dict__['_module_name']}' ({state})>"
+
+
+def lazy_import(module_name):
+    """Retorna o módulo se já importado, senão um proxy que o importa sob demanda"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    return LazyModule(module_name)
+
+
+def is_module_available(module_name):
+    """Verifica se um módulo pode ser importado sem importá-lo"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
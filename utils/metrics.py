@@ -0,0 +1,225 @@
+import json
+import bisect
+import threading
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = 9464
+
+
+def _label_key(labelnames, labels):
+    if set(labels) != set(labelnames):
+        raise ValueError(f"Labels esperados {list(labelnames)}, recebidos {sorted(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, key, extra=None):
+    pairs = list(zip(labelnames, key))
+    if extra:
+        pairs.extend(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    """Contador monotônico, opcionalmente com labels"""
+
+    type_name = "counter"
+
+    def __init__(self, name, help_text="", labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("Contadores só podem ser incrementados")
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(self.labelnames, labels), 0)
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                {"labels": dict(zip(self.labelnames, key)), "value": value}
+                for key, value in sorted(self._values.items())
+            ]
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """Histograma com buckets cumulativos no estilo Prometheus"""
+
+    type_name = "histogram"
+
+    def __init__(self, name, help_text="", labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self):
+        result = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(self.buckets, series["counts"]):
+                    cumulative += count
+                    buckets[str(bound)] = cumulative
+                buckets["+Inf"] = series["count"]
+                result.append({
+                    "labels": dict(zip(self.labelnames, key)),
+                    "count": series["count"],
+                    "sum": series["sum"],
+                    "buckets": buckets,
+                })
+        return result
+
+    def render(self):
+        lines = []
+        for entry in self.snapshot():
+            key = tuple(entry["labels"][name] for name in self.labelnames)
+            for bound, cumulative in entry["buckets"].items():
+                labels = _format_labels(self.labelnames, key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {entry['sum']}")
+            lines.append(f"{self.name}_count{labels} {entry['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registro em processo de métricas (contadores e histogramas)"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Métrica '{name}' já registrada como {metric.type_name}")
+            return metric
+
+    def counter(self, name, help_text="", labelnames=()):
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def histogram(self, name, help_text="", labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def snapshot(self):
+        """Retorna o estado atual de todas as métricas como dicionário serializável"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {"type": metric.type_name, "help": metric.help_text, "series": metric.snapshot()}
+            for metric in metrics
+        }
+
+    def render_prometheus(self):
+        """Exporta no formato texto do Prometheus (versão 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            if metric.help_text:
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Remove todas as métricas (útil para testes)"""
+        with self._lock:
+            self._metrics.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry():
+    """Retorna o registro global de métricas do processo"""
+    return _registry
+
+
+def counter(name, help_text="", labelnames=()):
+    return _registry.counter(name, help_text, labelnames)
+
+
+def histogram(name, help_text="", labelnames=(), buckets=DEFAULT_BUCKETS):
+    return _registry.histogram(name, help_text, labelnames, buckets)
+
+
+def start_metrics_server(port=DEFAULT_METRICS_PORT, host=DEFAULT_METRICS_HOST, registry=None):
+    """Sobe um endpoint HTTP local com ``/metrics`` (Prometheus) e ``/metrics.json`` (snapshot).
+
+    Roda em uma thread daemon; retorna o servidor para permitir ``shutdown()``.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = registry or _registry
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body = registry.render_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(registry.snapshot(), ensure_ascii=False).encode("utf-8")
+                content_type = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
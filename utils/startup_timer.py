@@ -0,0 +1,78 @@
+import time
+from contextlib import contextmanager
+
+# Referência de início do processo (o mais cedo possível, no primeiro import deste módulo)
+_start_time = time.perf_counter()
+_stages = []
+_finished = False
+# Profundidade atual de measure(): etapas internas aparecem no relatório, mas não somam de novo
+_depth = 0
+
+
+def set_start_time(value):
+    """Permite ao ponto de entrada informar um instante de início mais antigo"""
+    global _start_time
+    _start_time = value
+
+
+def record(stage, seconds, depth=0):
+    """Registra a duração de uma etapa de inicialização"""
+    if not _finished:
+        _stages.append((stage, seconds, depth, time.perf_counter() - seconds))
+
+
+@contextmanager
+def measure(stage):
+    """Mede o bloco como uma etapa de inicialização (pode conter outras etapas)"""
+    global _depth
+    if _finished:
+        yield
+        return
+    depth = _depth
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depth = depth
+        record(stage, time.perf_counter() - start, depth)
+
+
+def elapsed():
+    return time.perf_counter() - _start_time
+
+
+def get_stages():
+    return [(stage, seconds) for stage, seconds, _, _ in _stages]
+
+
+def finish():
+    """Encerra a coleta e retorna o relatório de inicialização"""
+    global _finished
+    total = elapsed()
+    _finished = True
+    return format_report(total)
+
+
+def format_report(total=None):
+    total = elapsed() if total is None else total
+    lines = ["Tempo de inicialização:"]
+    accounted = 0.0
+    # Etapas internas terminam (e são registradas) antes da externa: o relatório segue a ordem de início
+    for stage, seconds, depth, _ in sorted(_stages, key=lambda s: (s[3], s[2])):
+        if depth == 0:
+            accounted += seconds
+        label = "  " * depth + stage
+        lines.append(f"  {label:<24} {seconds * 1000:8.1f} ms")
+    lines.append(f"  {'outros':<24} {max(0.0, total - accounted) * 1000:8.1f} ms")
+    lines.append(f"  {'total':<24} {total * 1000:8.1f} ms")
+    return "\n".join(lines)
+
+
+def reset():
+    """Reseta a coleta (útil para testes)"""
+    global _start_time, _finished, _depth
+    _start_time = time.perf_counter()
+    _stages.clear()
+    _finished = False
+    _depth = 0
@@ -0,0 +1,62 @@
+from utils.json_merge import three_way_merge
+
+
+def test_generator_change_is_applied_and_user_edit_kept():
+    base = {"name": "com.test.core", "version": "0.1.0", "author": {"name": "A"}}
+    ours = {"name": "com.test.core", "version": "0.1.0", "author": {"name": "A"}, "keywords": ["x"]}
+    theirs = {"name": "com.test.core", "version": "0.2.0", "author": {"name": "B"}}
+
+    merged, conflicts = three_way_merge(base, ours, theirs)
+
+    assert merged == {"name": "com.test.core", "version": "0.2.0", "author": {"name": "B"}, "keywords": ["x"]}
+    assert conflicts == []
+
+
+def test_conflict_keeps_user_value_and_reports_path():
+    base = {"author": {"name": "A", "email": "a@x"}}
+    ours = {"author": {"name": "Local", "email": "a@x"}}
+    theirs = {"author": {"name": "Gerado", "email": "b@x"}}
+
+    merged, conflicts = three_way_merge(base, ours, theirs)
+
+    assert merged == {"author": {"name": "Local", "email": "b@x"}}
+    assert conflicts == ["/author/name"]
+
+
+def test_removals_on_either_side():
+    base = {"a": 1, "b": 2, "c": 3}
+    ours = {"a": 1, "c": 3}
+    theirs = {"a": 1, "b": 2}
+
+    merged, conflicts = three_way_merge(base, ours, theirs)
+
+    assert merged == {"a": 1}
+    assert conflicts == []
+
+
+def test_lists_are_atomic():
+    merged, conflicts = three_way_merge({"k": [1]}, {"k": [1, 2]}, {"k": [1, 3]})
+    assert merged == {"k": [1, 2]}
+    assert conflicts == ["/k"]
+
+
+def test_key_order_follows_user_file_then_new_keys():
+    base = {"b": 1, "a": 1}
+    ours = {"a": 1, "local": 1, "b": 1}
+    theirs = {"b": 1, "a": 1, "z": 1, "c": 1}
+
+    merged, _ = three_way_merge(base, ours, theirs)
+
+    assert list(merged) == ["a", "local", "b", "z", "c"]
+
+
+def test_dict_added_on_both_sides_is_merged():
+    merged, conflicts = three_way_merge({}, {"d": {"x": 1}}, {"d": {"y": 2}})
+    assert merged == {"d": {"x": 1, "y": 2}}
+    assert conflicts == []
+
+
+def test_root_conflict_path():
+    merged, conflicts = three_way_merge(1, 2, 3)
+    assert merged == 2
+    assert conflicts == ["/"]
@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import threading
+import itertools
+from contextlib import contextmanager
+
+
+class Span:
+    """Intervalo de tempo medido com relógio monotônico"""
+
+    __slots__ = ("span_id", "parent_id", "name", "attributes", "start_ns", "end_ns", "thread_id", "error")
+
+    def __init__(self, span_id, parent_id, name, attributes):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+        self.error = None
+
+    @property
+    def duration_ms(self):
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def to_dict(self):
+        return {
+            "id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "thread_id": self.thread_id,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """Span vazio usado quando não há exportadores (custo quase zero)"""
+
+    def set_attribute(self, key, value):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class JsonLinesExporter:
+    """Grava um span finalizado por linha em JSON"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class ChromeTraceExporter:
+    """Acumula spans e grava no formato Chrome Trace (chrome://tracing, Perfetto)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._events = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def export(self, span):
+        event = {
+            "name": span.name,
+            "cat": span.name.split(".")[0],
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": dict(span.attributes, error=span.error) if span.error else span.attributes,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def close(self):
+        with self._lock:
+            events = sorted(self._events, key=lambda event: event["ts"])
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+
+
+class InMemoryExporter:
+    """Mantém os spans em memória (útil para inspeção e testes)"""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def close(self):
+        pass
+
+
+class Tracer:
+    def __init__(self):
+        self._exporters = []
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+
+    @property
+    def enabled(self):
+        return bool(self._exporters)
+
+    def add_exporter(self, exporter):
+        self._exporters.append(exporter)
+        return exporter
+
+    def remove_exporter(self, exporter):
+        if exporter in self._exporters:
+            self._exporters.remove(exporter)
+
+    def shutdown(self):
+        """Fecha e remove todos os exportadores"""
+        exporters, self._exporters = self._exporters, []
+        for exporter in exporters:
+            try:
+                exporter.close()
+            except Exception as e:
+                print(f"Erro ao finalizar exportador de trace: {e}")
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_span(self):
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(self, name, **attributes):
+        if not self._exporters:
+            yield _NOOP_SPAN
+            return
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(next(self._ids), parent.span_id if parent else None, name, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+            for exporter in list(self._exporters):
+                try:
+                    exporter.export(span)
+                except Exception as e:
+                    print(f"Erro ao exportar span '{span.name}': {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer():
+    """Retorna o tracer global do processo"""
+    return _tracer
+
+
+def span(name, **attributes):
+    """Atalho para ``get_tracer().span(...)``"""
+    return _tracer.span(name, **attributes)
+
+
+def create_exporter(path):
+    """Escolhe o exportador pela extensão: ``.jsonl`` gera JSON lines, demais Chrome Trace"""
+    if str(path).endswith(".jsonl"):
+        return JsonLinesExporter(path)
+    return ChromeTraceExporter(path)
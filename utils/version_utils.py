@@ -2,6 +2,7 @@ import re
 import os
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -194,64 +195,146 @@ def _extract_version_from_package_json(package_json_path):
     return None
 
 
-def sanitize_name_for_repo(display_name):
-    """Converte nome de exibição para nome válido de repositório GitHub"""
+# Padrões pré-compilados usados na derivação de nomes
+_REPO_INVALID_CHARS = re.compile(r'[^\w\s\-]')
+_WHITESPACE = re.compile(r'\s+')
+_MULTIPLE_HYPHENS = re.compile(r'-+')
+_NAMESPACE_INVALID_CHARS = re.compile(r'[^\w\s]')
+_LEADING_DIGITS = re.compile(r'^[\d]+')
+
+PACKAGE_NAMES_CACHE_SIZE = 4096
+# Limite do nome de repositório gerado (o GitHub aceita até 100 caracteres)
+MAX_REPO_NAME_LENGTH = 80
+
+
+def _derive_repo_name(display_name):
     if not display_name:
         return "unity-package"
-    
+
     # Remove caracteres especiais e espaços
-    sanitized = re.sub(r'[^\w\s\-]', '', display_name.strip())
-    
+    sanitized = _REPO_INVALID_CHARS.sub('', display_name.strip())
+
     # Substitui espaços por hífens
-    sanitized = re.sub(r'\s+', '-', sanitized)
-    
+    sanitized = _WHITESPACE.sub('-', sanitized)
+
     # Remove múltiplos hífens
-    sanitized = re.sub(r'-+', '-', sanitized)
-    
+    sanitized = _MULTIPLE_HYPHENS.sub('-', sanitized)
+
     # Remove hífens do início e fim
     sanitized = sanitized.strip('-')
-    
+
     # Converte para minúsculas
     sanitized = sanitized.lower()
-    
+
     # Garante que não está vazio
     if not sanitized:
         sanitized = "unity-package"
-    
+
     # Garante que não seja muito longo (GitHub tem limite de 100 chars)
-    if len(sanitized) > 80:
-        sanitized = sanitized[:80].rstrip('-')
-    
+    if len(sanitized) > MAX_REPO_NAME_LENGTH:
+        sanitized = sanitized[:MAX_REPO_NAME_LENGTH].rstrip('-')
+
     return sanitized
 
 
-def get_namespace_from_display_name(display_name):
-    """Gera namespace C# a partir do nome de exibição"""
+def _derive_namespace(display_name):
     if not display_name:
         return "UnityPackage"
-    
+
     # Remove caracteres especiais
-    sanitized = re.sub(r'[^\w\s]', '', display_name.strip())
-    
+    sanitized = _NAMESPACE_INVALID_CHARS.sub('', display_name.strip())
+
     # Divide por espaços e capitaliza cada palavra
-    words = sanitized.split()
     namespace_parts = []
-    
-    for word in words:
-        if word:
-            # Capitaliza primeira letra e mantém o resto
-            clean_word = word[0].upper() + word[1:] if len(word) > 1 else word.upper()
-            # Remove números do início se existirem
-            clean_word = re.sub(r'^[\d]+', '', clean_word)
-            if clean_word:
-                namespace_parts.append(clean_word)
-    
+    for word in sanitized.split():
+        # Capitaliza primeira letra e mantém o resto
+        clean_word = word[0].upper() + word[1:]
+        # Remove números do início se existirem
+        if clean_word[0].isdigit():
+            clean_word = _LEADING_DIGITS.sub('', clean_word)
+        if clean_word:
+            namespace_parts.append(clean_word)
+
     if not namespace_parts:
         return "UnityPackage"
-    
+
     return "".join(namespace_parts)
 
 
+class PackageNames:
+    """Nomes derivados de um nome de exibição, calculados uma única vez.
+
+    Reúne o nome do repositório/pasta, o namespace C# e os nomes dos
+    assemblies; use ``get_package_names`` para obter a instância em cache.
+    """
+
+    __slots__ = ("display_name", "repo_name", "namespace", "_package_ids")
+
+    def __init__(self, display_name):
+        self.display_name = display_name
+        self.repo_name = _derive_repo_name(display_name)
+        self.namespace = _derive_namespace(display_name)
+        self._package_ids = {}
+
+    @property
+    def runtime_assembly(self):
+        return self.namespace
+
+    @property
+    def editor_assembly(self):
+        return f"{self.namespace}.Editor"
+
+    @property
+    def runtime_tests_assembly(self):
+        return f"{self.namespace}.Tests"
+
+    @property
+    def editor_tests_assembly(self):
+        return f"{self.namespace}.Editor.Tests"
+
+    def package_id(self, company_prefix, name):
+        """Identificador UPM (ex: com.example.meupacote) a partir do nome informado"""
+        key = (company_prefix, name)
+        package_id = self._package_ids.get(key)
+        if package_id is None:
+            package_name = extract_package_name_from_full_name(name).lower()
+            package_name = package_name or (self.display_name or "").lower().replace(' ', '')
+            package_id = self._package_ids[key] = f"{company_prefix}.{package_name}"
+        return package_id
+
+
+@lru_cache(maxsize=PACKAGE_NAMES_CACHE_SIZE)
+def get_package_names(display_name):
+    """``PackageNames`` do nome de exibição, memoizado"""
+    return PackageNames(display_name)
+
+
+def derive_package_names(display_names):
+    """Deriva os nomes de muitos pacotes de uma vez (na ordem de entrada).
+
+    Nomes repetidos são calculados uma vez só e o lote não ocupa o cache
+    de ``get_package_names``.
+    """
+    derived = {}
+    result = []
+    for display_name in display_names:
+        names = derived.get(display_name)
+        if names is None:
+            names = derived[display_name] = PackageNames(display_name)
+        result.append(names)
+    return result
+
+
+def sanitize_name_for_repo(display_name):
+    """Converte nome de exibição para nome válido de repositório GitHub"""
+    return get_package_names(display_name).repo_name
+
+
+def get_namespace_from_display_name(display_name):
+    """Gera namespace C# a partir do nome de exibição"""
+    return get_package_names(display_name).namespace
+
+
 def extract_package_name_from_full_name(full_name):
     """Extrai nome do pacote removendo prefixos de empresa"""
     if not full_name:
@@ -6,10 +6,16 @@ Verifica se todas as dependências e estruturas estão corretas antes do build
 """
 
 import os
+import io
 import sys
 import json
+import time
+import hashlib
+import argparse
 import subprocess
 import importlib.util
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Configuração de encoding para Windows
@@ -23,7 +29,75 @@ if sys.platform == "win32":
         except:
             pass
 
+VALIDATION_CACHE_FILE = '.validate_cache.json'
+VALIDATION_CACHE_VERSION = 1
+
+SOURCE_DIRS = ['ui', 'utils', 'core', 'config']
+REQUIRED_PACKAGES = ['customtkinter', 'requests', 'cryptography', 'pyinstaller']
+
+
+def _package_version(package):
+    try:
+        from importlib import metadata
+        return metadata.version(package)
+    except Exception:
+        return 'ausente'
+
+
+def _source_files(project_root):
+    """Arquivos .py do projeto (main.py e pastas de código), via os.scandir"""
+    files = [project_root / 'main.py']
+    stack = [str(project_root / folder) for folder in SOURCE_DIRS]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '__pycache__' and not entry.name.startswith('.'):
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        files.append(Path(entry.path))
+        except OSError:
+            pass
+    return sorted(files)
+
+
+def _run_check_in_worker(method_name):
+    """Executa uma validação em um processo separado e devolve o resultado e a saída"""
+    validator = BuildValidator()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            ok = bool(getattr(validator, method_name)())
+        except Exception as e:
+            validator.log_error(f"Erro durante validacao {method_name}: {e}")
+            ok = False
+    return {
+        'ok': ok,
+        'output': output.getvalue(),
+        'errors': validator.errors,
+        'warnings': validator.warnings,
+        'elapsed': time.perf_counter() - start,
+    }
+
+
 class BuildValidator:
+    REQUIRED_FILES = [
+        'main.py',
+        'requirements.txt',
+        'setup.py',
+        'version.txt',
+        'ui/strings.py',
+        'core/package_generator.py',
+        'core/github_manager.py',
+        'config/config_manager.py',
+        'utils/version_utils.py',
+        'utils/crypto_utils.py',
+        'utils/helpers.py',
+        'utils/resource_utils.py'
+    ]
+
     def __init__(self):
         self.errors = []
         self.warnings = []
@@ -76,6 +150,56 @@ class BuildValidator:
             clean_message = message.encode('ascii', 'ignore').decode('ascii')
             print(clean_message)
 
+    def check_inputs(self, method_name):
+        """Arquivos e valores dos quais o resultado de cada validação depende"""
+        root = self.project_root
+        python = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        packages = [f"{package}={_package_version(package)}" for package in REQUIRED_PACKAGES]
+        inputs = {
+            'validate_python_version': ([], [python]),
+            'validate_dependencies': ([], [python] + packages),
+            'validate_file_structure': ([], [str((root / path).exists()) for path in self.REQUIRED_FILES]),
+            'validate_version_consistency': ([root / 'version.txt', root / 'setup.py', root / 'package.json'], []),
+            'validate_imports': (_source_files(root), [python] + packages),
+            'validate_config_files': ([root / 'config.ini.example', root / 'requirements.txt'], []),
+            'validate_build_script': ([root / 'build.py'], []),
+        }
+        return inputs[method_name]
+
+    def check_key(self, method_name):
+        """Hash das entradas da validação, incluindo o próprio validador"""
+        files, values = self.check_inputs(method_name)
+        digest = hashlib.sha256(method_name.encode('utf-8'))
+        for path in [Path(__file__)] + list(files):
+            digest.update(b'\0' + os.path.relpath(path, self.project_root).replace(os.sep, '/').encode('utf-8'))
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except OSError:
+                digest.update(b'<ausente>')
+        for value in values:
+            digest.update(b'\0' + value.encode('utf-8'))
+        return digest.hexdigest()
+
+    def load_cache(self):
+        try:
+            with open(self.project_root / VALIDATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == VALIDATION_CACHE_VERSION:
+                return cache.get('checks', {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def save_cache(self, checks):
+        path = self.project_root / VALIDATION_CACHE_FILE
+        temp_path = str(path) + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': VALIDATION_CACHE_VERSION, 'checks': checks}, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.log_warning(f"Nao foi possivel salvar o cache de validacao: {e}")
+
     def validate_python_version(self):
         """Valida a versão do Python"""
         self.safe_print("Verificando versao do Python...")
@@ -89,15 +213,8 @@ class BuildValidator:
         """Valida todas as dependências necessárias"""
         self.safe_print("Verificando dependencias...")
 
-        required_packages = [
-            'customtkinter',
-            'requests', 
-            'cryptography',
-            'pyinstaller'
-        ]
-
         missing = []
-        for package in required_packages:
+        for package in REQUIRED_PACKAGES:
             try:
                 __import__(package)
                 self.log_success(f"Dependencia {package} encontrada")
@@ -115,23 +232,8 @@ class BuildValidator:
         """Valida a estrutura de arquivos do projeto"""
         self.safe_print("Verificando estrutura de arquivos...")
 
-        required_files = [
-            'main.py',
-            'requirements.txt',
-            'setup.py',
-            'version.txt',
-            'ui/strings.py',
-            'core/package_generator.py',
-            'core/github_manager.py',
-            'config/config_manager.py',
-            'utils/version_utils.py',
-            'utils/crypto_utils.py',
-            'utils/helpers.py',
-            'utils/resource_utils.py'
-        ]
-
         missing_files = []
-        for file_path in required_files:
+        for file_path in self.REQUIRED_FILES:
             full_path = self.project_root / file_path
             if not full_path.exists():
                 missing_files.append(file_path)
@@ -280,35 +382,70 @@ class BuildValidator:
 
         return True
 
-    def run_validation(self):
-        """Executa todas as validações"""
+    def run_validation(self, use_cache=True, workers=None):
+        """Executa todas as validações em paralelo, reaproveitando resultados em cache"""
         self.safe_print("Iniciando validacao do build...")
         self.safe_print("=" * 50)
 
         validations = [
-            ("Versao do Python", self.validate_python_version),
-            ("Dependencias", self.validate_dependencies),
-            ("Estrutura de arquivos", self.validate_file_structure),
-            ("Consistencia de versoes", self.validate_version_consistency),
-            ("Imports do projeto", self.validate_imports),
-            ("Arquivos de configuracao", self.validate_config_files),
-            ("Script de build", self.validate_build_script)
+            ("Versao do Python", "validate_python_version"),
+            ("Dependencias", "validate_dependencies"),
+            ("Estrutura de arquivos", "validate_file_structure"),
+            ("Consistencia de versoes", "validate_version_consistency"),
+            ("Imports do projeto", "validate_imports"),
+            ("Arquivos de configuracao", "validate_config_files"),
+            ("Script de build", "validate_build_script")
         ]
 
-        success_count = 0
-        for validation_name, validation_func in validations:
+        total_start = time.perf_counter()
+        cache = self.load_cache() if use_cache else {}
+        keys = {method: self.check_key(method) for _, method in validations}
+        results = {}
+        for _, method in validations:
+            cached = cache.get(method)
+            if cached and cached.get('key') == keys[method]:
+                results[method] = dict(cached['result'], cached=True)
+
+        pending = [method for _, method in validations if method not in results]
+        if pending:
+            # Cada validação roda em um processo próprio: imports pesados não se acumulam aqui
             try:
-                self.safe_print(f"\nValidando: {validation_name}")
-                if validation_func():
-                    success_count += 1
-                self.safe_print("-" * 30)
-            except Exception as e:
-                self.log_error(f"Erro durante validacao {validation_name}: {e}")
-                self.safe_print("-" * 30)
+                with ProcessPoolExecutor(max_workers=workers or min(len(pending), os.cpu_count() or 1)) as pool:
+                    for method, result in zip(pending, pool.map(_run_check_in_worker, pending)):
+                        results[method] = result
+            except (OSError, RuntimeError) as e:
+                self.log_warning(f"Pool de processos indisponivel ({e}), validando em sequencia")
+                for method in pending:
+                    if method not in results:
+                        results[method] = _run_check_in_worker(method)
+
+        success_count = 0
+        for validation_name, method in validations:
+            result = results[method]
+            origin = "cache" if result.get('cached') else f"{result['elapsed']:.2f}s"
+            self.safe_print(f"\nValidando: {validation_name} ({origin})")
+            if result['output']:
+                self.safe_print(result['output'].rstrip())
+            self.errors.extend(result['errors'])
+            self.warnings.extend(result['warnings'])
+            if result['ok']:
+                success_count += 1
+            self.safe_print("-" * 30)
+
+            # Só resultados sem erros vão para o cache; falhas são sempre revalidadas
+            if result['ok'] and not result['errors']:
+                stored = {name: value for name, value in result.items() if name != 'cached'}
+                cache[method] = {'key': keys[method], 'result': stored}
+            else:
+                cache.pop(method, None)
+        if use_cache:
+            self.save_cache(cache)
 
         self.safe_print("=" * 50)
         self.safe_print(f"Resultado da Validacao:")
         self.safe_print(f"Validacoes bem-sucedidas: {success_count}/{len(validations)}")
+        self.safe_print(f"Tempo total: {time.perf_counter() - total_start:.2f}s "
+                        f"({len(validations) - len(pending)} em cache)")
 
         if self.warnings:
             self.safe_print(f"Avisos: {len(self.warnings)}")
@@ -327,6 +464,11 @@ class BuildValidator:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validador de build do Unity Package Forge")
+    parser.add_argument("--no-cache", action="store_true", help="Ignora resultados de validacoes anteriores")
+    parser.add_argument("--workers", type=int, default=None, help="Numero de processos (padrao: um por validacao)")
+    args = parser.parse_args()
+
     validator = BuildValidator()
-    success = validator.run_validation()
+    success = validator.run_validation(use_cache=not args.no_cache, workers=args.workers)
     sys.exit(0 if success else 1)